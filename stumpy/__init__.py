@@ -1,8 +1,10 @@
 from pkg_resources import get_distribution, DistributionNotFound
 import os.path
-from .core import mass  # noqa: F401
+from .core import mass, mass_batch, MatrixProfile, Matches  # noqa: F401
 from .stump import stump  # noqa: F401
 from .stumped import stumped  # noqa: F401
+from .process_pool import ProcessPoolClient  # noqa: F401
+from .mmap_stump import mmap_stump  # noqa: F401
 from .mstump import mstump, subspace, mdl  # noqa: F401
 from .mstumped import mstumped  # noqa: F401
 from .aamp import aamp  # noqa: F401
@@ -19,8 +21,8 @@ from .scraamp import scraamp, prescraamp  # noqa: F401
 from .stumpi import stumpi  # noqa: F401
 from .mpdist import mpdist, mpdisted  # noqa: F401
 from .aampdist import aampdist, aampdisted  # noqa: F401
-from .motifs import motifs, match  # noqa: F401
-from .aamp_motifs import aamp_motifs, aamp_match  # noqa: F401
+from .motifs import motifs, match, match_many  # noqa: F401
+from .aamp_motifs import aamp_motifs, aamp_match, aamp_match_many  # noqa: F401
 from .snippets import snippets  # noqa: F401
 from .aampdist_snippets import aampdist_snippets  # noqa: F401
 from .stimp import stimp, stimped  # noqa: F401
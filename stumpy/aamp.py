@@ -98,15 +98,22 @@ def _compute_diagonal(
             iter_range = range(-k, min(n_A - m + 1, n_B - m + 1 - k))
 
         for i in iter_range:
-            if i == 0 or (k < 0 and i == -k):
-                p_norm = (
-                    np.linalg.norm(T_B[i + k : i + k + m] - T_A[i : i + m], ord=p) ** p
+            # In single precision, the p-norm is periodically re-anchored in order to
+            # keep the rounding errors from accumulating
+            if (
+                i == 0
+                or (k < 0 and i == -k)
+                or (
+                    T_A.itemsize == 4
+                    and (i - max(0, -k)) % config.STUMPY_DIAGONAL_TILE_HEIGHT == 0
                 )
+            ):
+                p_norm = core._p_norm(T_B[i + k : i + k + m] - T_A[i : i + m], p)
             else:
                 p_norm = np.abs(
                     p_norm
-                    - np.absolute(T_B[i + k - 1] - T_A[i - 1]) ** p
-                    + np.absolute(T_B[i + k + m - 1] - T_A[i + m - 1]) ** p
+                    - core._abs_pow(T_B[i + k - 1] - T_A[i - 1], p)
+                    + core._abs_pow(T_B[i + k + m - 1] - T_A[i + m - 1], p)
                 )
 
             if p_norm < config.STUMPY_P_NORM_THRESHOLD:
@@ -137,10 +144,142 @@ def _compute_diagonal(
     return
 
 
+@njit(
+    # "(f8[:], f8[:], i8, b1[:], b1[:], i8[:], i8, i8, i8, f8[:, :, :],"
+    # "i8[:, :, :], b1)",
+    fastmath={"nsz", "arcp", "contract", "afn", "reassoc"},
+)
+def _compute_chebyshev_diagonal(
+    T_A,
+    T_B,
+    m,
+    T_A_subseq_isfinite,
+    T_B_subseq_isfinite,
+    diags,
+    diags_start_idx,
+    diags_stop_idx,
+    thread_idx,
+    P,
+    I,
+    ignore_trivial,
+):
+    """
+    Compute (Numba JIT-compiled) and update P, I along a single diagonal using the
+    Chebyshev distance (i.e., `p=np.inf`) and a single thread while avoiding race
+    conditions
+
+    Unlike the other p-norms, the Chebyshev distance cannot be updated by adding and
+    removing a single term. Instead, the maximum absolute difference within each
+    window is tracked with a monotonic queue so that every diagonal is still
+    processed in linear time.
+
+    Parameters
+    ----------
+    T_A : numpy.ndarray
+        The time series or sequence for which to compute the matrix profile
+
+    T_B : numpy.ndarray
+        The time series or sequence that will be used to annotate T_A. For every
+        subsequence in T_A, its nearest neighbor in T_B will be recorded.
+
+    m : int
+        Window size
+
+    T_A_subseq_isfinite : numpy.ndarray
+        A boolean array that indicates whether a subsequence in `T_A` contains a
+        `np.nan`/`np.inf` value (False)
+
+    T_B_subseq_isfinite : numpy.ndarray
+        A boolean array that indicates whether a subsequence in `T_B` contains a
+        `np.nan`/`np.inf` value (False)
+
+    diags : numpy.ndarray
+        The diag of diagonals to process and compute
+
+    diags_start_idx : int
+        The start index for a range of diagonal diag to process and compute
+
+    diags_stop_idx : int
+        The (exclusive) stop index for a range of diagonal diag to process and compute
+
+    thread_idx : int
+        The thread index
+
+    P : numpy.ndarray
+        Matrix profile
+
+    I : numpy.ndarray
+        Matrix profile indices
+
+    ignore_trivial : bool
+        Set to `True` if this is a self-join. Otherwise, for AB-join, set this to
+        `False`. Default is `True`.
+
+    Returns
+    -------
+    None
+    """
+    n_A = T_A.shape[0]
+    n_B = T_B.shape[0]
+    # The absolute differences along the current diagonal and a monotonic queue of
+    # indices into it, where the differences are non-increasing from head to tail
+    abs_diff = np.empty(n_A, dtype=T_A.dtype)
+    queue = np.empty(n_A, dtype=np.int64)
+
+    for diag_idx in range(diags_start_idx, diags_stop_idx):
+        k = diags[diag_idx]
+
+        if k >= 0:
+            iter_start = 0
+        else:
+            iter_start = -k
+        iter_stop = min(n_A - m + 1, n_B - m + 1 - k)
+
+        head = 0
+        tail = 0
+        for j in range(iter_start, iter_stop + m - 1):
+            abs_diff[j] = abs(T_B[j + k] - T_A[j])
+            while tail > head and abs_diff[queue[tail - 1]] <= abs_diff[j]:
+                tail -= 1
+            queue[tail] = j
+            tail += 1
+
+            i = j - m + 1
+            if i < iter_start:
+                continue
+            if queue[head] < i:
+                head += 1
+
+            if T_A_subseq_isfinite[i] and T_B_subseq_isfinite[i + k]:
+                # Neither subsequence contains NaNs
+                chebyshev = abs_diff[queue[head]]
+                if chebyshev < P[thread_idx, i, 0]:
+                    P[thread_idx, i, 0] = chebyshev
+                    I[thread_idx, i, 0] = i + k
+
+                if ignore_trivial:
+                    if chebyshev < P[thread_idx, i + k, 0]:
+                        P[thread_idx, i + k, 0] = chebyshev
+                        I[thread_idx, i + k, 0] = i
+
+                    if i < i + k:
+                        # left matrix profile and left matrix profile index
+                        if chebyshev < P[thread_idx, i + k, 1]:
+                            P[thread_idx, i + k, 1] = chebyshev
+                            I[thread_idx, i + k, 1] = i
+
+                        # right matrix profile and right matrix profile index
+                        if chebyshev < P[thread_idx, i, 2]:
+                            P[thread_idx, i, 2] = chebyshev
+                            I[thread_idx, i, 2] = i + k
+
+    return
+
+
 @njit(
     # "(f8[:], f8[:], i8, b1[:], b1[:], i8[:], b1)",
     parallel=True,
-    fastmath=True,
+    fastmath={"nsz", "arcp", "contract", "afn", "reassoc"},
 )
 def _aamp(
     T_A, T_B, m, T_A_subseq_isfinite, T_B_subseq_isfinite, p, diags, ignore_trivial
@@ -170,7 +309,8 @@ def _aamp(
         `np.nan`/`np.inf` value (False)
 
     p : float
-        The p-norm to apply for computing the Minkowski distance.
+        The p-norm to apply for computing the Minkowski distance. The Chebyshev
+        distance is computed when `p=np.inf`.
 
     diags : numpy.ndarray
         The diag of diagonals to process and compute
@@ -198,7 +338,7 @@ def _aamp(
     n_B = T_B.shape[0]
     l = n_A - m + 1
     n_threads = numba.config.NUMBA_NUM_THREADS
-    P = np.full((n_threads, l, 3), np.inf, dtype=np.float64)
+    P = np.full((n_threads, l, 3), np.inf, dtype=T_A.dtype)
     I = np.full((n_threads, l, 3), -1, dtype=np.int64)
 
     ndist_counts = core._count_diagonal_ndist(diags, m, n_A, n_B)
@@ -206,21 +346,37 @@ def _aamp(
 
     for thread_idx in prange(n_threads):
         # Compute and update P, I within a single thread while avoiding race conditions
-        _compute_diagonal(
-            T_A,
-            T_B,
-            m,
-            T_A_subseq_isfinite,
-            T_B_subseq_isfinite,
-            p,
-            diags,
-            diags_ranges[thread_idx, 0],
-            diags_ranges[thread_idx, 1],
-            thread_idx,
-            P,
-            I,
-            ignore_trivial,
-        )
+        if np.isinf(p):
+            _compute_chebyshev_diagonal(
+                T_A,
+                T_B,
+                m,
+                T_A_subseq_isfinite,
+                T_B_subseq_isfinite,
+                diags,
+                diags_ranges[thread_idx, 0],
+                diags_ranges[thread_idx, 1],
+                thread_idx,
+                P,
+                I,
+                ignore_trivial,
+            )
+        else:
+            _compute_diagonal(
+                T_A,
+                T_B,
+                m,
+                T_A_subseq_isfinite,
+                T_B_subseq_isfinite,
+                p,
+                diags,
+                diags_ranges[thread_idx, 0],
+                diags_ranges[thread_idx, 1],
+                thread_idx,
+                P,
+                I,
+                ignore_trivial,
+            )
 
     # Reduction of results from all threads
     for thread_idx in range(1, n_threads):
@@ -237,10 +393,14 @@ def _aamp(
                 P[0, i, 2] = P[thread_idx, i, 2]
                 I[0, i, 2] = I[thread_idx, i, 2]
 
-    return np.power(P[0, :, :], 1.0 / p), I[0, :, :]
+    if not np.isinf(p):
+        # The matrix profile keeps the floating point precision of `T_A`
+        P[0, :, :] = np.power(P[0, :, :], 1.0 / p)
+
+    return P[0, :, :], I[0, :, :]
 
 
-def aamp(T_A, m, T_B=None, ignore_trivial=True, p=2.0):
+def aamp(T_A, m, T_B=None, ignore_trivial=True, p=2.0, dtype=np.float64, typed=None):
     """
     Compute the non-normalized (i.e., without z-normalization) matrix profile
 
@@ -265,13 +425,35 @@ def aamp(T_A, m, T_B=None, ignore_trivial=True, p=2.0):
         to `False`. Default is `True`.
 
     p : float, default 2.0
-        The p-norm to apply for computing the Minkowski distance.
+        The p-norm to apply for computing the Minkowski distance. Set `p=np.inf` to
+        compute the Chebyshev distance.
+
+    dtype : dtype, default np.float64
+        The floating point precision that is used to compute the matrix profile.
+        Setting this to `np.float32` roughly halves the memory usage (and the
+        memory traffic) at the cost of accuracy. The p-norm along each diagonal is
+        periodically recomputed from scratch so that the rounding errors do not
+        accumulate. However, the matrix profile will still deviate slightly from the
+        double precision result and near-ties may resolve to different indices.
+
+    typed : bool, default None
+        When set to `True`, a `MatrixProfile` named tuple is returned where the
+        (global) matrix profile, `P`, the left matrix profile, `left_P`, and the right
+        matrix profile, `right_P`, are stored in floating point arrays alongside their
+        corresponding integer matrix profile indices (i.e., `I`, `left_I`, and
+        `right_I`). When set to `False`, the left and right matrix profiles are
+        discarded and a `numpy.ndarray` with `dtype=object` is returned. The default
+        value of `None` defers to `config.STUMPY_TYPED_OUTPUT`.
 
     Returns
     -------
-    out : numpy.ndarray
+    out : numpy.ndarray or MatrixProfile
         The first column consists of the matrix profile, the second column
-        consists of the matrix profile indices.
+        consists of the matrix profile indices, the third column consists of
+        the left matrix profile indices, and the fourth column consists of
+        the right matrix profile indices. When `typed=True`, a `MatrixProfile` named
+        tuple with fields `P`, `I`, `left_P`, `left_I`, `right_P`, and `right_I` is
+        returned instead.
 
     Notes
     -----
@@ -289,6 +471,11 @@ def aamp(T_A, m, T_B=None, ignore_trivial=True, p=2.0):
     T_A, T_A_subseq_isfinite = core.preprocess_non_normalized(T_A, m)
     T_B, T_B_subseq_isfinite = core.preprocess_non_normalized(T_B, m)
 
+    dtype = core.check_precision(dtype)
+    if dtype != np.float64:
+        T_A = T_A.astype(dtype)
+        T_B = T_B.astype(dtype)
+
     if T_A.ndim != 1:  # pragma: no cover
         raise ValueError(f"T_A is {T_A.ndim}-dimensional and must be 1-dimensional. ")
 
@@ -321,6 +508,11 @@ def aamp(T_A, m, T_B=None, ignore_trivial=True, p=2.0):
         T_A, T_B, m, T_A_subseq_isfinite, T_B_subseq_isfinite, p, diags, ignore_trivial
     )
 
+    if typed is None:
+        typed = config.STUMPY_TYPED_OUTPUT
+    if typed:
+        return core._matrix_profile(P, I)
+
     out[:, 0] = P[:, 0]
     out[:, 1:] = I[:, :]
 
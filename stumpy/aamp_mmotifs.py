@@ -173,16 +173,17 @@ def aamp_mmotifs(
             max_distance=max_distance,
             atol=atol,
             query_idx=motif_idx,
+            typed=True,
             p=p,
         )
 
-        if len(query_matches) > min_neighbors:
-            motif_distances.append(query_matches[:, 0])
-            motif_indices.append(query_matches[:, 1])
+        if len(query_matches.I) > min_neighbors:
+            motif_distances.append(query_matches.D)
+            motif_indices.append(query_matches.I)
             motif_subspaces.append(subspace_k)
             motif_mdls.append(mdls)
 
-        for idx in query_matches[:, 1]:
+        for idx in query_matches.I:
             core.apply_exclusion_zone(P, idx, excl_zone, np.inf)
         candidate_idx = np.argmin(P, axis=1)
         nn_idx = I[np.arange(len(candidate_idx)), candidate_idx]
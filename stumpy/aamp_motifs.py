@@ -92,54 +92,27 @@ def _aamp_motifs(
     n = T.shape[1]
     l = P.shape[1]
     m = n - l + 1
+    max_memory = config.STUMPY_MASS_BATCH_MAX_MEMORY
 
-    motif_indices = []
-    motif_distances = []
-
-    candidate_idx = np.argmin(P[-1])
-    while len(motif_indices) < max_motifs:
-        profile_value = P[-1, candidate_idx]
-        if profile_value > cutoff or not np.isfinite(profile_value):  # pragma: no cover
-            break
-
-        # If max_distance is a constant (independent of the distance profile D of Q
-        # and T), then we can stop the iteration if the matrix profile value of Q is
-        # larger than the maximum distance.
-        if (
-            isinstance(max_distance, float) and profile_value > max_distance
-        ):  # pragma: no cover
-            break
-
-        Q = T[:, candidate_idx : candidate_idx + m]
-
-        query_matches = aamp_match(
-            Q,
-            T,
-            max_matches=None,
-            max_distance=max_distance,
-            atol=atol,
-            query_idx=candidate_idx,
-            p=p,
+    def compute_distance_profiles(candidates):
+        Qs = core.rolling_window(T[-1], m)[candidates]
+        return core._mass_absolute_batch(
+            Qs, T[-1], T_subseq_isfinite[-1], p, max_memory
         )
 
-        if len(query_matches) > min_neighbors:
-            motif_distances.append(query_matches[:max_matches, 0])
-            motif_indices.append(query_matches[:max_matches, 1])
-
-        for idx in query_matches[:, 1]:
-            core.apply_exclusion_zone(P, int(idx), excl_zone, np.inf)
-
-        candidate_idx = np.argmin(P[-1])
-
-    motif_distances = core._jagged_list_to_array(
-        motif_distances, fill_value=np.nan, dtype=np.float64
-    )
-    motif_indices = core._jagged_list_to_array(
-        motif_indices, fill_value=-1, dtype=np.int64
+    return core._find_motifs(
+        P[-1],
+        excl_zone,
+        min_neighbors,
+        max_distance,
+        cutoff,
+        max_matches,
+        max_motifs,
+        atol,
+        compute_distance_profiles,
+        max_memory,
     )
 
-    return motif_distances, motif_indices
-
 
 def aamp_motifs(
     T,
@@ -298,6 +271,7 @@ def aamp_match(
     atol=1e-8,
     query_idx=None,
     p=2.0,
+    typed=None,
 ):
     """
     Find all matches of a query `Q` in a time series `T`, i.e. the indices
@@ -347,12 +321,21 @@ def aamp_match(
     p : float, default 2.0
         The p-norm to apply for computing the Minkowski distance.
 
+    typed : bool, default None
+        When set to `True`, a `Matches` named tuple is returned where the distances,
+        `D`, are stored in a floating point array and the indices, `I`, are stored in
+        an integer array. When set to `False`, a `numpy.ndarray` with `dtype=object`
+        is returned. The default value of `None` defers to
+        `config.STUMPY_TYPED_OUTPUT`.
+
     Returns
     -------
-    out : numpy.ndarray
+    out : numpy.ndarray or Matches
         The first column consists of distances of subsequences of `T` whose distances
-        to `Q` are less than or equal to`max_distance`, sorted by distance (lowest to
-        highest). The second column consists of the corresponding indices in `T`.
+        to `Q` are less than or equal to `max_distance`, sorted by distance (lowest to
+        highest). The second column consists of the corresponding indices in `T`. When
+        `typed=True`, a `Matches` named tuple with fields `D` and `I` is returned
+        instead.
     """
     if len(Q.shape) == 1:
         Q = Q[np.newaxis, :]
@@ -370,13 +353,7 @@ def aamp_match(
         raise ValueError("Q contains illegal values (NaN or inf)")
 
     if max_distance is None:  # pragma: no cover
-
-        def max_distance(D):
-            D_copy = D.copy().astype(np.float64)
-            D_copy[np.isinf(D_copy)] = np.nan
-            return np.nanmax(
-                [np.nanmean(D_copy) - 2.0 * np.nanstd(D_copy), np.nanmin(D_copy)]
-            )
+        max_distance = core._compute_max_distance
 
     if T_subseq_isfinite is None:
         T, T_subseq_isfinite = core.preprocess_non_normalized(T, m)
@@ -389,20 +366,124 @@ def aamp_match(
     if not isinstance(max_distance, float):
         max_distance = max_distance(D)
 
-    matches = []
+    matches = core._find_matches(
+        D, excl_zone, atol + max_distance, max_matches, query_idx
+    )
+
+    if typed is None:
+        typed = config.STUMPY_TYPED_OUTPUT
+    if typed:
+        return core._matches(matches)
+
+    return np.array(matches, dtype=object)
+
+
+def aamp_match_many(
+    Qs,
+    T,
+    T_subseq_isfinite=None,
+    max_distance=None,
+    max_matches=None,
+    atol=1e-8,
+    p=2.0,
+    max_memory=None,
+    typed=None,
+    lazy=False,
+):
+    """
+    Find all matches of each query in `Qs` in a time series `T`
+
+    This is equivalent to calling `aamp_match` for each query but the subsequences of
+    `T` are only pre-processed once and the non-normalized distance profiles are
+    computed in memory-bounded batches of queries.
+
+    Parameters
+    ----------
+    Qs : numpy.ndarray
+        A 2-dimensional array where each row is a query sequence. All of the queries
+        must have the same length and they don't have to be subsequences of `T`
+
+    T : numpy.ndarray
+        The (1-dimensional) time series of interest
+
+    T_subseq_isfinite : numpy.ndarray, default None
+        A boolean array that indicates whether a subsequence in `T` contains a
+        `np.nan`/`np.inf` value (False)
+
+    max_distance : float or function, default None
+        Maximum distance between a query `Q` and a subsequence `S` for `S` to be
+        considered a match. If a function, then it has to be a function of one
+        argument `D`, which will be the distance profile of `Q` with `T` (a 1D numpy
+        array of size `n-m+1`). If None, defaults to
+        `np.nanmax([np.nanmean(D) - 2 * np.nanstd(D), np.nanmin(D)])` (i.e. at
+        least the closest match will be returned).
+
+    max_matches : int, default None
+        The maximum amount of similar occurrences to be returned for each query. If
+        `None`, then all occurrences are returned.
+
+    atol : float, default 1e-8
+        The absolute tolerance parameter. This value will be added to `max_distance`
+        when comparing distances between subsequences.
+
+    p : float, default 2.0
+        The p-norm to apply for computing the Minkowski distance.
+
+    max_memory : int, default None
+        The maximum number of (temporary) bytes that are used for each batch of
+        queries. When `max_memory=None`, this defaults to
+        `config.STUMPY_MASS_BATCH_MAX_MEMORY`.
+
+    typed : bool, default None
+        When set to `True`, a `Matches` named tuple is returned for each query.
+        When set to `False`, a `numpy.ndarray` with `dtype=object` is returned for
+        each query. The default value of `None` defers to
+        `config.STUMPY_TYPED_OUTPUT`.
+
+    lazy : bool, default False
+        When set to `True`, a generator that yields the matches of one query at a time
+        is returned instead of a list. Since only one batch of distance profiles is
+        ever held in memory, the total memory usage is then bounded by `max_memory`
+        (plus the matches that are kept by the caller) regardless of the number of
+        queries.
 
-    if query_idx is not None:
-        candidate_idx = query_idx
+    Returns
+    -------
+    out : list or generator
+        The matches of each query in `Qs` in the same format as `aamp_match` or, when
+        `lazy=True`, a generator that yields them one query at a time
+    """
+    Qs, T = core._preprocess_batch(Qs, T)
+    m = Qs.shape[1]
+
+    excl_zone = int(np.ceil(m / config.STUMPY_EXCL_ZONE_DENOM))
+
+    if np.any(np.isnan(Qs)) or np.any(np.isinf(Qs)):  # pragma: no cover
+        raise ValueError("Qs contains illegal values (NaN or inf)")
+
+    if max_distance is None:  # pragma: no cover
+        max_distance = core._compute_max_distance
+
+    if T_subseq_isfinite is None:
+        T, T_subseq_isfinite = core.preprocess_non_normalized(T, m)
     else:
-        candidate_idx = np.argmin(D)
+        T[~np.isfinite(T)] = 0.0
 
-    while (
-        D[candidate_idx] <= atol + max_distance
-        and np.isfinite(D[candidate_idx])
-        and len(matches) < max_matches
-    ):
-        matches.append([D[candidate_idx], candidate_idx])
-        core.apply_exclusion_zone(D, candidate_idx, excl_zone, np.inf)
-        candidate_idx = np.argmin(D)
+    if max_memory is None:
+        max_memory = config.STUMPY_MASS_BATCH_MAX_MEMORY
 
-    return np.array(matches, dtype=object)
+    if typed is None:
+        typed = config.STUMPY_TYPED_OUTPUT
+
+    out = core._find_matches_batch(
+        core._mass_absolute_batch(Qs, T, T_subseq_isfinite, p, max_memory),
+        excl_zone,
+        max_distance,
+        atol,
+        max_matches,
+        typed,
+    )
+    if lazy:
+        return out
+
+    return list(out)
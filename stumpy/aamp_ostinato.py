@@ -160,6 +160,8 @@ def _aamp_ostinato(
         Dask workers. Setting up a Dask distributed cluster is beyond the
         scope of this library. Please refer to the Dask Distributed
         documentation.
+        Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+        the work across local processes without a Dask scheduler.
 
     device_id : int or list, default None
         The (GPU) device number to use. The default value is `0`. A list of
@@ -217,11 +219,11 @@ def _aamp_ostinato(
         else:
             h = 0
 
-        mp = partial_mp_func(Ts[j], m, Ts[h], ignore_trivial=False, p=p)
-        si = np.argsort(mp[:, 0])
+        mp = partial_mp_func(Ts[j], m, Ts[h], ignore_trivial=False, p=p, typed=True)
+        si = np.argsort(mp.P)
         for q in si:
             Q = Ts[j][q : q + m]
-            radius = mp[q, 0]
+            radius = mp.P[q]
             if radius >= bsf_radius:
                 break
             for i in range(k):
@@ -324,6 +326,8 @@ def aamp_ostinatoed(dask_client, Ts, m, p=2.0):
         Dask workers. Setting up a Dask distributed cluster is beyond the
         scope of this library. Please refer to the Dask Distributed
         documentation.
+        Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+        the work across local processes without a Dask scheduler.
 
     Ts : list
         A list of time series for which to find the most central consensus motif
@@ -83,6 +83,8 @@ class _aamp_stimp:
         Dask workers. Setting up a Dask distributed cluster is beyond the
         scope of this library. Please refer to the Dask Distributed
         documentation.
+        Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+        the work across local processes without a Dask scheduler.
 
     device_id : int or list, default None
         The (GPU) device number to use. The default value is `0`. A list of
@@ -169,6 +171,8 @@ class _aamp_stimp:
             Dask workers. Setting up a Dask distributed cluster is beyond the
             scope of this library. Please refer to the Dask Distributed
             documentation.
+            Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+            the work across local processes without a Dask scheduler.
 
         device_id : int or list, default None
             The (GPU) device number to use. The default value is `0`. A list of
@@ -200,6 +204,9 @@ class _aamp_stimp:
         self._M = M[self._bfs_indices]
         self._n_processed = 0
         percentage = np.clip(percentage, 0.0, 1.0)
+        if percentage < 1.0:
+            # `scraamp` is used instead of `mp_func`
+            core.check_finite_p(p)
         self._percentage = percentage
         self._pre_scraamp = pre_scraamp
         partial_mp_func = core._get_partial_mp_func(
@@ -239,10 +246,12 @@ class _aamp_stimp:
                     self._bfs_indices[self._n_processed], : approx.P_.shape[0]
                 ] = approx.P_
             else:
-                out = self._mp_func(self._T, m, ignore_trivial=True, p=self._p)
+                out = self._mp_func(
+                    self._T, m, ignore_trivial=True, p=self._p, typed=True
+                )
                 self._PAN[
-                    self._bfs_indices[self._n_processed], : out[:, 0].shape[0]
-                ] = out[:, 0]
+                    self._bfs_indices[self._n_processed], : out.P.shape[0]
+                ] = out.P
             self._n_processed += 1
 
     def pan(self, threshold=0.2, normalize=True, contrast=True, binary=True, clip=True):
@@ -378,7 +387,8 @@ class aamp_stimp(_aamp_stimp):
         SCRIMP++. This parameter is ignored when `percentage = 1.0`.
 
     p : float, default 2.0
-        The p-norm to apply for computing the Minkowski distance.
+        The p-norm to apply for computing the Minkowski distance, which must be
+        finite when `percentage < 1.0`.
 
     Attributes
     ----------
@@ -446,7 +456,8 @@ class aamp_stimp(_aamp_stimp):
             SCRIMP++. This parameter is ignored when `percentage = 1.0`.
 
         p : float, default 2.0
-            The p-norm to apply for computing the Minkowski distance.
+            The p-norm to apply for computing the Minkowski distance, which must be
+            finite when `percentage < 1.0`.
         """
         super().__init__(
             T,
@@ -456,7 +467,7 @@ class aamp_stimp(_aamp_stimp):
             percentage=percentage,
             pre_scraamp=pre_scraamp,
             mp_func=aamp,
-            p=2.0,
+            p=p,
         )
 
 
@@ -473,6 +484,8 @@ class aamp_stimped(_aamp_stimp):
             Dask workers. Setting up a Dask distributed cluster is beyond the
             scope of this library. Please refer to the Dask Distributed
             documentation.
+            Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+            the work across local processes without a Dask scheduler.
 
     T : numpy.ndarray
         The time series or sequence for which to compute the pan matrix profile
@@ -535,6 +548,8 @@ class aamp_stimped(_aamp_stimp):
             Dask workers. Setting up a Dask distributed cluster is beyond the
             scope of this library. Please refer to the Dask Distributed
             documentation.
+            Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+            the work across local processes without a Dask scheduler.
 
         T : numpy.ndarray
             The time series or sequence for which to compute the pan matrix profile
@@ -560,5 +575,5 @@ class aamp_stimped(_aamp_stimp):
             pre_scraamp=False,
             dask_client=dask_client,
             mp_func=aamped,
-            p=2.0,
+            p=p,
         )
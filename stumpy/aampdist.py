@@ -136,6 +136,8 @@ def aampdisted(dask_client, T_A, T_B, m, percentage=0.05, k=None, p=2.0):
         Dask workers. Setting up a Dask distributed cluster is beyond the
         scope of this library. Please refer to the Dask Distributed
         documentation.
+        Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+        the work across local processes without a Dask scheduler.
 
     T_A : numpy.ndarray
         The first time series or sequence for which to compute the matrix profile
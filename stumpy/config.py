@@ -7,6 +7,10 @@ import numpy as np
 STUMPY_THREADS_PER_BLOCK = 512
 STUMPY_MEAN_STD_NUM_CHUNKS = 1
 STUMPY_MEAN_STD_MAX_ITER = 10
+STUMPY_MEAN_STD_CACHE_MAX_BYTES = 2**27  # bytes
+STUMPY_FFT_CACHE_MAX_BYTES = 2**27  # bytes
+STUMPY_IAC_CACHE_MAX_BYTES = 2**25  # bytes
+STUMPY_IAC_CACHE_DIR = None
 STUMPY_DENOM_THRESHOLD = 1e-14
 STUMPY_STDDEV_THRESHOLD = 1e-7
 STUMPY_P_NORM_THRESHOLD = 1e-14
@@ -14,3 +18,14 @@ STUMPY_TEST_PRECISION = 5
 STUMPY_MAX_P_NORM_DISTANCE = np.finfo(np.float64).max
 STUMPY_MAX_DISTANCE = np.sqrt(STUMPY_MAX_P_NORM_DISTANCE)
 STUMPY_EXCL_ZONE_DENOM = 4
+STUMPY_MMAP_MAX_MEMORY = 2**30  # bytes
+STUMPY_MASS_BATCH_MAX_MEMORY = 2**28  # bytes
+STUMPY_SLIDING_DOT_PRODUCT_BLOCK_SIZE = 4096
+STUMPY_SLIDING_DOT_PRODUCT_MAX_MEMORY = 2**24  # bytes
+STUMPY_DIAGONAL_TILE_HEIGHT = 1024
+STUMPY_DIAGONAL_TILE_WIDTH = 256
+STUMPY_TYPED_OUTPUT = False
+STUMPY_DASK_TASKS_PER_WORKER = 8
+STUMPY_DASK_SHARED_MEMORY = False
+STUMPY_STIMP_BAND_SIZE = 32
+STUMPY_STIMP_BAND_MAX_MEMORY = 2**28  # bytes
@@ -2,13 +2,24 @@
 # Copyright 2019 TD Ameritrade. Released under the terms of the 3-Clause BSD license.  # noqa: E501
 # STUMPY is a trademark of TD Ameritrade IP Company, Inc. All rights reserved.
 
+import contextlib
+import contextvars
 import logging
 import functools
+import hashlib
 import inspect
-
+from collections import OrderedDict
+from multiprocessing import shared_memory
+import threading
+from typing import NamedTuple
+import uuid
+import weakref
+
+import numba
 import numpy as np
-from numba import njit
-from scipy.signal import convolve
+from numba import njit, prange
+import scipy.fft
+from scipy.signal import convolve, choose_conv_method
 from scipy.ndimage import maximum_filter1d, minimum_filter1d
 from scipy import linalg
 from scipy.spatial.distance import cdist
@@ -314,6 +325,557 @@ def check_dtype(a, dtype=np.float64):  # pragma: no cover
     return True
 
 
+def check_precision(dtype):
+    """
+    Check if `dtype` is one of the floating point precisions that is supported by the
+    matrix profile computation (i.e., `np.float64` or `np.float32`)
+
+    Parameters
+    ----------
+    dtype : dtype
+        NumPy `dtype`
+
+    Returns
+    -------
+    dtype : numpy.dtype
+        The validated NumPy `dtype`
+
+    Raises
+    ------
+    ValueError
+        If `dtype` is neither `np.float64` nor `np.float32`
+    """
+    if dtype == float:
+        dtype = np.float64
+    dtype = np.dtype(dtype)
+    if dtype != np.float64 and dtype != np.float32:
+        msg = f"Only `np.float64` and `np.float32` are supported but found {dtype}"
+        raise ValueError(msg)
+
+    return dtype
+
+
+def check_finite_p(p):
+    """
+    Check if the p-norm, `p`, is finite
+
+    Only `stumpy.aamp` and `stumpy.aamped` (and the functions that are built on top of
+    them) support the Chebyshev distance (i.e., `p=np.inf`) since it cannot be
+    updated incrementally by adding and subtracting the contributions of single
+    elements like the other p-norms.
+
+    Parameters
+    ----------
+    p : float
+        The p-norm to apply for computing the Minkowski distance
+
+    Raises
+    ------
+    ValueError
+        If `p` is not finite
+    """
+    if not np.isfinite(p):
+        msg = f"Only a finite p-norm is supported but found `p={p}`. The Chebyshev "
+        msg += "distance (i.e., `p=np.inf`) is supported by `stumpy.aamp` and "
+        msg += "`stumpy.aamped`"
+        raise ValueError(msg)
+
+
+class MatrixProfile(NamedTuple):
+    """
+    A typed matrix profile
+
+    Unlike the default `numpy.ndarray` output (with `dtype=object`), each matrix
+    profile is stored in its own floating point array and each set of matrix profile
+    indices is stored in its own integer array
+
+    Attributes
+    ----------
+    P : numpy.ndarray
+        The (global) matrix profile
+
+    I : numpy.ndarray
+        The (global) matrix profile indices
+
+    left_P : numpy.ndarray
+        The left matrix profile
+
+    left_I : numpy.ndarray
+        The left matrix profile indices
+
+    right_P : numpy.ndarray
+        The right matrix profile
+
+    right_I : numpy.ndarray
+        The right matrix profile indices
+    """
+
+    P: np.ndarray
+    I: np.ndarray
+    left_P: np.ndarray
+    left_I: np.ndarray
+    right_P: np.ndarray
+    right_I: np.ndarray
+
+
+def _matrix_profile(P, I):
+    """
+    Convert the (global, left, right) matrix profiles and matrix profile indices into a
+    typed `MatrixProfile`
+
+    Parameters
+    ----------
+    P : numpy.ndarray
+        A 2-D array where the columns consist of the (global) matrix profile, the left
+        matrix profile, and the right matrix profile
+
+    I : numpy.ndarray
+        A 2-D array where the columns consist of the (global) matrix profile indices,
+        the left matrix profile indices, and the right matrix profile indices
+
+    Returns
+    -------
+    out : MatrixProfile
+        The typed matrix profile where each field is a contiguous array
+    """
+    P = np.ascontiguousarray(P.T)
+    I = np.ascontiguousarray(I.T).astype(np.int64, copy=False)
+
+    return MatrixProfile(P[0], I[0], P[1], I[1], P[2], I[2])
+
+
+class Matches(NamedTuple):
+    """
+    Typed query matches
+
+    Unlike the default `numpy.ndarray` output (with `dtype=object`), the distances are
+    stored in a floating point array and the indices are stored in an integer array
+
+    Attributes
+    ----------
+    D : numpy.ndarray
+        The distances of the matches, sorted from lowest to highest
+
+    I : numpy.ndarray
+        The indices of the matches
+    """
+
+    D: np.ndarray
+    I: np.ndarray
+
+
+def _matches(matches):
+    """
+    Convert a list of `(distance, index)` pairs into typed `Matches`
+
+    Parameters
+    ----------
+    matches : list
+        A list of `(distance, index)` pairs
+
+    Returns
+    -------
+    out : Matches
+        The typed matches where each field is a contiguous array
+    """
+    matches = np.asarray(matches, dtype=np.float64).reshape(-1, 2)
+
+    return Matches(matches[:, 0].copy(), matches[:, 1].astype(np.int64))
+
+
+@njit(
+    # "i8[:](i8, i8[:], i8, i8)",
+    fastmath=True
+)
+def _select_matches(l, candidates, excl_zone, max_matches):
+    """
+    Greedily select (up to `max_matches`) indices from `candidates`, in order, that
+    are not within the exclusion zone of any previously selected index
+
+    Since any two selected indices are more than `excl_zone` apart, at most one of
+    them falls into each bucket of `excl_zone + 1` consecutive indices and so only
+    the neighboring buckets need to be checked for overlapping exclusion zones.
+
+    Parameters
+    ----------
+    l : int
+        The total number of subsequences
+
+    candidates : numpy.ndarray
+        The candidate indices in the order in which they are considered
+
+    excl_zone : int
+        The size of the exclusion zone around each selected index
+
+    max_matches : int
+        The maximum number of indices to select
+
+    Returns
+    -------
+    out : numpy.ndarray
+        The selected indices
+    """
+    bucket_width = excl_zone + 1
+    buckets = np.full(l // bucket_width + 1, -1, dtype=np.int64)
+    out = np.empty(min(candidates.shape[0], max_matches), dtype=np.int64)
+
+    n_matches = 0
+    for idx in candidates:
+        if n_matches == out.shape[0]:
+            break
+
+        bucket = idx // bucket_width
+        is_excluded = False
+        for i in range(max(0, bucket - 1), min(buckets.shape[0], bucket + 2)):
+            if buckets[i] >= 0 and abs(idx - buckets[i]) <= excl_zone:
+                is_excluded = True
+
+        if not is_excluded:
+            buckets[bucket] = idx
+            out[n_matches] = idx
+            n_matches += 1
+
+    return out[:n_matches]
+
+
+def _find_matches(D, excl_zone, max_distance, max_matches=None, query_idx=None):
+    """
+    Find the indices of the (non-overlapping) matches in the distance profile `D`
+
+    This is equivalent to repeatedly selecting the `np.argmin` of `D` (starting with
+    `query_idx`, when provided) and applying an exclusion zone around it until the
+    minimum distance exceeds `max_distance` or is not finite, or until `max_matches`
+    matches have been found. However, only the subsequences that are within
+    `max_distance` are ever sorted and, when `max_matches` is finite, only those
+    that can possibly be among the `max_matches` matches.
+
+    Parameters
+    ----------
+    D : numpy.ndarray
+        The distance profile
+
+    excl_zone : int
+        The size of the exclusion zone around each match
+
+    max_distance : float
+        The maximum distance (inclusive) of a match
+
+    max_matches : int, default None
+        The maximum number of matches. When `max_matches=None`, all matches are
+        returned.
+
+    query_idx : int, default None
+        The index of the first match, which is selected before all others
+        regardless of its distance. When `query_idx=None`, the closest subsequence
+        is the first match.
+
+    Returns
+    -------
+    matches : list
+        A list of `[distance, index]` pairs sorted by the order in which the matches
+        were selected
+    """
+    l = D.shape[0]
+    if max_matches is None or max_matches > l:
+        max_matches = l
+    max_matches = int(max_matches)
+
+    if max_matches < 1:
+        return []
+
+    if query_idx is not None and not (
+        D[query_idx] <= max_distance and np.isfinite(D[query_idx])
+    ):
+        return []
+
+    candidates = np.flatnonzero((D <= max_distance) & np.isfinite(D))
+
+    # Every candidate that is rejected lies within the exclusion zone of a match and
+    # so the first `max_matches * (2 * excl_zone + 1)` candidates (plus any ties)
+    # are sufficient for finding all of the matches
+    k = max_matches * (2 * excl_zone + 1)
+    if k < candidates.shape[0]:
+        D_candidates = D[candidates]
+        max_distance = np.partition(D_candidates, k - 1)[k - 1]
+        candidates = candidates[D_candidates <= max_distance]
+
+    # A stable sort breaks ties by index just like `np.argmin`
+    candidates = candidates[np.argsort(D[candidates], kind="mergesort")]
+    if query_idx is not None:
+        candidates = np.concatenate((np.array([query_idx], dtype=np.int64), candidates))
+
+    I = _select_matches(l, candidates, excl_zone, max_matches)
+
+    return [[D[idx], idx] for idx in I]
+
+
+def _compute_max_distance(D):
+    """
+    Compute the default maximum distance of a match from a distance profile
+
+    This is `np.nanmax([np.nanmean(D) - 2 * np.nanstd(D), np.nanmin(D)])` where all
+    infinite distances are ignored, which ensures that at least the closest match is
+    returned.
+
+    Parameters
+    ----------
+    D : numpy.ndarray
+        The distance profile
+
+    Returns
+    -------
+    max_distance : float
+        The maximum distance of a match
+    """
+    D_copy = D.copy().astype(np.float64)
+    D_copy[np.isinf(D_copy)] = np.nan
+
+    return np.nanmax([np.nanmean(D_copy) - 2.0 * np.nanstd(D_copy), np.nanmin(D_copy)])
+
+
+def _find_matches_batch(
+    distance_profiles, excl_zone, max_distance, atol, max_matches, typed
+):
+    """
+    Find the (non-overlapping) matches in each of the `distance_profiles`, one
+    distance profile at a time
+
+    Parameters
+    ----------
+    distance_profiles : iterable
+        The distance profile of each query
+
+    excl_zone : int
+        The size of the exclusion zone around each match
+
+    max_distance : float or function
+        The maximum distance of a match or a function of the distance profile that
+        returns it
+
+    atol : float
+        The absolute tolerance that is added to `max_distance`
+
+    max_matches : int
+        The maximum number of matches of each query. When `max_matches=None`, all
+        matches are returned.
+
+    typed : bool
+        When set to `True`, a `Matches` named tuple is yielded for each query.
+        Otherwise, a `numpy.ndarray` with `dtype=object` is yielded.
+
+    Yields
+    ------
+    matches : Matches or numpy.ndarray
+        The matches of the next query
+    """
+    for D in distance_profiles:
+        if isinstance(max_distance, float):
+            D_max_distance = max_distance
+        else:
+            D_max_distance = max_distance(D)
+
+        matches = _find_matches(D, excl_zone, atol + D_max_distance, max_matches)
+        if typed:
+            yield _matches(matches)
+        else:
+            yield np.array(matches, dtype=object)
+
+
+def _find_motifs(
+    P,
+    excl_zone,
+    min_neighbors,
+    max_distance,
+    cutoff,
+    max_matches,
+    max_motifs,
+    atol,
+    compute_distance_profiles,
+    max_memory,
+):
+    """
+    Find the top motifs from the matrix profile `P`
+
+    This is equivalent to repeatedly selecting the `np.argmin` of `P` as a candidate
+    motif, finding all of its matches, and applying an exclusion zone to `P` around
+    each match. However, the candidates that can never be selected (i.e., those
+    whose matrix profile value exceeds `cutoff` or, when it is a constant,
+    `max_distance`) are pruned upfront and the remaining candidates are visited in
+    sorted order while skipping any excluded candidates.
+
+    Moreover, the distance profiles are computed for a batch of upcoming candidates
+    at once (see `compute_distance_profiles`) and are cached until their candidate is
+    visited or is excluded. Candidates that overlap with or that are likely the
+    nearest neighbor (i.e., have the same matrix profile value) of another candidate
+    in the same batch are deferred to a later batch since they are expected to be
+    excluded. The batch size is doubled whenever all of the
+    distance profiles of the previous batch were used and is halved otherwise.
+
+    Parameters
+    ----------
+    P : numpy.ndarray
+        The (1-dimensional) matrix profile
+
+    excl_zone : int
+        Size of the exclusion zone
+
+    min_neighbors : int
+        The minimum number of similar matches a subsequence needs to have in order
+        to be considered a motif.
+
+    max_distance : float, function, or None
+        The maximum distance of a match (see `match`). When `max_distance=None`, the
+        default `_compute_max_distance` is used.
+
+    cutoff : float
+        The largest matrix profile value (distance) that a candidate motif is allowed
+        to have.
+
+    max_matches : int
+        The maximum number of similar matches to be returned for each motif
+
+    max_motifs : int
+        The maximum number of motifs to return.
+
+    atol : float
+        The absolute tolerance parameter. This value will be added to `max_distance`
+        when comparing distances between subsequences.
+
+    compute_distance_profiles : function
+        A function that accepts an array of candidate indices and returns an
+        iterable of their distance profiles (in the same order)
+
+    max_memory : int
+        The maximum number of bytes that are used for caching distance profiles
+
+    Returns
+    -------
+    motif_distances : numpy.ndarray
+        The distances corresponding to a set of subsequence matches for each motif.
+
+    motif_indices : numpy.ndarray
+        The indices corresponding to a set of subsequences matches for each motif.
+    """
+    l = P.shape[0]
+    if max_distance is None:  # pragma: no cover
+        max_distance = _compute_max_distance
+
+    is_candidate = np.isfinite(P) & (P <= cutoff)
+    if isinstance(max_distance, float):
+        is_candidate &= P <= max_distance
+    candidates = np.flatnonzero(is_candidate)
+    # A stable sort breaks ties by index just like `np.argmin`
+    candidates = candidates[np.argsort(P[candidates], kind="mergesort")]
+
+    is_excluded = np.zeros(l, dtype=bool)
+    max_batch_size = max(1, int(max_memory // (8 * l)))
+    batch_size = 1
+    n_discarded = 0
+    distance_profiles = {}
+
+    motif_indices = []
+    motif_distances = []
+
+    i = 0
+    while len(motif_indices) < max_motifs:
+        while i < candidates.shape[0] and is_excluded[candidates[i]]:
+            i += 1
+        if i == candidates.shape[0]:
+            break
+
+        candidate_idx = candidates[i]
+        i += 1
+
+        if candidate_idx not in distance_profiles:
+            if n_discarded == 0:
+                batch_size = min(2 * batch_size, max_batch_size)
+            else:
+                batch_size = max(1, batch_size // 2)
+            n_discarded = 0
+
+            batch = [candidate_idx]
+            for idx in candidates[i : i + 4 * batch_size]:
+                if len(batch) == min(batch_size, max_motifs - len(motif_indices)):
+                    break
+                if is_excluded[idx] or idx in distance_profiles:
+                    continue
+                batch_idx = np.array(batch)
+                if np.any(
+                    (np.abs(batch_idx - idx) <= excl_zone) | (P[batch_idx] == P[idx])
+                ):
+                    continue
+                batch.append(idx)
+
+            batch = np.array(batch, dtype=np.int64)
+            for idx, D in zip(batch, compute_distance_profiles(batch)):
+                distance_profiles[idx] = D
+
+        D = distance_profiles.pop(candidate_idx)
+        if isinstance(max_distance, float):
+            D_max_distance = max_distance
+        else:
+            D_max_distance = max_distance(D)
+
+        query_matches = _matches(
+            _find_matches(D, excl_zone, atol + D_max_distance, query_idx=candidate_idx)
+        )
+
+        if len(query_matches.I) > min_neighbors:
+            motif_distances.append(query_matches.D[:max_matches])
+            motif_indices.append(query_matches.I[:max_matches])
+
+        for idx in query_matches.I:
+            is_excluded[max(0, idx - excl_zone) : idx + excl_zone + 1] = True
+
+        n_cached = len(distance_profiles)
+        distance_profiles = {
+            idx: D for idx, D in distance_profiles.items() if not is_excluded[idx]
+        }
+        n_discarded += n_cached - len(distance_profiles)
+
+    motif_distances = _jagged_list_to_array(
+        motif_distances, fill_value=np.nan, dtype=np.float64
+    )
+    motif_indices = _jagged_list_to_array(motif_indices, fill_value=-1, dtype=np.int64)
+
+    return motif_distances, motif_indices
+
+
+def _grow_buffer(buffer, size):
+    """
+    Ensure that a growable `buffer` can hold at least `size` elements along its first
+    axis
+
+    When `buffer` is too small, a new buffer with (at least) double the capacity is
+    allocated and the contents of `buffer` are copied into it. Doubling the capacity
+    keeps the amortized cost of appending a single element to the buffer constant.
+
+    Parameters
+    ----------
+    buffer : numpy.ndarray
+        The buffer to grow
+
+    size : int
+        The minimum number of elements that the buffer must be able to hold
+
+    Returns
+    -------
+    buffer : numpy.ndarray
+        Either the original `buffer` (if it is already large enough) or a new buffer
+        whose leading elements are a copy of the original `buffer`
+    """
+    capacity = buffer.shape[0]
+    if size <= capacity:
+        return buffer
+
+    new_buffer = np.empty(
+        (max(size, 2 * capacity),) + buffer.shape[1:], dtype=buffer.dtype
+    )
+    new_buffer[:capacity] = buffer
+
+    return new_buffer
+
+
 def transpose_dataframe(df):  # pragma: no cover
     """
     Check if the input is a column-wise Pandas `DataFrame`. If `True`, return a
@@ -487,62 +1049,258 @@ def _sliding_dot_product(Q, T):
     return out
 
 
-def sliding_dot_product(Q, T):
+def _get_sliding_dot_product_block_size(m, n=None):
     """
-    Use FFT convolution to calculate the sliding window dot product.
+    Compute the FFT length of each block for the overlap-save sliding dot product
 
     Parameters
     ----------
-    Q : numpy.ndarray
-        Query array or subsequence
+    m : int
+        Window size
 
-    T : numpy.ndarray
-        Time series or sequence
+    n : int, default None
+        The length of the time series. When provided, the block size never exceeds
+        the (fast) FFT length that is needed for the whole time series.
 
     Returns
     -------
-    output : numpy.ndarray
-        Sliding dot product between `Q` and `T`.
-
-    Notes
-    -----
-    Calculate the sliding dot product
-
-    `DOI: 10.1109/ICDM.2016.0179 \
-    <https://www.cs.ucr.edu/~eamonn/PID4481997_extend_Matrix%20Profile_I.pdf>`__
-
-    See Table I, Figure 4
-
-    Following the inverse FFT, Fig. 4 states that only cells [m-1:n]
-    contain valid dot products
-
-    Padding is done automatically in fftconvolve step
+    L : int
+        The FFT length of each block
     """
-    n = T.shape[0]
-    m = Q.shape[0]
-    Qr = np.flipud(Q)  # Reverse/flip Q
-    QT = convolve(Qr, T)
+    L = scipy.fft.next_fast_len(
+        max(4 * m, config.STUMPY_SLIDING_DOT_PRODUCT_BLOCK_SIZE), real=True
+    )
+    if n is not None:
+        L = min(L, scipy.fft.next_fast_len(n, real=True))
 
-    return QT.real[m - 1 : n]
+    return L
 
 
-@njit(
-    # "f8[:](f8[:], i8, b1[:])",
-    fastmath={"nsz", "arcp", "contract", "afn", "reassoc"}
-)
-def _welford_nanvar(a, w, a_subseq_isfinite):
+def _rfft_blocks(T, m, L, start, stop):
     """
-    Compute the rolling variance for a 1-D array while ignoring NaNs using a modified
-    version of Welford's algorithm but is much faster than using `np.nanstd` with stride
-    tricks.
+    Compute the real FFT of the overlapping blocks of `T` that are used for the
+    overlap-save sliding dot product
+
+    The `i`th block is `T[i * (L - m + 1) : i * (L - m + 1) + L]`, which is padded
+    with zeros past the end of `T`.
 
     Parameters
     ----------
-    a : numpy.ndarray
-        The input array
+    T : numpy.ndarray
+        Time series or sequence
 
-    w : int
-        The rolling window size
+    m : int
+        Window size
+
+    L : int
+        The FFT length of each block
+
+    start : int
+        The index of the first block
+
+    stop : int
+        The index of the last block (exclusive)
+
+    Returns
+    -------
+    T_fft : numpy.ndarray
+        A 2-dimensional array where each row is the FFT of a block
+    """
+    step = L - m + 1
+    block_start = start * step
+    block_len = (stop - start - 1) * step + L
+
+    T_blocks = np.zeros(block_len, dtype=np.float64)
+    T_chunk = T[block_start : block_start + block_len]
+    T_blocks[: T_chunk.shape[0]] = T_chunk
+    T_blocks = np.lib.stride_tricks.as_strided(
+        T_blocks,
+        shape=(stop - start, L),
+        strides=(step * T_blocks.strides[0], T_blocks.strides[0]),
+        writeable=False,
+    )
+
+    return scipy.fft.rfft(T_blocks, axis=1, workers=numba.config.NUMBA_NUM_THREADS)
+
+
+def _get_rfft_blocks(T, m, L, T_key):
+    """
+    Retrieve the real FFTs of all of the overlap-save blocks of `T` from a least
+    recently used cache (see `config.STUMPY_FFT_CACHE_MAX_BYTES`) that is keyed by the
+    identity of `T`, the window size, and the FFT length, and compute them if they
+    are not cached yet
+
+    This ensures that repeatedly computing the sliding dot products of different
+    queries with the same time series only transforms the time series once.
+
+    Parameters
+    ----------
+    T : numpy.ndarray
+        Time series or sequence
+
+    m : int
+        Window size
+
+    L : int
+        The FFT length of each block
+
+    T_key : tuple
+        The key that identifies `T` (see `_array_id`)
+
+    Returns
+    -------
+    T_fft : numpy.ndarray
+        A read-only 2-dimensional array where each row is the FFT of a block or
+        `None` if the FFTs of all of the blocks do not fit in the cache
+    """
+    n_blocks = -(-(T.shape[0] - m + 1) // (L - m + 1))
+    if 16 * n_blocks * (L // 2 + 1) > config.STUMPY_FFT_CACHE_MAX_BYTES:
+        return None
+
+    key = (T_key, int(m), int(L))
+    out = _FFT_CACHE.get(key, copy=False)
+    if out is None:
+        out = (_rfft_blocks(T, m, L, 0, n_blocks),)
+        _FFT_CACHE.put(key, out, copy=False)
+
+    return out[0]
+
+
+def _sliding_dot_product_blocked(Q, T, L, T_fft=None):
+    """
+    Use overlap-save FFT convolution to calculate the sliding window dot product
+
+    `T` is split into overlapping blocks of length `L` that each yield `L - m + 1`
+    sliding dot products. Rather than transforming the whole time series at once,
+    only a bounded number of blocks (see `config.STUMPY_SLIDING_DOT_PRODUCT_MAX_MEMORY`)
+    are transformed at a time, which keeps both the memory usage and the FFT
+    lengths small.
+
+    Parameters
+    ----------
+    Q : numpy.ndarray
+        Query array or subsequence
+
+    T : numpy.ndarray
+        Time series or sequence
+
+    L : int
+        The FFT length of each block, which must be at least `m`
+
+    T_fft : numpy.ndarray, default None
+        The FFTs of all of the blocks of `T` (see `_get_rfft_blocks`). When provided,
+        these are used instead of transforming the blocks of `T`.
+
+    Returns
+    -------
+    output : numpy.ndarray
+        Sliding dot product between `Q` and `T`.
+    """
+    n = T.shape[0]
+    m = Q.shape[0]
+    l = n - m + 1
+    step = L - m + 1
+    n_blocks = -(-l // step)
+    workers = numba.config.NUMBA_NUM_THREADS
+
+    Q_fft = scipy.fft.rfft(np.flipud(Q), n=L, workers=workers)
+
+    # The complex spectrum, the real inverse, and the padded copy of each block
+    nbytes_per_block = 16 * (L // 2 + 1) + 16 * L
+    blocks_per_chunk = max(
+        1, config.STUMPY_SLIDING_DOT_PRODUCT_MAX_MEMORY // nbytes_per_block
+    )
+
+    QT = np.empty(n_blocks * step, dtype=np.float64)
+    for start in range(0, n_blocks, blocks_per_chunk):
+        stop = min(start + blocks_per_chunk, n_blocks)
+        if T_fft is None:
+            QT_fft = _rfft_blocks(T, m, L, start, stop)
+            QT_fft *= Q_fft
+        else:
+            QT_fft = T_fft[start:stop] * Q_fft
+        QT[start * step : stop * step].reshape(stop - start, step)[:] = scipy.fft.irfft(
+            QT_fft, n=L, axis=1, workers=workers
+        )[:, m - 1 :]
+
+    return QT[:l]
+
+
+def sliding_dot_product(Q, T, T_key=None):
+    """
+    Use FFT convolution to calculate the sliding window dot product.
+
+    When an FFT convolution is faster than a direct convolution, the overlap-save
+    method is used so that only short FFTs of blocks of `T` are needed (see
+    `_sliding_dot_product_blocked`).
+
+    Parameters
+    ----------
+    Q : numpy.ndarray
+        Query array or subsequence
+
+    T : numpy.ndarray
+        Time series or sequence
+
+    T_key : tuple, default None
+        The key that identifies `T` (see `_array_id`). When provided, the FFTs of the
+        blocks of `T` are retrieved from (or added to) a cache so that they are only
+        computed once for all of the queries (see `_get_rfft_blocks`). Note that `T`
+        must not be modified in place as long as the same key is used.
+
+    Returns
+    -------
+    output : numpy.ndarray
+        Sliding dot product between `Q` and `T`.
+
+    Notes
+    -----
+    Calculate the sliding dot product
+
+    `DOI: 10.1109/ICDM.2016.0179 \
+    <https://www.cs.ucr.edu/~eamonn/PID4481997_extend_Matrix%20Profile_I.pdf>`__
+
+    See Table I, Figure 4
+
+    Following the inverse FFT, Fig. 4 states that only cells [m-1:n]
+    contain valid dot products
+
+    Padding is done automatically in fftconvolve step
+    """
+    n = T.shape[0]
+    m = Q.shape[0]
+    Qr = np.flipud(Q)  # Reverse/flip Q
+    method = choose_conv_method(Qr, T)
+
+    if method == "fft":
+        L = _get_sliding_dot_product_block_size(m, n)
+        T_fft = None
+        if T_key is not None:
+            T_fft = _get_rfft_blocks(T, m, L, T_key)
+        return _sliding_dot_product_blocked(Q, T, L, T_fft)
+
+    QT = convolve(Qr, T, method=method)
+
+    return QT.real[m - 1 : n]
+
+
+@njit(
+    # "f8[:](f8[:], i8, b1[:])",
+    fastmath={"nsz", "arcp", "contract", "afn", "reassoc"}
+)
+def _welford_nanvar(a, w, a_subseq_isfinite):
+    """
+    Compute the rolling variance for a 1-D array while ignoring NaNs using a modified
+    version of Welford's algorithm but is much faster than using `np.nanstd` with stride
+    tricks.
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        The input array
+
+    w : int
+        The rolling window size
 
     a_subseq_isfinite : numpy.ndarray
         A boolean array that describes whether each subequence of length `w` within `a`
@@ -791,11 +1549,277 @@ def rolling_nanmax(a, w):
     )
 
 
+class _ArrayCache:
+    """
+    A thread-safe least recently used (LRU) cache of tuples of arrays whose total size
+    is capped by a maximum number of bytes
+
+    Parameters
+    ----------
+    max_nbytes : function
+        A function that returns the maximum total number of bytes that may be cached.
+        This is evaluated lazily so that configuration changes take effect
+        immediately.
+    """
+
+    def __init__(self, max_nbytes):
+        self._max_nbytes = max_nbytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Return the number of cached entries
+
+        Returns
+        -------
+        out : int
+            The number of cached entries
+        """
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        """
+        The total number of bytes of all cached arrays
+        """
+        return self._nbytes
+
+    def get(self, key, copy=True):
+        """
+        Retrieve (copies of) the arrays that are cached for `key`
+
+        Parameters
+        ----------
+        key : tuple
+            The cache key
+
+        copy : bool, default True
+            When set to `False`, the cached arrays themselves are returned, which
+            must not be modified
+
+        Returns
+        -------
+        out : tuple
+            Copies of the cached arrays or `None` if `key` is not cached
+        """
+        with self._lock:
+            arrays = self._entries.get(key)
+            if arrays is None:
+                return None
+            self._entries.move_to_end(key)
+
+        if not copy:
+            return arrays
+
+        return tuple(a.copy() for a in arrays)
+
+    def put(self, key, arrays, copy=True):
+        """
+        Cache (copies of) `arrays` for `key` and evict the least recently used entries
+        until the cache fits within the maximum number of bytes
+
+        Parameters
+        ----------
+        key : tuple
+            The cache key
+
+        arrays : tuple
+            The arrays to cache
+
+        copy : bool, default True
+            When set to `False`, `arrays` are cached without copying them and are
+            made read-only instead
+
+        Returns
+        -------
+        None
+        """
+        max_nbytes = self._max_nbytes()
+        if copy:
+            arrays = tuple(a.copy() for a in arrays)
+        else:
+            for a in arrays:
+                a.flags.writeable = False
+        nbytes = sum(a.nbytes for a in arrays)
+        if nbytes > max_nbytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= sum(a.nbytes for a in self._entries.pop(key))
+            self._entries[key] = arrays
+            self._nbytes += nbytes
+            while self._nbytes > max_nbytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= sum(a.nbytes for a in evicted)
+
+    def clear(self):
+        """
+        Remove all cached entries
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+# Sliding means and standard deviations keyed by the content of `T` and the window size
+_MEAN_STD_CACHE = _ArrayCache(lambda: config.STUMPY_MEAN_STD_CACHE_MAX_BYTES)
+
+# The `_MultiWindowMeanStd` objects that `compute_mean_std` defers to within the
+# current context (see `_use_mean_std`)
+_MEAN_STDS = contextvars.ContextVar("_MEAN_STDS", default=())
+
+# FFTs of the overlap-save blocks keyed by the identity of `T` (see `_array_id`), the
+# window size, and the FFT length
+_FFT_CACHE = _ArrayCache(lambda: config.STUMPY_FFT_CACHE_MAX_BYTES)
+
+
+def _array_key(a):
+    """
+    Create a hashable key that identifies an array by its content
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        The input array
+
+    Returns
+    -------
+    key : tuple
+        The shape, the dtype, and a digest of the bytes of `a`
+    """
+    a = np.ascontiguousarray(a)
+    digest = hashlib.blake2b(a, digest_size=16).digest()
+
+    return (a.shape, a.dtype.str, digest)
+
+
+class _ArrayId:
+    """
+    A hashable key that identifies an array by its identity and its memory layout
+
+    Unlike `_array_key`, creating this key costs (almost) nothing regardless of the
+    size of the array. The weak reference ensures that a new array, which happens to
+    reuse the `id` and the memory of an array that was garbage collected, never
+    matches the key of the old array. Note that modifying the array in place is not
+    detected.
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        The input array
+    """
+
+    def __init__(self, a):
+        self._ref = weakref.ref(a)
+        a_arr = np.asarray(a)
+        self._key = (
+            id(a),
+            a_arr.__array_interface__["data"][0],
+            a_arr.shape,
+            a_arr.strides,
+            a_arr.dtype.str,
+        )
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __eq__(self, other):
+        if not isinstance(other, _ArrayId) or self._key != other._key:
+            return False
+
+        a = self._ref()
+        return a is not None and a is other._ref()
+
+
+def _array_id(a, *tags):
+    """
+    Create a hashable key that identifies an array by its identity and its memory
+    layout (see `_ArrayId`)
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        The input array
+
+    tags : tuple
+        Any additional hashable values that describe how the array, that the key
+        refers to, was derived from `a` (e.g., a row index)
+
+    Returns
+    -------
+    key : tuple
+        The key or `None` if `a` cannot be weakly referenced (e.g., a list)
+    """
+    try:
+        return (_ArrayId(a),) + tags
+    except TypeError:
+        return None
+
+
 def compute_mean_std(T, m):
     """
     Compute the sliding mean and standard deviation for the array `T` with
     a window size of `m`
 
+    The results are kept in a least recently used cache (see
+    `config.STUMPY_MEAN_STD_CACHE_MAX_BYTES`) that is keyed by the content of `T` and
+    `m` so that calling multiple functions on the same time series only computes the
+    sliding statistics once. Since a pre-processed copy of the time series is passed
+    to this function by every caller, the cache cannot be keyed by the identity of
+    `T`. Instead, `T` is only hashed when its statistics fit in the cache. Set
+    `config.STUMPY_MEAN_STD_CACHE_MAX_BYTES = 0` to disable the cache.
+
+    Parameters
+    ----------
+    T : numpy.ndarray
+        Time series or sequence
+
+    m : int
+        Window size
+
+    Returns
+    -------
+    M_T : numpy.ndarray
+        Sliding mean. All nan values are replaced with np.inf
+
+    Σ_T : numpy.ndarray
+        Sliding standard deviation
+    """
+    for mean_std in _MEAN_STDS.get():
+        if mean_std.is_computed_from(T):
+            return mean_std.compute_mean_std(m)
+
+    if config.STUMPY_MEAN_STD_CACHE_MAX_BYTES <= 0 or T.shape[-1] <= m:
+        # Queries (i.e., a single subsequence) are cheaper to recompute than to cache
+        return _compute_mean_std(T, m)
+
+    if 2 * 8 * (T.size // T.shape[-1]) * (T.shape[-1] - m + 1) > (
+        config.STUMPY_MEAN_STD_CACHE_MAX_BYTES
+    ):
+        # The results can never be cached and so `T` is not hashed either
+        return _compute_mean_std(T, m)
+
+    key = (_array_key(T), int(m))
+    out = _MEAN_STD_CACHE.get(key)
+    if out is None:
+        out = _compute_mean_std(T, m)
+        _MEAN_STD_CACHE.put(key, out)
+
+    return out
+
+
+def _compute_mean_std(T, m):
+    """
+    Compute the sliding mean and standard deviation for the array `T` with
+    a window size of `m`
+
     Parameters
     ----------
     T : numpy.ndarray
@@ -876,6 +1900,293 @@ def compute_mean_std(T, m):
         )
 
 
+@njit
+def _two_sum(a, b):
+    """
+    Compute the sum of two floats along with the (exact) rounding error of the sum
+    using Knuth's TwoSum algorithm
+
+    Parameters
+    ----------
+    a : float
+        A float
+
+    b : float
+        A float
+
+    Returns
+    -------
+    s : float
+        The floating point sum of `a` and `b`
+
+    e : float
+        The rounding error so that `a + b = s + e` exactly
+    """
+    s = a + b
+    z = s - a
+    e = (a - (s - z)) + (b - z)
+
+    return s, e
+
+
+@njit
+def _two_prod(a, b):
+    """
+    Compute the product of two floats along with the (exact) rounding error of the
+    product using Dekker's TwoProduct algorithm
+
+    Parameters
+    ----------
+    a : float
+        A float
+
+    b : float
+        A float
+
+    Returns
+    -------
+    p : float
+        The floating point product of `a` and `b`
+
+    e : float
+        The rounding error so that `a * b = p + e` exactly
+    """
+    p = a * b
+    c = 134217729.0 * a  # 2**27 + 1
+    a_hi = c - (c - a)
+    a_lo = a - a_hi
+    c = 134217729.0 * b
+    b_hi = c - (c - b)
+    b_lo = b - b_hi
+    e = ((a_hi * b_hi - p) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+
+    return p, e
+
+
+@njit
+def _dd_add(a_hi, a_lo, b_hi, b_lo):
+    """
+    Add two double-double numbers
+
+    Parameters
+    ----------
+    a_hi : float
+        The high part of the first number
+
+    a_lo : float
+        The low part of the first number
+
+    b_hi : float
+        The high part of the second number
+
+    b_lo : float
+        The low part of the second number
+
+    Returns
+    -------
+    hi : float
+        The high part of the sum
+
+    lo : float
+        The low part of the sum
+    """
+    s, e = _two_sum(a_hi, b_hi)
+    e += a_lo + b_lo
+    hi = s + e
+    lo = e - (hi - s)
+
+    return hi, lo
+
+
+@njit
+def _mean_std_cumsums(T):
+    """
+    Compute the cumulative count of finite values, and the (compensated) cumulative
+    sums and sums of squares of the finite values of a 1-D time series
+
+    The sums are kept as double-double (i.e., `hi + lo`) numbers so that the sum (or
+    the sum of squares) of any window can be recovered with (nearly) the same accuracy
+    as summing the window directly.
+
+    Parameters
+    ----------
+    T : numpy.ndarray
+        Time series or sequence
+
+    Returns
+    -------
+    count : numpy.ndarray
+        The cumulative count of finite values
+
+    S : numpy.ndarray
+        The cumulative sum of finite values where `S[0]` and `S[1]` are the high and
+        low parts, respectively
+
+    S2 : numpy.ndarray
+        The cumulative sum of squares of finite values where `S2[0]` and `S2[1]` are
+        the high and low parts, respectively
+    """
+    n = T.shape[0]
+    count = np.zeros(n + 1, dtype=np.int64)
+    S = np.zeros((2, n + 1), dtype=np.float64)
+    S2 = np.zeros((2, n + 1), dtype=np.float64)
+
+    for i in range(n):
+        count[i + 1] = count[i]
+        S[0, i + 1], S[1, i + 1] = S[0, i], S[1, i]
+        S2[0, i + 1], S2[1, i + 1] = S2[0, i], S2[1, i]
+        if np.isfinite(T[i]):
+            count[i + 1] += 1
+            S[0, i + 1], S[1, i + 1] = _dd_add(S[0, i], S[1, i], T[i], 0.0)
+            sq_hi, sq_lo = _two_prod(T[i], T[i])
+            S2[0, i + 1], S2[1, i + 1] = _dd_add(S2[0, i], S2[1, i], sq_hi, sq_lo)
+
+    return count, S, S2
+
+
+@njit(parallel=True)
+def _mean_std_from_cumsums(count, S, S2, m):
+    """
+    Compute the sliding mean and standard deviation with a window size of `m` from
+    the cumulative sums that are returned by `_mean_std_cumsums`
+
+    Parameters
+    ----------
+    count : numpy.ndarray
+        The cumulative count of finite values
+
+    S : numpy.ndarray
+        The (double-double) cumulative sum of finite values
+
+    S2 : numpy.ndarray
+        The (double-double) cumulative sum of squares of finite values
+
+    m : int
+        Window size
+
+    Returns
+    -------
+    M_T : numpy.ndarray
+        Sliding mean. The mean of every window that contains a non-finite value is set
+        to `np.inf`
+
+    Σ_T : numpy.ndarray
+        Sliding standard deviation of the finite values in each window
+    """
+    l = count.shape[0] - m
+    M_T = np.empty(l, dtype=np.float64)
+    Σ_T = np.empty(l, dtype=np.float64)
+
+    for i in prange(l):
+        j = i + m
+        k = count[j] - count[i]
+        if k == 0:
+            M_T[i] = np.inf
+            Σ_T[i] = 0.0
+            continue
+
+        s_hi, s_lo = _dd_add(S[0, j], S[1, j], -S[0, i], -S[1, i])
+        s2_hi, s2_lo = _dd_add(S2[0, j], S2[1, j], -S2[0, i], -S2[1, i])
+        if k == m:
+            M_T[i] = (s_hi + s_lo) / m
+        else:
+            M_T[i] = np.inf
+
+        # k * S2 - S * S, which is k**2 times the variance, in double-double precision
+        a_hi, a_lo = _two_prod(s2_hi, float(k))
+        a_lo += s2_lo * k
+        b_hi, b_lo = _two_prod(s_hi, s_hi)
+        b_lo += 2.0 * s_hi * s_lo
+        var_hi, var_lo = _dd_add(a_hi, a_lo, -b_hi, -b_lo)
+        Σ_T[i] = np.sqrt(max(0.0, var_hi + var_lo)) / k
+
+    return M_T, Σ_T
+
+
+class _MultiWindowMeanStd:
+    """
+    Compute the sliding mean and standard deviation of a 1-D time series for many
+    window sizes
+
+    The (compensated) cumulative sums of the time series are computed only once so
+    that the sliding mean and standard deviation for any window size can then be
+    computed in `O(n)` time rather than re-computing the rolling statistics from
+    scratch. The results match `compute_mean_std`.
+
+    Parameters
+    ----------
+    T : numpy.ndarray
+        Time series or sequence
+    """
+
+    def __init__(self, T):
+        self._T = np.asarray(T, dtype=np.float64)
+        self._count, self._S, self._S2 = _mean_std_cumsums(self._T)
+
+    def is_computed_from(self, T):
+        """
+        Determine whether the cumulative sums were computed from the time series `T`
+
+        Parameters
+        ----------
+        T : numpy.ndarray
+            Time series or sequence
+
+        Returns
+        -------
+        out : bool
+            `True` if `T` has the same shape and values (including the positions of
+            any `np.nan` values) as the time series of this object
+        """
+        return T.shape == self._T.shape and np.array_equal(T, self._T, equal_nan=True)
+
+    def compute_mean_std(self, m):
+        """
+        Compute the sliding mean and standard deviation with a window size of `m`
+
+        Parameters
+        ----------
+        m : int
+            Window size
+
+        Returns
+        -------
+        M_T : numpy.ndarray
+            Sliding mean. All nan values are replaced with np.inf
+
+        Σ_T : numpy.ndarray
+            Sliding standard deviation
+        """
+        return _mean_std_from_cumsums(self._count, self._S, self._S2, m)
+
+
+@contextlib.contextmanager
+def _use_mean_std(mean_stds):
+    """
+    A context manager within which `compute_mean_std` returns the sliding mean and
+    standard deviation from `mean_stds` for any time series that one of them was
+    computed from
+
+    The statistics are neither taken from nor stored in the `compute_mean_std` cache
+    and this only affects the current thread (or context) so that the results of any
+    other caller never depend on whether or not this context was entered before.
+
+    Parameters
+    ----------
+    mean_stds : list
+        A list of `_MultiWindowMeanStd` objects
+
+    Returns
+    -------
+    None
+    """
+    token = _MEAN_STDS.set(tuple(mean_stds))
+    try:
+        yield
+    finally:
+        _MEAN_STDS.reset(token)
+
+
 @njit(
     # "f8(i8, f8, f8, f8, f8, f8)",
     fastmath=True
@@ -1031,6 +2342,62 @@ def calculate_distance_profile(m, QT, μ_Q, σ_Q, M_T, Σ_T):
     return np.sqrt(D_squared)
 
 
+@njit(fastmath=True)
+def _abs_pow(x, p):
+    """
+    A Numba JIT-compiled function for computing `abs(x) ** p`
+
+    Since raising a number to a floating point power is several times slower than a
+    multiplication, dedicated code paths are used for the common cases of `p=1` (the
+    Manhattan distance) and `p=2` (the Euclidean distance).
+
+    Parameters
+    ----------
+    x : float
+        A single value
+
+    p : float
+        The p-norm to apply for computing the Minkowski distance.
+
+    Returns
+    -------
+    out : float
+        The absolute value of `x` raised to the power of `p`
+    """
+    if p == 2.0:
+        return x * x
+    elif p == 1.0:
+        return abs(x)
+    else:
+        return abs(x) ** p
+
+
+@njit(fastmath=True)
+def _p_norm(a, p):
+    """
+    A Numba JIT-compiled function for computing the p-norm of `a` raised to the power
+    of `p` (i.e., `np.linalg.norm(a, ord=p) ** p`) without any temporary arrays
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        A 1-D array
+
+    p : float
+        The p-norm to apply for computing the Minkowski distance.
+
+    Returns
+    -------
+    out : float
+        The sum of the absolute values of `a` raised to the power of `p`
+    """
+    out = 0.0
+    for i in range(a.shape[0]):
+        out += _abs_pow(a[i], p)
+
+    return out
+
+
 @njit(fastmath=True)
 def _p_norm_distance_profile(Q, T, p=2.0):
     """
@@ -1070,7 +2437,9 @@ def _p_norm_distance_profile(Q, T, p=2.0):
             p_norm_profile[i] = Q_squared + T_squared[i] - 2.0 * QT[i]
     else:
         for i in range(k):
-            p_norm_profile[i] = np.sum(np.power(np.abs(Q - T[i : i + m]), p))
+            p_norm_profile[i] = 0.0
+            for j in range(m):
+                p_norm_profile[i] += _abs_pow(Q[j] - T[i + j], p)
 
     return p_norm_profile
 
@@ -1344,6 +2713,12 @@ def mass(Q, T, M_T=None, Σ_T=None, normalize=True, p=2.0):
 
     This is a convenience wrapper around the Numba JIT compiled `_mass` function.
 
+    The FFTs of `T` are kept in a least recently used cache (see
+    `config.STUMPY_FFT_CACHE_MAX_BYTES`) that is keyed by the identity of `T` so that
+    repeatedly calling this function with the same `T` only transforms `T` once.
+    Since modifying `T` in place is not detected, pass a new array after modifying
+    `T` (or set `config.STUMPY_FFT_CACHE_MAX_BYTES = 0` to disable the cache).
+
     Parameters
     ----------
     Q : numpy.ndarray
@@ -1369,72 +2744,477 @@ def mass(Q, T, M_T=None, Σ_T=None, normalize=True, p=2.0):
 
     Returns
     -------
-    distance_profile : numpy.ndarray
-        Distance profile
+    distance_profile : numpy.ndarray
+        Distance profile
+
+    See Also
+    --------
+    stumpy.motifs : Discover the top motifs for time series `T`
+    stumpy.match : Find all matches of a query `Q` in a time series `T```
+
+    Notes
+    -----
+    `DOI: 10.1109/ICDM.2016.0179 \
+    <https://www.cs.ucr.edu/~eamonn/PID4481997_extend_Matrix%20Profile_I.pdf>`__
+
+    See Table II
+
+    Note that Q, T are not directly required to calculate D
+
+    Note: Unlike the Matrix Profile I paper, here, M_T, Σ_T can be calculated
+    once for all subsequences of T and passed in so the redundancy is removed
+
+    Examples
+    --------
+    >>> stumpy.mass(
+    ...     np.array([-11.1, 23.4, 79.5, 1001.0]),
+    ...     np.array([584., -11., 23., 79., 1001., 0., -19.]))
+    array([3.18792463e+00, 1.11297393e-03, 3.23874018e+00, 3.34470195e+00])
+    """
+    Q = _preprocess(Q)
+    m = Q.shape[0]
+    check_window_size(m, max_size=Q.shape[-1])
+
+    if Q.ndim == 2 and Q.shape[1] == 1:  # pragma: no cover
+        Q = Q.flatten()
+
+    if Q.ndim != 1:  # pragma: no cover
+        raise ValueError(f"Q is {Q.ndim}-dimensional and must be 1-dimensional. ")
+
+    # The FFTs of `T` are shared with later calls for the same (unmodified) `T`
+    T_key = _array_id(T, M_T is None or Σ_T is None)
+    T = _preprocess(T)
+    n = T.shape[0]
+
+    if T.ndim == 2 and T.shape[1] == 1:  # pragma: no cover
+        T = T.flatten()
+
+    if T.ndim != 1:  # pragma: no cover
+        raise ValueError(f"T is {T.ndim}-dimensional and must be 1-dimensional. ")
+
+    if m > n:  # pragma: no cover
+        raise ValueError(
+            f"The length of `Q` ({len(Q)}) must be less than or equal to "
+            f"the length of `T` ({len(T)}). "
+        )
+
+    distance_profile = np.empty(n - m + 1, dtype=np.float64)
+    if np.any(~np.isfinite(Q)):
+        distance_profile[:] = np.inf
+    else:
+        if M_T is None or Σ_T is None:
+            T, M_T, Σ_T = preprocess(T, m)
+
+        QT = sliding_dot_product(Q, T, T_key)
+        μ_Q, σ_Q = compute_mean_std(Q, m)
+        μ_Q = μ_Q[0]
+        σ_Q = σ_Q[0]
+        distance_profile[:] = _mass(Q, T, QT, μ_Q, σ_Q, M_T, Σ_T)
+
+    return distance_profile
+
+
+def _get_batch_size(nbytes_per_query, max_memory):
+    """
+    Compute the number of queries that can be processed at once while remaining
+    within `max_memory` bytes
+
+    Parameters
+    ----------
+    nbytes_per_query : int
+        The number of (temporary) bytes that are needed for each query
+
+    max_memory : int
+        The maximum number of bytes
+
+    Returns
+    -------
+    batch_size : int
+        The number of queries in each batch (at least one)
+    """
+    return max(1, int(max_memory // nbytes_per_query))
+
+
+def _preprocess_batch(Qs, T):
+    """
+    Check and pre-process a set of queries, `Qs`, and a time series, `T`, for
+    computing batches of distance profiles
+
+    Parameters
+    ----------
+    Qs : numpy.ndarray
+        A 2-dimensional array where each row is a query
+
+    T : numpy.ndarray
+        Time series or sequence
+
+    Returns
+    -------
+    Qs : numpy.ndarray
+        The 2-dimensional array of queries
+
+    T : numpy.ndarray
+        The 1-dimensional time series
+    """
+    Qs = _preprocess(Qs)
+    if Qs.ndim == 1:
+        Qs = Qs[np.newaxis, :]
+
+    if Qs.ndim != 2:  # pragma: no cover
+        raise ValueError(f"Qs is {Qs.ndim}-dimensional and must be 2-dimensional. ")
+
+    m = Qs.shape[1]
+    check_window_size(m, max_size=m)
+
+    T = _preprocess(T)
+    n = T.shape[0]
+
+    if T.ndim == 2 and T.shape[1] == 1:  # pragma: no cover
+        T = T.flatten()
+
+    if T.ndim != 1:  # pragma: no cover
+        raise ValueError(f"T is {T.ndim}-dimensional and must be 1-dimensional. ")
+
+    if m > n:  # pragma: no cover
+        raise ValueError(
+            f"The length of each query ({m}) must be less than or equal to "
+            f"the length of `T` ({n}). "
+        )
+
+    return Qs, T
+
+
+def _mass_absolute_batch(Qs, T, T_subseq_isfinite, p, max_memory):
+    """
+    Compute the non-normalized distance profile of each query in `Qs`, one batch of
+    queries at a time
+
+    Parameters
+    ----------
+    Qs : numpy.ndarray
+        A 2-dimensional array where each row is a query
+
+    T : numpy.ndarray
+        Time series or sequence. All non-finite values must be replaced by finite
+        values.
+
+    T_subseq_isfinite : numpy.ndarray
+        A boolean array that indicates whether a subsequence in `T` contains a
+        `np.nan`/`np.inf` value (False)
+
+    p : float
+        The p-norm to apply for computing the Minkowski distance.
+
+    max_memory : int
+        The maximum number of (temporary) bytes that are used for processing the
+        queries
+
+    Yields
+    ------
+    distance_profile : numpy.ndarray
+        The distance profile of the next query in `Qs`
+    """
+    k, m = Qs.shape
+    l = T.shape[0] - m + 1
+    T_subseqs = rolling_window(T, m)
+
+    # `cdist` needs a contiguous copy of the subsequences of `T`, which is made only
+    # once when it fits within (half of) `max_memory` and one chunk of subsequences
+    # at a time (for every batch) otherwise
+    chunk_size = min(l, _get_batch_size(8 * m, max_memory // 2))
+    if chunk_size == l:
+        T_subseqs = np.ascontiguousarray(T_subseqs)
+        nbytes_per_query = 8 * l
+    else:
+        # The distance profile and the distances to one chunk of subsequences
+        nbytes_per_query = 8 * (l + chunk_size)
+    batch_size = _get_batch_size(nbytes_per_query, max_memory - 8 * m * chunk_size)
+
+    for start in range(0, k, batch_size):
+        Q_batch = Qs[start : start + batch_size]
+        D_batch = np.empty((Q_batch.shape[0], l), dtype=np.float64)
+        for chunk_start in range(0, l, chunk_size):
+            chunk_stop = min(chunk_start + chunk_size, l)
+            D_batch[:, chunk_start:chunk_stop] = cdist(
+                Q_batch, T_subseqs[chunk_start:chunk_stop], metric="minkowski", p=p
+            )
+        D_batch[:, ~T_subseq_isfinite] = np.inf
+        D_batch[~np.isfinite(Q_batch).all(axis=1)] = np.inf
+        for distance_profile in D_batch:
+            yield distance_profile
+
+
+def _mass_batch(Qs, T, M_T, Σ_T, max_memory, T_key=None):
+    """
+    Compute the z-normalized distance profile of each query in `Qs` with the MASS
+    algorithm, one batch of queries at a time
+
+    The (real) FFTs of the overlapping blocks of `T` that are needed for the
+    overlap-save sliding dot product (see `_sliding_dot_product_blocked`) are
+    computed (or, when `T_key` is provided, retrieved from a cache) only once and
+    are then reused for all of the queries so that each query only requires a short
+    FFT of its own and the inverse FFTs of the blocks. If the FFTs of all of the
+    blocks do not fit within (half of) `max_memory`, they are computed one chunk of
+    blocks at a time. When a direct convolution is faster than an FFT convolution,
+    the sliding dot products are computed exactly like in `mass`.
+
+    Parameters
+    ----------
+    Qs : numpy.ndarray
+        A 2-dimensional array where each row is a query
+
+    T : numpy.ndarray
+        Time series or sequence. All non-finite values must be replaced by finite
+        values.
+
+    M_T : numpy.ndarray
+        Sliding mean of `T`
+
+    Σ_T : numpy.ndarray
+        Sliding standard deviation of `T`
+
+    max_memory : int
+        The maximum number of (temporary) bytes that are used for processing the
+        queries
+
+    T_key : tuple, default None
+        The key that identifies `T` (see `_array_id`). When provided, the FFTs of the
+        blocks of `T` are shared with later calls through a cache (see
+        `_get_rfft_blocks`).
+
+    Yields
+    ------
+    distance_profile : numpy.ndarray
+        The distance profile of the next query in `Qs`
+    """
+    k, m = Qs.shape
+    n = T.shape[0]
+    l = n - m + 1
+
+    if choose_conv_method(Qs[0, ::-1], T) == "direct":
+        # There is no FFT of `T` to share and so this is identical to `mass`
+        for Q in Qs:
+            if np.any(~np.isfinite(Q)):
+                yield np.full(l, np.inf)
+            else:
+                μ_Q, σ_Q = compute_mean_std(Q, m)
+                QT = sliding_dot_product(Q, T)
+                yield _mass(Q, T, QT, μ_Q[0], σ_Q[0], M_T, Σ_T)
+        return
+
+    L = _get_sliding_dot_product_block_size(m, n)
+    step = L - m + 1
+    n_blocks = -(-l // step)
+    workers = numba.config.NUMBA_NUM_THREADS
+
+    nbytes_per_block = 16 * (L // 2 + 1)
+    T_fft = None
+    if T_key is not None:
+        T_fft = _get_rfft_blocks(T, m, L, T_key)
+    if T_fft is None and n_blocks * nbytes_per_block <= max_memory // 2:
+        # The FFTs of the blocks are not cached but are still only computed once
+        T_fft = _rfft_blocks(T, m, L, 0, n_blocks)
+        max_memory -= T_fft.nbytes
+    if T_fft is None:
+        # Only a bounded number of blocks are transformed at a time (for every batch)
+        blocks_per_chunk = min(
+            n_blocks, _get_batch_size(nbytes_per_block, max_memory // 2)
+        )
+        max_memory -= blocks_per_chunk * nbytes_per_block
+    else:
+        blocks_per_chunk = n_blocks
+
+    # The sliding dot products as well as the complex spectra and the real inverse
+    # FFTs of one chunk of blocks
+    batch_size = _get_batch_size(
+        8 * n_blocks * step + blocks_per_chunk * (nbytes_per_block + 8 * L),
+        max_memory,
+    )
+
+    for start in range(0, k, batch_size):
+        Q_batch = Qs[start : start + batch_size]
+        Q_fft = scipy.fft.rfft(Q_batch[:, ::-1], n=L, axis=1, workers=workers)
+        QT_batch = np.empty((Q_batch.shape[0], n_blocks, step), dtype=np.float64)
+        for block_start in range(0, n_blocks, blocks_per_chunk):
+            block_stop = min(block_start + blocks_per_chunk, n_blocks)
+            if T_fft is None:
+                T_fft_chunk = _rfft_blocks(T, m, L, block_start, block_stop)
+            else:
+                T_fft_chunk = T_fft[block_start:block_stop]
+            QT_fft = Q_fft[:, np.newaxis, :] * T_fft_chunk
+            QT_batch[:, block_start:block_stop] = scipy.fft.irfft(
+                QT_fft, n=L, axis=2, workers=workers
+            )[:, :, m - 1 :]
+        QT_batch = QT_batch.reshape(Q_batch.shape[0], -1)
+
+        for i in range(Q_batch.shape[0]):
+            Q = Q_batch[i]
+            if np.any(~np.isfinite(Q)):
+                yield np.full(l, np.inf)
+            else:
+                μ_Q, σ_Q = compute_mean_std(Q, m)
+                QT = QT_batch[i, :l]
+                yield _mass(Q, T, QT, μ_Q[0], σ_Q[0], M_T, Σ_T)
+
+
+def mass_absolute_batch(
+    Qs, T, T_subseq_isfinite=None, p=2.0, max_memory=None, lazy=False
+):
+    """
+    Compute the non-normalized distance profile (i.e., without z-normalization) of
+    every query in `Qs` with the time series `T`
+
+    This is equivalent to calling `mass_absolute` for each query but the
+    subsequences of `T` are only pre-processed once and the queries are processed in
+    memory-bounded batches.
+
+    Parameters
+    ----------
+    Qs : numpy.ndarray
+        A 2-dimensional array where each row is a query of the same length
+
+    T : numpy.ndarray
+        Time series or sequence
+
+    T_subseq_isfinite : numpy.ndarray, default None
+        A boolean array that indicates whether a subsequence in `T` contains a
+        `np.nan`/`np.inf` value (False)
+
+    p : float, default 2.0
+        The p-norm to apply for computing the Minkowski distance.
+
+    max_memory : int, default None
+        The maximum number of (temporary) bytes that are used for each batch of
+        queries. When `max_memory=None`, this defaults to
+        `config.STUMPY_MASS_BATCH_MAX_MEMORY`.
+
+    lazy : bool, default False
+        When set to `True`, a generator that yields the distance profile of one query
+        at a time is returned instead of a 2-dimensional array. Since only one batch
+        of distance profiles is ever held in memory, the total memory usage is then
+        bounded by `max_memory` regardless of the number of queries (as long as the
+        distance profiles are not all kept by the caller).
+
+    Returns
+    -------
+    distance_profiles : numpy.ndarray or generator
+        A 2-dimensional array where the `i`th row is the distance profile of `Qs[i]`
+        or, when `lazy=True`, a generator that yields the distance profile of each
+        query in `Qs`, in order
+    """
+    Qs, T = _preprocess_batch(Qs, T)
+    m = Qs.shape[1]
+    if T_subseq_isfinite is None:
+        T, T_subseq_isfinite = preprocess_non_normalized(T, m)
+    else:
+        T[~np.isfinite(T)] = 0.0
+
+    if max_memory is None:
+        max_memory = config.STUMPY_MASS_BATCH_MAX_MEMORY
+
+    out = _mass_absolute_batch(Qs, T, T_subseq_isfinite, p, max_memory)
+    if lazy:
+        return out
+
+    distance_profiles = np.empty((Qs.shape[0], T.shape[0] - m + 1), dtype=np.float64)
+    for i, distance_profile in enumerate(out):
+        distance_profiles[i] = distance_profile
+
+    return distance_profiles
+
+
+@non_normalized(
+    mass_absolute_batch,
+    exclude=["normalize", "M_T", "Σ_T", "T_subseq_isfinite", "p"],
+    replace={"M_T": "T_subseq_isfinite", "Σ_T": None},
+)
+def mass_batch(
+    Qs, T, M_T=None, Σ_T=None, normalize=True, p=2.0, max_memory=None, lazy=False
+):
+    """
+    Compute the distance profile of every query in `Qs` with the time series `T`
+    using the MASS algorithm
+
+    This is equivalent to calling `mass` for each query but the FFT of `T` is only
+    computed once and is shared by all of the queries, which are processed in
+    memory-bounded batches.
+
+    Parameters
+    ----------
+    Qs : numpy.ndarray
+        A 2-dimensional array where each row is a query of the same length
+
+    T : numpy.ndarray
+        Time series or sequence
+
+    M_T : numpy.ndarray, default None
+        Sliding mean of `T`
+
+    Σ_T : numpy.ndarray, default None
+        Sliding standard deviation of `T`
+
+    normalize : bool, default True
+        When set to `True`, this z-normalizes subsequences prior to computing distances.
+        Otherwise, this function gets re-routed to its complementary non-normalized
+        equivalent set in the `@core.non_normalized` function decorator.
+
+    p : float, default 2.0
+        The p-norm to apply for computing the Minkowski distance. This parameter is
+        ignored when `normalize == True`.
+
+    max_memory : int, default None
+        The maximum number of (temporary) bytes that are used for each batch of
+        queries. When `max_memory=None`, this defaults to
+        `config.STUMPY_MASS_BATCH_MAX_MEMORY`.
+
+    lazy : bool, default False
+        When set to `True`, a generator that yields the distance profile of one query
+        at a time is returned instead of a 2-dimensional array. Since only one batch
+        of distance profiles is ever held in memory, the total memory usage is then
+        bounded by `max_memory` regardless of the number of queries (as long as the
+        distance profiles are not all kept by the caller).
+
+    Returns
+    -------
+    distance_profiles : numpy.ndarray or generator
+        A 2-dimensional array where the `i`th row is the distance profile of `Qs[i]`
+        or, when `lazy=True`, a generator that yields the distance profile of each
+        query in `Qs`, in order
 
     See Also
     --------
-    stumpy.motifs : Discover the top motifs for time series `T`
-    stumpy.match : Find all matches of a query `Q` in a time series `T```
-
-    Notes
-    -----
-    `DOI: 10.1109/ICDM.2016.0179 \
-    <https://www.cs.ucr.edu/~eamonn/PID4481997_extend_Matrix%20Profile_I.pdf>`__
-
-    See Table II
-
-    Note that Q, T are not directly required to calculate D
-
-    Note: Unlike the Matrix Profile I paper, here, M_T, Σ_T can be calculated
-    once for all subsequences of T and passed in so the redundancy is removed
+    stumpy.mass : Compute the distance profile using the MASS algorithm
+    stumpy.match_many : Find all matches of each query in `Qs` in a time series `T`
 
     Examples
     --------
-    >>> stumpy.mass(
-    ...     np.array([-11.1, 23.4, 79.5, 1001.0]),
+    >>> stumpy.mass_batch(
+    ...     np.array([[-11.1, 23.4, 79.5, 1001.0], [584., -11., 23., 79.]]),
     ...     np.array([584., -11., 23., 79., 1001., 0., -19.]))
-    array([3.18792463e+00, 1.11297393e-03, 3.23874018e+00, 3.34470195e+00])
-    """
-    Q = _preprocess(Q)
-    m = Q.shape[0]
-    check_window_size(m, max_size=Q.shape[-1])
-
-    if Q.ndim == 2 and Q.shape[1] == 1:  # pragma: no cover
-        Q = Q.flatten()
-
-    if Q.ndim != 1:  # pragma: no cover
-        raise ValueError(f"Q is {Q.ndim}-dimensional and must be 1-dimensional. ")
-
-    T = _preprocess(T)
-    n = T.shape[0]
-
-    if T.ndim == 2 and T.shape[1] == 1:  # pragma: no cover
-        T = T.flatten()
-
-    if T.ndim != 1:  # pragma: no cover
-        raise ValueError(f"T is {T.ndim}-dimensional and must be 1-dimensional. ")
+    array([[3.18792463e+00, 1.11297393e-03, 3.23874018e+00, 3.34470195e+00],
+           [0.00000000e+00, 3.18727102e+00, 3.31145704e+00, 3.28937658e+00]])
+    """
+    # All non-finite values in `T` are replaced by zero
+    T_key = _array_id(T, True)
+    Qs, T = _preprocess_batch(Qs, T)
+    m = Qs.shape[1]
+    if M_T is None or Σ_T is None:
+        T, M_T, Σ_T = preprocess(T, m)
+    else:
+        T[~np.isfinite(T)] = 0.0
 
-    if m > n:  # pragma: no cover
-        raise ValueError(
-            f"The length of `Q` ({len(Q)}) must be less than or equal to "
-            f"the length of `T` ({len(T)}). "
-        )
+    if max_memory is None:
+        max_memory = config.STUMPY_MASS_BATCH_MAX_MEMORY
 
-    distance_profile = np.empty(n - m + 1, dtype=np.float64)
-    if np.any(~np.isfinite(Q)):
-        distance_profile[:] = np.inf
-    else:
-        if M_T is None or Σ_T is None:
-            T, M_T, Σ_T = preprocess(T, m)
+    out = _mass_batch(Qs, T, M_T, Σ_T, max_memory, T_key)
+    if lazy:
+        return out
 
-        QT = sliding_dot_product(Q, T)
-        μ_Q, σ_Q = compute_mean_std(Q, m)
-        μ_Q = μ_Q[0]
-        σ_Q = σ_Q[0]
-        distance_profile[:] = _mass(Q, T, QT, μ_Q, σ_Q, M_T, Σ_T)
+    distance_profiles = np.empty((Qs.shape[0], T.shape[0] - m + 1), dtype=np.float64)
+    for i, distance_profile in enumerate(out):
+        distance_profiles[i] = distance_profile
 
-    return distance_profile
+    return distance_profiles
 
 
 def _mass_distance_matrix(Q, T, m, distance_matrix):
@@ -1842,6 +3622,42 @@ def _get_array_ranges(a, n_chunks, truncate):
     return array_ranges
 
 
+def _get_tile_ranges(a, n_tiles):
+    """
+    Given an input array of work counts, split it into (at most) `n_tiles` contiguous
+    and non-empty tiles that each contain roughly the same amount of work
+
+    Unlike `_get_array_ranges`, a single element whose work count exceeds the size of
+    a tile only consumes its own tile and the remaining elements are still split evenly
+    across the remaining tiles.
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        An array of (non-negative) work counts
+
+    n_tiles : int
+        The maximum number of tiles to split the array into
+
+    Returns
+    -------
+    tile_ranges : numpy.ndarray
+        A two column array where each row consists of a start and (exclusive) stop index
+        pair. The first column contains the start indices and the second column
+        contains the stop indices.
+    """
+    if a.shape[0] == 0 or n_tiles < 1 or a.sum() == 0:
+        return np.array([[0, a.shape[0]]], dtype=np.int64)[: a.shape[0]]
+
+    cumsum = a.cumsum() / a.sum()
+    insert = np.linspace(0, 1, n_tiles + 1)[1:-1]
+    idx = np.unique(1 + np.searchsorted(cumsum, insert))
+    idx = idx[idx < a.shape[0]]
+    bounds = np.concatenate(([0], idx, [a.shape[0]])).astype(np.int64)
+
+    return np.column_stack((bounds[:-1], bounds[1:]))
+
+
 @njit(
     # "i8[:, :](i8, i8, b1)"
 )
@@ -1954,6 +3770,481 @@ def rolling_isfinite(a, w):
     )
 
 
+def _get_PI_segments(P, I, diags_start, diags_stop, l_B, ignore_trivial):
+    """
+    Extract the rows of the (global, left, right) matrix profiles and matrix profile
+    indices that can be updated by a tile of consecutive diagonals
+
+    The diagonal `k` only contains the distances between the subsequences `i` in
+    `T_A` and `i + k` in `T_B`. So, a tile only updates a contiguous range of rows
+    and, for a self-join, another contiguous range of columns while all other rows
+    remain unchanged (i.e., `np.inf` and `-1`).
+
+    Parameters
+    ----------
+    P : numpy.ndarray
+        The matrix profiles of the tile
+
+    I : numpy.ndarray
+        The matrix profile indices of the tile
+
+    diags_start : int
+        The first diagonal of the tile
+
+    diags_stop : int
+        The (exclusive) last diagonal of the tile
+
+    l_B : int
+        The number of subsequences in `T_B`
+
+    ignore_trivial : bool
+        Set to `True` if this is a self-join (where the columns are updated as well).
+        Otherwise, for AB-join, set this to `False`.
+
+    Returns
+    -------
+    PI : list
+        A list of `(start, P, I)` segments (see `_merge_PI`)
+    """
+    l_A = P.shape[0]
+    ranges = [(max(0, -(diags_stop - 1)), min(l_A, l_B - diags_start))]
+    if ignore_trivial:
+        ranges.append((max(0, diags_start), min(l_A, l_A + diags_stop - 1)))
+
+    merged_ranges = []
+    for start, stop in sorted(ranges):
+        if stop <= start:
+            continue
+        if merged_ranges and start <= merged_ranges[-1][1]:
+            merged_ranges[-1][1] = max(merged_ranges[-1][1], stop)
+        else:
+            merged_ranges.append([start, stop])
+
+    return [
+        (start, P[start:stop].copy(), I[start:stop].copy())
+        for start, stop in merged_ranges
+    ]
+
+
+def _merge_PI(PI, PI_other):
+    """
+    Merge two partial sets of (global, left, right) matrix profiles and matrix profile
+    indices by keeping the smallest matrix profile value (and its index) in each
+    position
+
+    Each partial set is a list of `(start, P, I)` segments that are sorted by their
+    `start` and that do not overlap, where `P` and `I` are 2-D arrays that hold the
+    rows `start, start + 1, ...` of the full arrays. The columns consist of the
+    (global), left, and right matrix profiles and matrix profile indices. All of the
+    rows that are not covered by any segment have a matrix profile value of `np.inf`
+    and an index of `-1`. Ties are resolved in favor of `PI` so that the merge is
+    independent of how the diagonals were partitioned.
+
+    Parameters
+    ----------
+    PI : list
+        A list of `(start, P, I)` segments
+
+    PI_other : list
+        Another list of `(start, P, I)` segments
+
+    Returns
+    -------
+    PI : list
+        The merged list of `(start, P, I)` segments, which covers all of the rows that
+        are covered by `PI` or `PI_other`
+    """
+    # The (maximal) contiguous ranges of rows that are covered by any segment
+    ranges = []
+    for start, P, _ in sorted(PI + PI_other, key=lambda segment: segment[0]):
+        stop = start + P.shape[0]
+        if ranges and start <= ranges[-1][1]:
+            ranges[-1][1] = max(ranges[-1][1], stop)
+        else:
+            ranges.append([start, stop])
+
+    out = []
+    for start, stop in ranges:
+        P = None
+        for segments, is_first in ((PI, True), (PI_other, False)):
+            for segment_start, P_segment, I_segment in segments:
+                if not start <= segment_start < stop:
+                    continue
+                if P is None:
+                    P = np.full((stop - start,) + P_segment.shape[1:], np.inf)
+                    P = P.astype(P_segment.dtype)
+                    I = np.full((stop - start,) + I_segment.shape[1:], -1)
+                    I = I.astype(I_segment.dtype)
+                P_view = P[
+                    segment_start - start : segment_start - start + len(P_segment)
+                ]
+                I_view = I[
+                    segment_start - start : segment_start - start + len(I_segment)
+                ]
+                if is_first:
+                    # The segments of `PI` never overlap with each other
+                    P_view[:] = P_segment
+                    I_view[:] = I_segment
+                else:
+                    cond = P_segment < P_view
+                    P_view[cond] = P_segment[cond]
+                    I_view[cond] = I_segment[cond]
+        out.append((start, P, I))
+
+    return out
+
+
+def _assemble_PI(PI, l):
+    """
+    Assemble the full (global, left, right) matrix profiles and matrix profile indices
+    from a list of segments
+
+    Parameters
+    ----------
+    PI : list
+        A list of `(start, P, I)` segments (see `_merge_PI`)
+
+    l : int
+        The number of subsequences (i.e., rows)
+
+    Returns
+    -------
+    P : numpy.ndarray
+        The matrix profiles
+
+    I : numpy.ndarray
+        The matrix profile indices
+    """
+    P = np.full((l, 3), np.inf, dtype=np.float64)
+    I = np.full((l, 3), -1, dtype=np.int64)
+    for start, P_segment, I_segment in PI:
+        P[start : start + P_segment.shape[0]] = P_segment
+        I[start : start + I_segment.shape[0]] = I_segment
+
+    return P, I
+
+
+def _dask_tree_reduce(dask_client, futures, func):
+    """
+    Reduce a list of futures pairwise on a dask cluster
+
+    Neighboring futures are repeatedly combined with `func` until only a single future
+    remains so that the reduction is performed by the workers (in `O(log(n))` rounds)
+    and only the final result ever needs to be gathered by the client.
+
+    Parameters
+    ----------
+    dask_client : client
+        A Dask Distributed client that is connected to a Dask scheduler and
+        Dask workers
+
+    futures : list
+        A non-empty list of futures to reduce
+
+    func : function
+        A binary function that combines the results of two futures
+
+    Returns
+    -------
+    future : future
+        A future for the fully reduced result
+    """
+    while len(futures) > 1:
+        reduced = [
+            dask_client.submit(func, futures[i], futures[i + 1])
+            for i in range(0, len(futures) - 1, 2)
+        ]
+        if len(futures) % 2:
+            reduced.append(futures[-1])
+        futures = reduced
+
+    return futures[0]
+
+
+class _SharedArray:
+    """
+    A lightweight and picklable handle to a `numpy.ndarray` that is stored in a
+    `multiprocessing.shared_memory.SharedMemory` block
+
+    Only the name of the shared memory block, the shape, and the dtype of the array are
+    pickled and so sending a `_SharedArray` to another process is (essentially) free
+    regardless of the size of the array that it refers to.
+
+    Parameters
+    ----------
+    name : str
+        The unique name of the shared memory block
+
+    shape : tuple
+        The shape of the array
+
+    dtype : dtype
+        The dtype of the array
+
+    workers : list, default None
+        The Dask workers that own a copy of the shared memory block (one per host).
+        This is `None` when the shared memory block is owned by the current process.
+    """
+
+    def __init__(self, name, shape, dtype, workers=None):
+        self.name = name
+        self.shape = shape
+        self.dtype = np.dtype(dtype)
+        self.workers = workers
+
+    def attach(self):
+        """
+        Attach to the shared memory block and return a (zero-copy) view of the array
+
+        Returns
+        -------
+        shm : multiprocessing.shared_memory.SharedMemory
+            The shared memory block, which must be kept alive (and eventually closed)
+            for as long as the array is in use
+
+        a : numpy.ndarray
+            A view of the array that is backed by the shared memory block
+        """
+        shm = shared_memory.SharedMemory(name=self.name)
+        a = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+
+        return shm, a
+
+
+def _share_array(a):
+    """
+    Copy an array into a new shared memory block
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        The array to share
+
+    Returns
+    -------
+    shm : multiprocessing.shared_memory.SharedMemory
+        The newly created shared memory block, which is owned by the caller
+
+    handle : _SharedArray
+        A picklable handle that other processes can use to attach to the array
+    """
+    a = np.ascontiguousarray(a)
+    # A shared memory block cannot be empty
+    shm = shared_memory.SharedMemory(create=True, size=max(1, a.nbytes))
+    np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf)[...] = a
+
+    return shm, _SharedArray(shm.name, a.shape, a.dtype)
+
+
+def _run(func, args, kwargs):
+    """
+    Call `func` in a worker process after replacing every `_SharedArray` handle in
+    `args` and `kwargs` with a view of the array that it refers to
+
+    Parameters
+    ----------
+    func : function
+        The function to call
+
+    args : tuple
+        Positional arguments for `func`
+
+    kwargs : dict
+        Keyword arguments for `func`
+
+    Returns
+    -------
+    out : object
+        The output of `func`
+    """
+    shms = []
+
+    def attach(x):
+        if isinstance(x, _SharedArray):
+            shm, x = x.attach()
+            shms.append(shm)
+        return x
+
+    args = [attach(x) for x in args]
+    kwargs = {k: attach(v) for k, v in kwargs.items()}
+    try:
+        return func(*args, **kwargs)
+    finally:
+        del args, kwargs
+        for shm in shms:
+            try:
+                shm.close()
+            except BufferError:  # pragma: no cover
+                # The output still refers to the shared memory block and so it is
+                # closed once the output has been garbage collected
+                pass
+
+
+# Shared memory blocks that were created by (and must be kept alive in) this process
+_SHARED_MEMORY = {}
+
+
+def _create_shared_array(a, name):
+    """
+    Copy an array into a new shared memory block with a given name that is kept
+    alive by the current (worker) process until `_unlink_shared_array` is called
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        The array to share
+
+    name : str
+        The name of the shared memory block
+
+    Returns
+    -------
+    None
+    """
+    a = np.ascontiguousarray(a)
+    shm = shared_memory.SharedMemory(name=name, create=True, size=max(1, a.nbytes))
+    np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf)[...] = a
+    _SHARED_MEMORY[name] = shm
+
+
+def _unlink_shared_array(name):
+    """
+    Release a shared memory block that was created by `_create_shared_array`
+
+    Parameters
+    ----------
+    name : str
+        The name of the shared memory block
+
+    Returns
+    -------
+    None
+    """
+    shm = _SHARED_MEMORY.pop(name, None)
+    if shm is not None:
+        shm.close()
+        shm.unlink()
+
+
+def _dask_scatter(dask_client, a):
+    """
+    Broadcast an array to all of the Dask workers
+
+    When `config.STUMPY_DASK_SHARED_MEMORY = True`, a single copy of `a` is placed in
+    shared memory on each host (rather than one copy per worker process) and a
+    lightweight `_SharedArray` handle is returned. Since the shared memory block has
+    the same name on every host, the same handle can be used by any worker. Functions
+    that receive the handle must be submitted with `_dask_submit`.
+
+    Parameters
+    ----------
+    dask_client : client
+        A Dask Distributed client that is connected to a Dask scheduler and
+        Dask workers
+
+    a : numpy.ndarray
+        The array to broadcast
+
+    Returns
+    -------
+    future : future or _SharedArray
+        A future or shared memory handle for `a`
+    """
+    if not config.STUMPY_DASK_SHARED_MEMORY or not hasattr(
+        dask_client, "scheduler_info"
+    ):
+        return dask_client.scatter(a, broadcast=True, hash=False)
+
+    # Create the shared memory block with the first worker on each host
+    host_workers = {}
+    for worker, info in dask_client.scheduler_info()["workers"].items():
+        host_workers.setdefault(info["host"], worker)
+    workers = list(host_workers.values())
+
+    a = np.ascontiguousarray(a)
+    name = f"stumpy_{uuid.uuid4().hex[:16]}"
+    handle = _SharedArray(name, a.shape, a.dtype, workers=workers)
+
+    a_future = dask_client.scatter(a, hash=False)
+    futures = [
+        dask_client.submit(
+            _create_shared_array,
+            a_future,
+            handle.name,
+            workers=[worker],
+            allow_other_workers=False,
+            pure=False,
+        )
+        for worker in workers
+    ]
+    dask_client.gather(futures)
+    dask_client.cancel(a_future)
+
+    return handle
+
+
+def _dask_submit(dask_client, func, *args):
+    """
+    Submit a function to the Dask workers while attaching to any arrays that were
+    broadcast to shared memory by `_dask_scatter`
+
+    Parameters
+    ----------
+    dask_client : client
+        A Dask Distributed client that is connected to a Dask scheduler and
+        Dask workers
+
+    func : function
+        The function to submit
+
+    args : tuple
+        Positional arguments for `func`
+
+    Returns
+    -------
+    future : future
+        A future for the output of `func`
+    """
+    if config.STUMPY_DASK_SHARED_MEMORY:
+        return dask_client.submit(_run, func, args, {})
+    else:
+        return dask_client.submit(func, *args)
+
+
+def _dask_cancel(dask_client, future):
+    """
+    Cancel a future or release the shared memory that backs a `_SharedArray` handle
+    that was returned by `_dask_scatter`
+
+    Parameters
+    ----------
+    dask_client : client
+        A Dask Distributed client that is connected to a Dask scheduler and
+        Dask workers
+
+    future : future or _SharedArray
+        A future or shared memory handle
+
+    Returns
+    -------
+    None
+    """
+    if isinstance(future, _SharedArray) and future.workers is not None:
+        futures = [
+            dask_client.submit(
+                _unlink_shared_array,
+                future.name,
+                workers=[worker],
+                allow_other_workers=False,
+                pure=False,
+            )
+            for worker in future.workers
+        ]
+        dask_client.gather(futures)
+    else:
+        dask_client.cancel(future)
+
+
 def _get_partial_mp_func(mp_func, dask_client=None, device_id=None):
     """
     A convenience function for creating a `functools.partial` matrix profile function
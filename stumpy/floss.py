@@ -3,9 +3,13 @@
 # STUMPY is a trademark of TD Ameritrade IP Company, Inc. All rights reserved.
 
 import copy
+import os
+import uuid
 
 import numpy as np
+import scipy.special
 import scipy.stats
+from numba import njit
 
 from . import core, config
 
@@ -47,16 +51,268 @@ def _nnmark(I):
     return nnmark.cumsum()
 
 
-def _iac(
+@njit(
+    # "(i8[:], i8, i8, i8)",
+    fastmath=True,
+)
+def _arc_add(diff, i, j, value):
+    """
+    A Numba JIT-compiled function for adding `value` to the arc counts of all of the
+    positions that are crossed by an arc from `i` to `j` (i.e., `i <= x < j`)
+
+    The positions are absolute indices that are mapped onto a circular buffer with
+    `diff.shape[0]` elements so that the oldest position can be reused for the newest
+    one as the window slides.
+
+    Parameters
+    ----------
+    diff : numpy.ndarray
+        The differences of the arc counts between consecutive positions
+
+    i : int
+        The (absolute) start of the arc
+
+    j : int
+        The (absolute) stop of the arc
+
+    value : int
+        The value to add
+
+    Returns
+    -------
+    None
+    """
+    if i < j:
+        k = diff.shape[0]
+        diff[i % k] += value
+        diff[j % k] -= value
+
+
+@njit(
+    # "i8[:](i8[:], i8)",
+    fastmath=True,
+)
+def _arc_cumsum(diff, start):
+    """
+    A Numba JIT-compiled function for computing the arc counts of all of the positions
+    from the (circular) differences of the arc counts
+
+    Parameters
+    ----------
+    diff : numpy.ndarray
+        The differences of the arc counts between consecutive (circular) positions
+
+    start : int
+        The (absolute) index of the first position
+
+    Returns
+    -------
+    AC : numpy.ndarray
+        The arc curve
+    """
+    k = diff.shape[0]
+    start = start % k
+    AC = np.empty(k, dtype=np.int64)
+    total = 0
+    for i in range(start, k):
+        total += diff[i]
+        AC[i - start] = total
+    for i in range(start):
+        total += diff[i]
+        AC[k - start + i] = total
+
+    return AC
+
+
+class _ArcCounts:
+    """
+    The counts of nearest neighbor overhead crossings or arcs (i.e., the arc curve) of
+    a sliding window of subsequences
+
+    The arcs are stored as the differences of the arc counts between consecutive
+    (circular) positions. So, changing (the index of) an arc takes `O(1)` time rather
+    than re-counting all of the arcs. The arc curve itself is only materialized (in
+    `O(k)` time) when it is read after any change and so reading the arc count at any
+    single position takes `O(1)` time in between changes.
+
+    Parameters
+    ----------
+    I : numpy.ndarray
+        Matrix profile indices
+
+    Attributes
+    ----------
+    diff : numpy.ndarray
+        The differences of the arc counts between consecutive (circular) positions.
+        Any change to `diff` that is not made through `add` must be followed by
+        setting `start` so that the arc curve is materialized again.
+
+    start : int
+        The (absolute) index of the first position in the window
+
+    Methods
+    -------
+    add(i, j, value=1)
+        Add `value` to the arc counts of all of the positions that are crossed by an arc
+        from `i` to `j`
+
+    to_array()
+        Return the arc counts of all of the positions in the window
+    """
+
+    def __init__(self, I):
+        """
+        Initialize the arc counts from the matrix profile indices
+
+        Parameters
+        ----------
+        I : numpy.ndarray
+            Matrix profile indices
+        """
+        I = I.astype(np.int64)
+
+        # Replace index values that are less than zero with its own positional index
+        idx = np.argwhere(I < 0).flatten()
+        I[idx] = idx
+
+        k = I.shape[0]
+        i = np.arange(k, dtype=np.int64)
+        self.diff = np.bincount(np.minimum(i, I), minlength=k)
+        self.diff -= np.bincount(np.maximum(i, I), minlength=k)
+        self.diff = self.diff[:k].astype(np.int64)
+        self._start = 0
+        self._AC = None
+
+    @property
+    def start(self):
+        """
+        Get the (absolute) index of the first position in the window
+        """
+        return self._start
+
+    @start.setter
+    def start(self, value):
+        """
+        Set the (absolute) index of the first position in the window
+        """
+        self._start = value
+        self._AC = None
+
+    def __len__(self):
+        """
+        Return the number of positions in the window
+        """
+        return self.diff.shape[0]
+
+    def __getitem__(self, i):
+        """
+        Return the arc count at the `i`-th position in the window
+        """
+        if self._AC is None:
+            self._AC = _arc_cumsum(self.diff, self._start)
+        return self._AC[i]
+
+    def add(self, i, j, value=1):
+        """
+        Add `value` to the arc counts of all of the positions that are crossed by an arc
+        from `i` to `j` (i.e., `i <= x < j`)
+
+        Parameters
+        ----------
+        i : int
+            The (absolute) start of the arc
+
+        j : int
+            The (absolute) stop of the arc
+
+        value : int, default 1
+            The value to add
+
+        Returns
+        -------
+        None
+        """
+        _arc_add(self.diff, i, j, value)
+        self._AC = None
+
+    def to_array(self):
+        """
+        Return the arc counts of all of the positions in the window
+
+        Returns
+        -------
+        AC : numpy.ndarray
+            The arc curve
+        """
+        if self._AC is None:
+            self._AC = _arc_cumsum(self.diff, self._start)
+        return self._AC.copy()
+
+
+def _beta_fit(data, max_iter=100):
+    """
+    Fit a beta distribution with `loc=0` and `scale=1` to each row of `data` by
+    maximum likelihood
+
+    This solves the same likelihood equations as `scipy.stats.beta.fit` (with fixed
+    `floc` and `fscale`) but with Newton's method so that all of the rows are fitted
+    simultaneously.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        A 2-dimensional array where each row contains samples that lie strictly
+        between zero and one
+
+    max_iter : int, default 100
+        The maximum number of Newton iterations
+
+    Returns
+    -------
+    a : numpy.ndarray
+        The first shape parameter for each row of `data`
+
+    b : numpy.ndarray
+        The second shape parameter for each row of `data`
+    """
+    s1 = np.mean(np.log(data), axis=1)
+    s2 = np.mean(np.log1p(-data), axis=1)
+
+    # Method of moments initial guess
+    xbar = np.mean(data, axis=1)
+    fac = xbar * (1.0 - xbar) / np.var(data, axis=1) - 1.0
+    a = xbar * fac
+    b = (1.0 - xbar) * fac
+
+    for _ in range(max_iter):
+        ψ_ab = scipy.special.psi(a + b)
+        f_a = scipy.special.psi(a) - ψ_ab - s1
+        f_b = scipy.special.psi(b) - ψ_ab - s2
+
+        J_ab = -scipy.special.polygamma(1, a + b)
+        J_aa = scipy.special.polygamma(1, a) + J_ab
+        J_bb = scipy.special.polygamma(1, b) + J_ab
+        det = J_aa * J_bb - J_ab * J_ab
+
+        Δa = (J_bb * f_a - J_ab * f_b) / det
+        Δb = (J_aa * f_b - J_ab * f_a) / det
+        a -= Δa
+        b -= Δb
+
+        if np.all(np.abs(Δa) <= 1e-12 * np.abs(a)) and np.all(
+            np.abs(Δb) <= 1e-12 * np.abs(b)
+        ):
+            break
+
+    return a, b
+
+
+def _compute_iac(
     width, bidirectional=True, n_iter=1000, n_samples=1000, seed=0
 ):  # pragma: no cover
     """
-    Compute the bidirectional idealized arc curve (IAC). This is based
-    on a beta distribution that is scaled with a width that is identical
-    to the length of the matrix profile index. The height of the idealized
-    parabolic curve is assumed to be exactly half the width.
-
-    If `bidirectional=False` then the 1-dimensional IAC is computed instead.
+    Compute the bidirectional idealized arc curve (IAC) without any caching. See
+    `_iac` for details.
 
     Parameters
     ----------
@@ -76,37 +332,36 @@ def _iac(
         Number of distribution samples to draw during each iteration
 
     seed : int, default 0
-        NumPy random seed used in sampling the beta distribution. Set this to your
-        desired value for reproducibility purposes. The default value is set to `0`.
+        NumPy random seed used in sampling the beta distribution. The global NumPy
+        random state is left untouched.
 
     Returns
     -------
     IAC : numpy.ndarray
         Idealized arc curve (IAC)
     """
-    np.random.seed(seed)
+    # A local random state draws the same stream as `np.random.seed(seed)` without
+    # changing the global random state, which a cache hit would not do either
+    rng = np.random.RandomState(seed)
 
-    I = np.random.randint(0, width, size=width, dtype=np.int64)
+    I = rng.randint(0, width, size=width, dtype=np.int64)
     if bidirectional is False:  # Idealized 1-dimensional matrix profile index
         I[:-1] = width
         for i in range(width - 1):
-            I[i] = np.random.randint(i + 1, width, dtype=np.int64)
+            I[i] = rng.randint(i + 1, width, dtype=np.int64)
 
     target_AC = _nnmark(I)
 
-    params = np.empty((n_iter, 2), dtype=np.float64)
-    for i in range(n_iter):
-        hist_dist = scipy.stats.rv_histogram(
-            (target_AC, np.append(np.arange(width), width))
-        )
-        data = hist_dist.rvs(size=n_samples)
-        a, b, c, d = scipy.stats.beta.fit(data, floc=0, fscale=width)
-
-        params[i, 0] = a
-        params[i, 1] = b
+    # Drawing all of the samples at once consumes the random stream in the same
+    # order as drawing `n_samples` for each of the `n_iter` iterations
+    hist_dist = scipy.stats.rv_histogram(
+        (target_AC, np.append(np.arange(width), width))
+    )
+    data = hist_dist.rvs(size=(n_iter, n_samples), random_state=rng)
+    a, b = _beta_fit(data / width)
 
-    a_mean = np.round(np.mean(params[:, 0]), 2)
-    b_mean = np.round(np.mean(params[:, 1]), 2)
+    a_mean = np.round(np.mean(a), 2)
+    b_mean = np.round(np.mean(b), 2)
 
     IAC = scipy.stats.beta.pdf(np.arange(width), a_mean, b_mean, loc=0, scale=width)
     slope, _, _, _ = np.linalg.lstsq(IAC.reshape(-1, 1), target_AC, rcond=None)
@@ -116,6 +371,152 @@ def _iac(
     return IAC
 
 
+def _iac_fname(key):
+    """
+    Return the name of the on-disk cache file for an idealized arc curve
+
+    Parameters
+    ----------
+    key : tuple
+        The `(width, bidirectional, n_iter, n_samples, seed)` cache key
+
+    Returns
+    -------
+    fname : str
+        The full path to the cache file
+    """
+    width, bidirectional, n_iter, n_samples, seed = key
+    fname = f"iac_{width}_{int(bidirectional)}_{n_iter}_{n_samples}_{seed}.npy"
+
+    return os.path.join(config.STUMPY_IAC_CACHE_DIR, fname)
+
+
+def _load_iac(key):
+    """
+    Load an idealized arc curve from the on-disk cache
+
+    Parameters
+    ----------
+    key : tuple
+        The `(width, bidirectional, n_iter, n_samples, seed)` cache key
+
+    Returns
+    -------
+    IAC : numpy.ndarray
+        The cached idealized arc curve or `None` if it is not available
+    """
+    if config.STUMPY_IAC_CACHE_DIR is None:
+        return None
+
+    try:
+        IAC = np.load(_iac_fname(key))
+    except (OSError, ValueError):
+        return None
+
+    if IAC.shape != (key[0],):
+        return None
+
+    return IAC
+
+
+def _save_iac(key, IAC):
+    """
+    Save an idealized arc curve to the on-disk cache
+
+    The file is first written under a temporary name and then renamed so that
+    concurrent readers never see a partially written file. Failures to write are
+    ignored since the cache is only an optimization.
+
+    Parameters
+    ----------
+    key : tuple
+        The `(width, bidirectional, n_iter, n_samples, seed)` cache key
+
+    IAC : numpy.ndarray
+        The idealized arc curve
+
+    Returns
+    -------
+    None
+    """
+    if config.STUMPY_IAC_CACHE_DIR is None:
+        return
+
+    fname = _iac_fname(key)
+    tmp_fname = f"{fname}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.makedirs(config.STUMPY_IAC_CACHE_DIR, exist_ok=True)
+        with open(tmp_fname, "wb") as f:
+            np.save(f, IAC)
+        os.replace(tmp_fname, fname)
+    except OSError:
+        if os.path.exists(tmp_fname):
+            os.remove(tmp_fname)
+
+
+# Idealized arc curves keyed by their parameters
+_IAC_CACHE = core._ArrayCache(lambda: config.STUMPY_IAC_CACHE_MAX_BYTES)
+
+
+def _iac(width, bidirectional=True, n_iter=1000, n_samples=1000, seed=0):
+    """
+    Compute the bidirectional idealized arc curve (IAC). This is based
+    on a beta distribution that is scaled with a width that is identical
+    to the length of the matrix profile index. The height of the idealized
+    parabolic curve is assumed to be exactly half the width.
+
+    If `bidirectional=False` then the 1-dimensional IAC is computed instead.
+
+    Since the IAC only depends on its parameters, the results are kept in a least
+    recently used cache (see `config.STUMPY_IAC_CACHE_MAX_BYTES`) and, when
+    `config.STUMPY_IAC_CACHE_DIR` is set, are also persisted to that directory so
+    that they can be reused across sessions.
+
+    Parameters
+    ----------
+    width : int
+        The width of the bidirectional idealized arc curve. This is equal
+        to the length of the matrix profile index.
+
+    bidirectional : bool, default True
+        Flag for computing a bidirectional (`True`) or 1-dimensional (`False`)
+        idealized arc curve
+
+    n_iter : int, default 1000
+        Number of iterations to average over when determining the parameters for
+        beta distribution
+
+    n_samples : int, default 1000
+        Number of distribution samples to draw during each iteration
+
+    seed : int, default 0
+        NumPy random seed used in sampling the beta distribution. Set this to your
+        desired value for reproducibility purposes. The default value is set to `0`.
+        A local random state is seeded so the global NumPy random state is left
+        untouched regardless of whether the IAC is cached or not.
+
+    Returns
+    -------
+    IAC : numpy.ndarray
+        Idealized arc curve (IAC), which is a copy that is never shared with the
+        cache and can be freely modified
+    """
+    key = (int(width), bool(bidirectional), int(n_iter), int(n_samples), int(seed))
+
+    out = _IAC_CACHE.get(key, copy=True)
+    if out is not None:
+        return out[0]
+
+    IAC = _load_iac(key)
+    if IAC is None:
+        IAC = _compute_iac(*key)
+        _save_iac(key, IAC)
+
+    _IAC_CACHE.put(key, (IAC,), copy=True)
+
+    return IAC
+
+
 def _cac(I, L, bidirectional=True, excl_factor=5, custom_iac=None, seed=0):
     """
     Compute the corrected arc curve (CAC)
@@ -164,14 +565,41 @@ def _cac(I, L, bidirectional=True, excl_factor=5, custom_iac=None, seed=0):
     """
     k = I.shape[0]
     AC = _nnmark(I)
-    CAC = np.zeros(k, dtype=np.float64)
 
     if custom_iac is None:
         IAC = _iac(k, bidirectional, seed=seed)
     else:
         IAC = custom_iac
-    IAC[IAC == 0.0] = 10**-10  # Avoid divide by zero
-    CAC[:] = AC / IAC
+
+    return _correct_arc_curve(AC, IAC, L, excl_factor)
+
+
+def _correct_arc_curve(AC, IAC, L, excl_factor=5):
+    """
+    Correct the arc curve (AC) with the idealized arc curve (IAC)
+
+    Parameters
+    ----------
+    AC : numpy.ndarray
+        The arc curve (i.e., the counts of nearest neighbor overhead crossings or arcs)
+
+    IAC : numpy.ndarray
+        The idealized arc curve. Note that any zeros are treated as `10**-10` in order
+        to avoid dividing by zero but `IAC` itself is not modified.
+
+    L : int
+        The subsequence length that is set roughly to be one period length
+
+    excl_factor : int, default 5
+        The multiplying factor for the first and last regime exclusion zones
+
+    Returns
+    -------
+    CAC : numpy.ndarray
+        A corrected arc curve (CAC)
+    """
+    CAC = np.zeros(AC.shape[0], dtype=np.float64)
+    CAC[:] = AC / np.where(IAC == 0.0, 10**-10, IAC)  # Avoid divide by zero
     CAC[CAC > 1.0] = 1.0  # Equivalent to min
 
     if excl_factor > 0:
@@ -295,6 +723,198 @@ def fluss(I, L, n_regimes, excl_factor=5, custom_iac=None):
     return cac, regime_locs
 
 
+@njit(
+    # "(f8[:], i8, i8, b1, f8[:], f8[:], b1[:], b1[:], f8[:], f8[:], f8[:], f8[:],"
+    # "f8[:], i8[:], i8[:], i8[:], i8, i8)",
+    fastmath={"nsz", "arcp", "contract", "afn", "reassoc"},
+)
+def _update(
+    ts,
+    m,
+    excl_zone,
+    normalize,
+    T,
+    finite_T,
+    T_isfinite,
+    T_subseq_isfinite,
+    M_T,
+    Σ_T,
+    QT,
+    QT_new,
+    P,
+    I,
+    arc_diff,
+    start,
+    n_appended,
+):
+    """
+    A Numba JIT-compiled function for ingressing the new data points, `ts`, one at a
+    time, egressing the same number of the oldest data points, and updating the (right)
+    matrix profile, the (right) matrix profile indices, and the arc curve
+
+    All of the arrays (except for `QT`, `QT_new`, and `arc_diff`) are
+    buffers that hold the current window, which starts at `start` and has a fixed
+    length of `n` (or `k = n - m + 1` for the per-subsequence arrays). Each buffer must
+    have enough capacity to hold all of the data points in `ts`. Rather than
+    recomputing the sliding statistics and the distance profile (via MASS) from
+    scratch, they are updated in `O(k)` time for each new data point while each arc
+    that changes is updated in `O(log(k))` time.
+
+    Parameters
+    ----------
+    ts : numpy.ndarray
+        The new data points
+
+    m : int
+        Window size
+
+    excl_zone : int
+        The half width for the exclusion zone
+
+    normalize : bool
+        When set to `True`, this z-normalizes subsequences prior to computing distances
+
+    T : numpy.ndarray
+        The time series buffer
+
+    finite_T : numpy.ndarray
+        The time series buffer where non-finite values have been replaced with zero
+
+    T_isfinite : numpy.ndarray
+        The buffer that tracks whether each data point in `T` is finite
+
+    T_subseq_isfinite : numpy.ndarray
+        The buffer that tracks whether each subsequence in `T` is finite
+
+    M_T : numpy.ndarray
+        The sliding mean buffer
+
+    Σ_T : numpy.ndarray
+        The sliding standard deviation buffer
+
+    QT : numpy.ndarray
+        The dot product (or the squared Euclidean distance when `normalize` is `False`)
+        between the last subsequence and every subsequence in the current window
+
+    QT_new : numpy.ndarray
+        A buffer for the updated `QT`. Note that `QT` and `QT_new` are swapped after
+        each new data point
+
+    P : numpy.ndarray
+        The (right) matrix profile buffer
+
+    I : numpy.ndarray
+        The (right) matrix profile indices buffer
+
+    arc_diff : numpy.ndarray
+        The (circular) differences of the arc counts (see `_ArcCounts`)
+
+    start : int
+        The start of the current window
+
+    n_appended : int
+        The number of data points that have been egressed
+
+    Returns
+    -------
+    start : int
+        The start of the updated window
+
+    n_appended : int
+        The updated number of data points that have been egressed
+
+    Notes
+    -----
+    DOI: 10.1109/ICDM.2017.21 <https://www.cs.ucr.edu/~eamonn/Segmentation_ICDM.pdf>`__
+
+    See Section C
+    """
+    k = arc_diff.shape[0]
+    n = k + m - 1
+    # Note that the start of the exclusion zone is relative to
+    # the unchanging length of the matrix profile index
+    zone_start = max(0, k - excl_zone)
+
+    for t in ts:
+        # Egress
+        start += 1
+        n_appended += 1
+        last_idx = k - 1 + n_appended
+
+        T_window = T[start : start + n]
+        finite_T_window = finite_T[start : start + n]
+        T_isfinite_window = T_isfinite[start : start + n]
+        T_window[-1] = t
+        if np.isfinite(t):
+            T_isfinite_window[-1] = True
+        else:
+            T_isfinite_window[-1] = False
+            t = 0.0
+        finite_T_window[-1] = t
+        S = finite_T_window[k - 1 :]
+        t_drop = finite_T_window[k - 2]
+
+        Q_isfinite = np.all(T_isfinite_window[-m:])
+        T_subseq_isfinite_window = T_subseq_isfinite[start : start + k]
+        T_subseq_isfinite_window[-1] = Q_isfinite
+
+        # Ingress
+        if normalize:
+            if Q_isfinite:
+                μ_Q = np.mean(S)
+                σ_Q = np.std(S)
+            else:
+                μ_Q = np.inf
+                σ_Q = np.nan
+            M_T_window = M_T[start : start + k]
+            Σ_T_window = Σ_T[start : start + k]
+            M_T_window[-1] = μ_Q
+            Σ_T_window[-1] = σ_Q
+
+            for i in range(1, k):
+                QT_new[i] = (
+                    QT[i]
+                    - finite_T_window[i - 1] * t_drop
+                    + finite_T_window[i - 1 + m] * t
+                )
+            QT_new[0] = np.sum(finite_T_window[:m] * S)
+            D = core.calculate_distance_profile(
+                m, QT_new[:k], μ_Q, σ_Q, M_T_window, Σ_T_window
+            )
+        else:
+            for i in range(1, k):
+                QT_new[i] = (
+                    QT[i]
+                    - (finite_T_window[i - 1] - t_drop) ** 2
+                    + (finite_T_window[i - 1 + m] - t) ** 2
+                )
+            QT_new[0] = np.sum((finite_T_window[:m] - S) ** 2)
+            D = np.sqrt(np.abs(QT_new[:k]))
+
+        for i in range(k):
+            if not T_subseq_isfinite_window[i] or not Q_isfinite or i >= zone_start:
+                D[i] = np.inf
+
+        # The arc of the egressed subsequence is removed and, since the new (last)
+        # subsequence becomes the right nearest neighbor of all of the subsequences
+        # that are closer to it, their arcs are extended up to it
+        _arc_add(arc_diff, n_appended - 1, I[start - 1], -1)
+
+        P_window = P[start : start + k]
+        I_window = I[start : start + k]
+        P_window[-1] = np.inf
+        I_window[-1] = last_idx
+        for i in range(k - 1):
+            if D[i] < P_window[i]:
+                _arc_add(arc_diff, I_window[i], last_idx, 1)
+                P_window[i] = D[i]
+                I_window[i] = last_idx
+
+        QT, QT_new = QT_new, QT
+
+    return start, n_appended
+
+
 class floss:
     """
     Compute the Fast Low-cost Online Semantic Segmentation (FLOSS) for
@@ -369,6 +989,11 @@ class floss:
         the oldest single data point from `T`. Then, update the 1-dimensional corrected
         arc curve (CAC_1D) and the matrix profile.
 
+    update_many(ts)
+        Ingress multiple new data points, `ts`, onto the time series, `T`, followed by
+        egressing the same number of the oldest data points from `T`. Then, update the
+        1-dimensional corrected arc curve (CAC_1D) and the matrix profile.
+
     See Also
     --------
     stumpy.fluss : Compute the Fast Low-cost Unipotent Semantic Segmentation (FLUSS)
@@ -468,12 +1093,11 @@ class floss:
         self._normalize = normalize
         self._k = self._mp.shape[0]
         self._n = self._T.shape[0]
-        self._last_idx = self._n - self._m + 1  # Depends on the changing length of `T`
         self._n_appended = 0
+        self._excl_zone = int(np.ceil(self._m / config.STUMPY_EXCL_ZONE_DENOM))
         self._T_isfinite = np.isfinite(self._T)
         self._finite_T = self._T.copy()
         self._finite_T[~np.isfinite(self._finite_T)] = 0.0
-        self._finite_Q = self._finite_T[-self._m :].copy()
 
         if self._custom_iac is None:  # pragma: no cover
             self._custom_iac = _iac(
@@ -513,6 +1137,44 @@ class floss:
         self._mp[inf_indices, 3] = inf_indices
 
         self._cac = np.ones(self._k, dtype=np.float64) * -1
+        # The corrected arc curve is only recomputed (from the arc counts) once it is
+        # requested
+        self._cac_is_stale = False
+
+        # The sliding statistics, the dot product (or the squared distance) with the
+        # last subsequence, and the arc curve are all updated incrementally
+        self._T_subseq_isfinite = core.rolling_isfinite(self._T_isfinite, self._m)
+        Q = self._finite_T[-self._m :]
+        if self._normalize:
+            self._M_T, self._Σ_T = core.compute_mean_std(self._T, self._m)
+            self._QT = core.sliding_dot_product(Q, self._finite_T)
+        else:
+            self._M_T = np.zeros(self._k, dtype=np.float64)
+            self._Σ_T = np.zeros(self._k, dtype=np.float64)
+            self._QT = np.square(core.mass_absolute(Q, self._finite_T))
+        self._P = self._mp[:, 0].astype(np.float64)
+        self._I = self._mp[:, 3].astype(np.int64)
+        self._arc_counts = _ArcCounts(self._I)
+
+        # The state is stored in buffers and each private attribute (e.g., `self._T`)
+        # is a view of the current window within its buffer. The buffers have
+        # `self._n` elements of slack so that the oldest data point is egressed by
+        # advancing a head offset, `self._head`, rather than by shifting every array.
+        capacity = 2 * self._n
+        self._head = 0
+        self._T_buffer = core._grow_buffer(self._T, capacity)
+        self._finite_T_buffer = core._grow_buffer(self._finite_T, capacity)
+        self._T_isfinite_buffer = core._grow_buffer(self._T_isfinite, capacity)
+        self._T_subseq_isfinite_buffer = core._grow_buffer(
+            self._T_subseq_isfinite, capacity - self._m + 1
+        )
+        self._M_T_buffer = core._grow_buffer(self._M_T, capacity - self._m + 1)
+        self._Σ_T_buffer = core._grow_buffer(self._Σ_T, capacity - self._m + 1)
+        self._P_buffer = core._grow_buffer(self._P, capacity - self._m + 1)
+        self._I_buffer = core._grow_buffer(self._I, capacity - self._m + 1)
+        self._QT_buffer = self._QT
+        self._QT_new_buffer = np.empty(self._k, dtype=np.float64)
+        self._set_views()
 
     def update(self, t):
         """
@@ -535,65 +1197,132 @@ class floss:
         This is the implementation for Fast Low-cost Online Semantic
         Segmentation (FLOSS).
         """
-        self._T[:-1] = self._T[1:]
-        self._T_isfinite[:-1] = self._T_isfinite[1:]
-        self._finite_T[:-1] = self._finite_T[1:]
-        self._finite_Q[:-1] = self._finite_Q[1:]
-        self._T[-1] = t
-        self._T_isfinite[-1] = np.isfinite(t)
-        self._finite_T[-1] = t
-        if not np.isfinite(t):
-            self._finite_T[-1] = 0.0
-        self._finite_Q[-1] = self._finite_T[-1]
-        excl_zone = int(np.ceil(self._m / config.STUMPY_EXCL_ZONE_DENOM))
-        # Note that the start of the exclusion zone is relative to
-        # the unchanging length of the matrix profile index
-        zone_start = max(0, self._k - excl_zone)
+        self._update(np.array([t], dtype=np.float64))
+        self._cac_is_stale = True
 
-        # Egress
-        # Remove the first element in the matrix profile index
-        # Shift mp up by one and replace the last row with new values
-        self._mp[:-1, :] = self._mp[1:, :]
-        self._mp[-1, 0] = np.inf
-        self._mp[-1, 3] = self._last_idx
+    def update_many(self, ts):
+        """
+        Ingress multiple new data points, `ts`, onto the time series, `T`, followed by
+        egressing the same number of the oldest data points from `T`. Then, update the
+        1-dimensional corrected arc curve (CAC_1D) and the matrix profile.
 
-        # Ingress
-        if self._normalize:
-            M_T, Σ_T = core.compute_mean_std(self._T, self._m)
-            D = core.mass(self._finite_Q, self._finite_T, M_T, Σ_T)
-        else:
-            D = core.mass_absolute(self._T[-self._m :], self._T)
+        This produces the same result as calling `update` for each data point in `ts`
+        but all of the data points are ingested in a single Numba JIT-compiled pass and
+        the corrected arc curve is only recomputed once for the whole batch.
 
-        D[zone_start:] = np.inf
+        Parameters
+        ----------
+        ts : numpy.ndarray
+            The new data points to be appended to `T`
+        """
+        ts = np.asarray(ts, dtype=np.float64)
+        if ts.ndim != 1:  # pragma: no cover
+            raise ValueError(f"`ts` is {ts.ndim}-dimensional and must be 1-dimensional")
+        self._update(ts)
 
-        T_subseq_isfinite = core.rolling_isfinite(self._T_isfinite, self._m)
+        if ts.shape[0] > 0:
+            self._cac_is_stale = True
 
-        D[~T_subseq_isfinite] = np.inf
-        if not T_subseq_isfinite[-1]:
-            D[:] = np.inf
+    def _update(self, ts):
+        """
+        Ingress the new data points, `ts`, egress the same number of the oldest data
+        points, and update the matrix profile and the arc curve (but not the corrected
+        arc curve)
+        """
+        max_chunk_size = self._n  # The number of elements of slack
+        for chunk_start in range(0, ts.shape[0], max_chunk_size):
+            chunk = ts[chunk_start : chunk_start + max_chunk_size]
+            if self._head + self._n + chunk.shape[0] > len(self._T_buffer):
+                self._compact_buffers()
+
+            self._head, self._n_appended = _update(
+                chunk,
+                self._m,
+                self._excl_zone,
+                self._normalize,
+                self._T_buffer,
+                self._finite_T_buffer,
+                self._T_isfinite_buffer,
+                self._T_subseq_isfinite_buffer,
+                self._M_T_buffer,
+                self._Σ_T_buffer,
+                self._QT_buffer,
+                self._QT_new_buffer,
+                self._P_buffer,
+                self._I_buffer,
+                self._arc_counts.diff,
+                self._head,
+                self._n_appended,
+            )
+            if chunk.shape[0] % 2 == 1:
+                self._QT_buffer, self._QT_new_buffer = (
+                    self._QT_new_buffer,
+                    self._QT_buffer,
+                )
 
-        # Update nearest neighbor for old data if any old subsequences
-        # are closer to the newly arrived subsequence
-        update_idx = np.argwhere(D < self._mp[:, 0]).flatten()
-        self._mp[update_idx, 0] = D[update_idx]
-        self._mp[update_idx, 3] = self._last_idx
+        # This also marks the arc curve as changed (see `_ArcCounts`)
+        self._arc_counts.start = self._n_appended
+        self._set_views()
 
-        self._cac[:] = _cac(
-            self._mp[:, 3] - self._n_appended - 1,
+    def _compact_buffers(self):
+        """
+        Move the current window of each buffer back to the start of its buffer
+
+        This only happens once every `self._n` ingested data points and so each data
+        point is copied a constant (amortized) number of times.
+        """
+        n = self._n
+        k = self._k
+        start = self._head
+        self._T_buffer[:n] = self._T_buffer[start : start + n]
+        self._finite_T_buffer[:n] = self._finite_T_buffer[start : start + n]
+        self._T_isfinite_buffer[:n] = self._T_isfinite_buffer[start : start + n]
+        self._T_subseq_isfinite_buffer[:k] = self._T_subseq_isfinite_buffer[
+            start : start + k
+        ]
+        self._M_T_buffer[:k] = self._M_T_buffer[start : start + k]
+        self._Σ_T_buffer[:k] = self._Σ_T_buffer[start : start + k]
+        self._P_buffer[:k] = self._P_buffer[start : start + k]
+        self._I_buffer[:k] = self._I_buffer[start : start + k]
+        self._head = 0
+        self._set_views()
+
+    def _set_views(self):
+        """
+        Set each private attribute to a view of the current window within its buffer
+        """
+        n = self._n
+        k = self._k
+        start = self._head
+        self._T = self._T_buffer[start : start + n]
+        self._finite_T = self._finite_T_buffer[start : start + n]
+        self._T_isfinite = self._T_isfinite_buffer[start : start + n]
+        self._T_subseq_isfinite = self._T_subseq_isfinite_buffer[start : start + k]
+        self._M_T = self._M_T_buffer[start : start + k]
+        self._Σ_T = self._Σ_T_buffer[start : start + k]
+        self._P = self._P_buffer[start : start + k]
+        self._I = self._I_buffer[start : start + k]
+        self._QT = self._QT_buffer[:k]
+
+    def _update_cac(self):
+        """
+        Update the 1-dimensional corrected arc curve (CAC_1D) from the arc counts
+        """
+        self._cac[:] = _correct_arc_curve(
+            self._arc_counts.to_array(),
+            self._custom_iac,
             self._L,
-            bidirectional=False,
             excl_factor=self._excl_factor,
-            custom_iac=self._custom_iac,
         )
-
-        self._last_idx += 1
-        self._n_appended += 1
+        self._cac_is_stale = False
 
     @property
     def cac_1d_(self):
         """
         Get the updated 1-dimensional corrected arc curve (CAC_1D)
         """
+        if self._cac_is_stale:
+            self._update_cac()
         return self._cac.astype(np.float64)
 
     @property
@@ -601,14 +1330,14 @@ class floss:
         """
         Get the updated matrix profile
         """
-        return self._mp[:, 0].astype(np.float64)
+        return self._P.astype(np.float64)
 
     @property
     def I_(self):
         """
         Get the updated (right) matrix profile indices
         """
-        return self._mp[:, 3].astype(np.int64)
+        return self._I.astype(np.int64)
 
     @property
     def T_(self):
@@ -339,7 +339,7 @@ def _gpu_aamp(
     return profile_fname, indices_fname
 
 
-def gpu_aamp(T_A, m, T_B=None, ignore_trivial=True, device_id=0, p=2.0):
+def gpu_aamp(T_A, m, T_B=None, ignore_trivial=True, device_id=0, p=2.0, typed=None):
     """
     Compute the non-normalized (i.e., without z-normalization) matrix profile with one
     or more GPU devices
@@ -373,15 +373,27 @@ def gpu_aamp(T_A, m, T_B=None, ignore_trivial=True, device_id=0, p=2.0):
         executing `[device.id for device in numba.cuda.list_devices()]`.
 
     p : float, default 2.0
-        The p-norm to apply for computing the Minkowski distance.
+        The p-norm to apply for computing the Minkowski distance, which must be
+        finite.
+
+    typed : bool, default None
+        When set to `True`, a `MatrixProfile` named tuple is returned where the
+        (global) matrix profile, `P`, the left matrix profile, `left_P`, and the right
+        matrix profile, `right_P`, are stored in floating point arrays alongside their
+        corresponding integer matrix profile indices (i.e., `I`, `left_I`, and
+        `right_I`). When set to `False`, the left and right matrix profiles are
+        discarded and a `numpy.ndarray` with `dtype=object` is returned. The default
+        value of `None` defers to `config.STUMPY_TYPED_OUTPUT`.
 
     Returns
     -------
-    out : numpy.ndarray
+    out : numpy.ndarray or MatrixProfile
         The first column consists of the matrix profile, the second column
         consists of the matrix profile indices, the third column consists of
         the left matrix profile indices, and the fourth column consists of
-        the right matrix profile indices.
+        the right matrix profile indices. When `typed=True`, a `MatrixProfile` named
+        tuple with fields `P`, `I`, `left_P`, `left_I`, `right_P`, and `right_I` is
+        returned instead.
 
     Notes
     -----
@@ -397,6 +409,7 @@ def gpu_aamp(T_A, m, T_B=None, ignore_trivial=True, device_id=0, p=2.0):
 
     See Table II, Figure 5, and Figure 6
     """
+    core.check_finite_p(p)
     if T_B is None:  # Self join!
         T_B = T_A
         ignore_trivial = True
@@ -561,4 +574,9 @@ def gpu_aamp(T_A, m, T_B=None, ignore_trivial=True, device_id=0, p=2.0):
         logger.warning(f"A large number of values are smaller than {threshold}.")
         logger.warning("For a self-join, try setting `ignore_trivial = True`.")
 
+    if typed is None:
+        typed = config.STUMPY_TYPED_OUTPUT
+    if typed:
+        return core._matrix_profile(profile[0], indices[0])
+
     return out
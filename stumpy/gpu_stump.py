@@ -374,7 +374,14 @@ def _gpu_stump(
 
 @core.non_normalized(gpu_aamp)
 def gpu_stump(
-    T_A, m, T_B=None, ignore_trivial=True, device_id=0, normalize=True, p=2.0
+    T_A,
+    m,
+    T_B=None,
+    ignore_trivial=True,
+    device_id=0,
+    normalize=True,
+    p=2.0,
+    typed=None,
 ):
     """
     Compute the z-normalized matrix profile with one or more GPU devices
@@ -417,13 +424,24 @@ def gpu_stump(
         The p-norm to apply for computing the Minkowski distance. This parameter is
         ignored when `normalize == True`.
 
+    typed : bool, default None
+        When set to `True`, a `MatrixProfile` named tuple is returned where the
+        (global) matrix profile, `P`, the left matrix profile, `left_P`, and the right
+        matrix profile, `right_P`, are stored in floating point arrays alongside their
+        corresponding integer matrix profile indices (i.e., `I`, `left_I`, and
+        `right_I`). When set to `False`, the left and right matrix profiles are
+        discarded and a `numpy.ndarray` with `dtype=object` is returned. The default
+        value of `None` defers to `config.STUMPY_TYPED_OUTPUT`.
+
     Returns
     -------
-    out : numpy.ndarray
+    out : numpy.ndarray or MatrixProfile
         The first column consists of the matrix profile, the second column
         consists of the matrix profile indices, the third column consists of
         the left matrix profile indices, and the fourth column consists of
-        the right matrix profile indices.
+        the right matrix profile indices. When `typed=True`, a `MatrixProfile` named
+        tuple with fields `P`, `I`, `left_P`, `left_I`, `right_P`, and `right_I` is
+        returned instead.
 
     See Also
     --------
@@ -643,4 +661,9 @@ def gpu_stump(
         logger.warning(f"A large number of values are smaller than {threshold}.")
         logger.warning("For a self-join, try setting `ignore_trivial = True`.")
 
+    if typed is None:
+        typed = config.STUMPY_TYPED_OUTPUT
+    if typed:
+        return core._matrix_profile(profile[0], indices[0])
+
     return out
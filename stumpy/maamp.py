@@ -668,15 +668,15 @@ def _compute_multi_p_norm(
                 # Even
                 p_norm_even[i, j] = (
                     p_norm_odd[i, j - 1]
-                    - abs(T[i, idx - 1] - T[i, j - 1]) ** p
-                    + abs(T[i, idx + m - 1] - T[i, j + m - 1]) ** p
+                    - core._abs_pow(T[i, idx - 1] - T[i, j - 1], p)
+                    + core._abs_pow(T[i, idx + m - 1] - T[i, j + m - 1], p)
                 )
             else:
                 # Odd
                 p_norm_odd[i, j] = (
                     p_norm_even[i, j - 1]
-                    - abs(T[i, idx - 1] - T[i, j - 1]) ** p
-                    + abs(T[i, idx + m - 1] - T[i, j + m - 1]) ** p
+                    - core._abs_pow(T[i, idx - 1] - T[i, j - 1], p)
+                    + core._abs_pow(T[i, idx + m - 1] - T[i, j + m - 1], p)
                 )
 
         if idx % 2 == 0:
@@ -883,7 +883,8 @@ def maamp(T, m, include=None, discords=False, p=2.0):
         in `include` are still maintained and respected.
 
     p : float, default 2.0
-        The p-norm to apply for computing the Minkowski distance.
+        The p-norm to apply for computing the Minkowski distance, which must be
+        finite.
 
     Returns
     -------
@@ -903,6 +904,7 @@ def maamp(T, m, include=None, discords=False, p=2.0):
 
     See mSTAMP Algorithm
     """
+    core.check_finite_p(p)
     T_A = T
     T_B = T_A
 
@@ -29,6 +29,8 @@ def maamped(dask_client, T, m, include=None, discords=False, p=2.0):
         Dask workers. Setting up a Dask distributed cluster is beyond the
         scope of this library. Please refer to the Dask Distributed
         documentation.
+        Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+        the work across local processes without a Dask scheduler.
 
     T : numpy.ndarray
         The time series or sequence for which to compute the multi-dimensional
@@ -54,7 +56,8 @@ def maamped(dask_client, T, m, include=None, discords=False, p=2.0):
         in `include` are still maintained and respected.
 
     p : float, default 2.0
-        The p-norm to apply for computing the Minkowski distance.
+        The p-norm to apply for computing the Minkowski distance, which must be
+        finite.
 
     Returns
     -------
@@ -74,6 +77,7 @@ def maamped(dask_client, T, m, include=None, discords=False, p=2.0):
 
     See mSTAMP Algorithm
     """
+    core.check_finite_p(p)
     T_A = T
     T_B = T_A
 
@@ -117,13 +121,9 @@ def maamped(dask_client, T, m, include=None, discords=False, p=2.0):
         )
 
     # Scatter data to Dask cluster
-    T_A_future = dask_client.scatter(T_A, broadcast=True, hash=False)
-    T_A_subseq_isfinite_future = dask_client.scatter(
-        T_A_subseq_isfinite, broadcast=True, hash=False
-    )
-    T_B_subseq_isfinite_future = dask_client.scatter(
-        T_B_subseq_isfinite, broadcast=True, hash=False
-    )
+    T_A_future = core._dask_scatter(dask_client, T_A)
+    T_A_subseq_isfinite_future = core._dask_scatter(dask_client, T_A_subseq_isfinite)
+    T_B_subseq_isfinite_future = core._dask_scatter(dask_client, T_B_subseq_isfinite)
 
     p_norm_futures = []
     p_norm_first_futures = []
@@ -144,7 +144,8 @@ def maamped(dask_client, T, m, include=None, discords=False, p=2.0):
         stop = min(k, start + step)
 
         futures.append(
-            dask_client.submit(
+            core._dask_submit(
+                dask_client,
                 _maamp,
                 T_A_future,
                 m,
@@ -168,9 +169,9 @@ def maamped(dask_client, T, m, include=None, discords=False, p=2.0):
         P[:, start + 1 : stop], I[:, start + 1 : stop] = results[i]
 
     # Delete data from Dask cluster
-    dask_client.cancel(T_A_future)
-    dask_client.cancel(T_A_subseq_isfinite_future)
-    dask_client.cancel(T_B_subseq_isfinite_future)
+    core._dask_cancel(dask_client, T_A_future)
+    core._dask_cancel(dask_client, T_A_subseq_isfinite_future)
+    core._dask_cancel(dask_client, T_B_subseq_isfinite_future)
     for p_norm_future in p_norm_futures:
         dask_client.cancel(p_norm_future)
     for p_norm_first_future in p_norm_first_futures:
@@ -0,0 +1,449 @@
+# STUMPY
+# Copyright 2019 TD Ameritrade. Released under the terms of the 3-Clause BSD license.
+# STUMPY is a trademark of TD Ameritrade IP Company, Inc. All rights reserved.
+
+import logging
+
+import numba
+import numpy as np
+from numba import njit
+
+from . import core, config
+from .stump import _compute_diagonal, _compute_cov_terms
+
+logger = logging.getLogger(__name__)
+
+
+@njit(
+    # "(f8[:], f8[:], i8, f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], b1[:], b1[:],"
+    # "b1[:], b1[:], i8[:], i8, i8, b1)",
+    fastmath=True,
+)
+def _mmap_stump_tile(
+    T_A,
+    T_B,
+    m,
+    M_T,
+    μ_Q,
+    Σ_T_inverse,
+    σ_Q_inverse,
+    M_T_m_1,
+    μ_Q_m_1,
+    T_A_subseq_isfinite,
+    T_B_subseq_isfinite,
+    T_A_subseq_isconstant,
+    T_B_subseq_isconstant,
+    diags,
+    T_A_offset,
+    T_B_offset,
+    ignore_trivial,
+):
+    """
+    A Numba JIT-compiled function for computing the Pearson correlations between all
+    of the subsequences in a piece of `T_A` and all of the subsequences in a piece of
+    `T_B` (i.e., a single tile of the full distance matrix) in parallel
+
+    Parameters
+    ----------
+    T_A : numpy.ndarray
+        A piece of the time series or sequence for which to compute the matrix profile
+
+    T_B : numpy.ndarray
+        A piece of the time series or sequence that will be used to annotate T_A
+
+    m : int
+        Window size
+
+    M_T : numpy.ndarray
+        Sliding mean of `T_B`
+
+    μ_Q : numpy.ndarray
+        Sliding mean of `T_A`
+
+    Σ_T_inverse : numpy.ndarray
+        Inverse sliding standard deviation of `T_B`
+
+    σ_Q_inverse : numpy.ndarray
+        Inverse sliding standard deviation of `T_A`
+
+    M_T_m_1 : numpy.ndarray
+        Sliding mean of `T_B` using a window size of `m-1`
+
+    μ_Q_m_1 : numpy.ndarray
+        Sliding mean of `T_A` using a window size of `m-1`
+
+    T_A_subseq_isfinite : numpy.ndarray
+        A boolean array that indicates whether a subsequence in `T_A` contains a
+        `np.nan`/`np.inf` value (False)
+
+    T_B_subseq_isfinite : numpy.ndarray
+        A boolean array that indicates whether a subsequence in `T_B` contains a
+        `np.nan`/`np.inf` value (False)
+
+    T_A_subseq_isconstant : numpy.ndarray
+        A boolean array that indicates whether a subsequence in `T_A` is constant (True)
+
+    T_B_subseq_isconstant : numpy.ndarray
+        A boolean array that indicates whether a subsequence in `T_B` is constant (True)
+
+    diags : numpy.ndarray
+        The diagonal indices (relative to the pieces `T_A` and `T_B`)
+
+    T_A_offset : int
+        The index of the first subsequence in `T_A` relative to the full time series
+
+    T_B_offset : int
+        The index of the first subsequence in `T_B` relative to the full time series
+
+    ignore_trivial : bool
+        Set to `True` if this is a self-join. Otherwise, for AB-join, set this to
+        `False`.
+
+    Returns
+    -------
+    ρ_A : numpy.ndarray
+        The (best) Pearson correlations for the subsequences in `T_A`. The columns
+        correspond to the matrix profile, the left matrix profile, and the right
+        matrix profile, respectively.
+
+    I_A : numpy.ndarray
+        The (global) matrix profile indices for the subsequences in `T_A`
+
+    ρ_B : numpy.ndarray
+        The (best) Pearson correlations for the subsequences in `T_B`. This is empty
+        when `ignore_trivial = False`.
+
+    I_B : numpy.ndarray
+        The (global) matrix profile indices for the subsequences in `T_B`. This is
+        empty when `ignore_trivial = False`.
+    """
+    n_A = T_A.shape[0]
+    n_B = T_B.shape[0]
+    l_A = n_A - m + 1
+    if ignore_trivial:
+        l_B = n_B - m + 1
+    else:
+        l_B = 0
+    ρ_A = np.full((l_A, 3), -np.inf, dtype=np.float64)
+    I_A = np.full((l_A, 3), -1, dtype=np.int64)
+    ρ_B = np.full((l_B, 3), -np.inf, dtype=np.float64)
+    I_B = np.full((l_B, 3), -1, dtype=np.int64)
+
+    cov_a, cov_b, cov_c, cov_d = _compute_cov_terms(T_A, T_B, m, M_T_m_1, μ_Q_m_1)
+
+    _compute_diagonal(
+        T_A,
+        T_B,
+        m,
+        M_T,
+        μ_Q,
+        Σ_T_inverse,
+        σ_Q_inverse,
+        cov_a,
+        cov_b,
+        cov_c,
+        cov_d,
+        T_A_subseq_isfinite,
+        T_B_subseq_isfinite,
+        T_A_subseq_isconstant,
+        T_B_subseq_isconstant,
+        diags,
+        ρ_A,
+        I_A,
+        ρ_B,
+        I_B,
+        T_A_offset,
+        T_B_offset,
+        ignore_trivial,
+    )
+
+    return ρ_A, I_A, ρ_B, I_B
+
+
+def _get_mmap_tile_size(m, max_memory):
+    """
+    Estimate the largest number of subsequences per tile that allows the working set
+    of `mmap_stump` to remain within `max_memory` bytes
+
+    Parameters
+    ----------
+    m : int
+        Window size
+
+    max_memory : int
+        The (approximate) maximum number of bytes that may be used for processing a
+        single tile
+
+    Returns
+    -------
+    tile_size : int
+        The number of subsequences (i.e., the height and the width) of each tile
+    """
+    # Every thread of `_compute_diagonal` has a private (tile_height, 3) float64/int64
+    # pair for its row updates and another one for its column updates
+    n_threads = numba.config.NUMBA_NUM_THREADS
+    nbytes_per_thread = 2 * config.STUMPY_DIAGONAL_TILE_HEIGHT * 3 * 16
+
+    # For both the row piece and the column piece of a tile, there are ~12 float64
+    # preprocessing/covariance arrays, one (l, 3) float64/int64 pair, and ~4 int64
+    # or float64 arrays with one element per diagonal (i.e., the diagonal indices,
+    # their ranks, covariances, and number of distances). Finally, there are a few
+    # (l, 3) float64/int64 pairs for merging results.
+    nbytes_per_subseq = 2 * (12 * 8 + 3 * 16 + 4 * 8) + 4 * 3 * 16
+    tile_size = int((max_memory - n_threads * nbytes_per_thread) // nbytes_per_subseq)
+
+    return max(m, tile_size)
+
+
+def _merge_mmap_stump(P, I, start, ρ, I_tile, m):
+    """
+    Convert the Pearson correlations of a single tile into distances and merge them
+    (inplace) with the distances that are already stored in `P` (and the indices that
+    are already stored in `I`)
+
+    Parameters
+    ----------
+    P : numpy.ndarray
+        The (global) matrix profile, left matrix profile, and right matrix profile
+
+    I : numpy.ndarray
+        The (global) matrix profile indices, left matrix profile indices, and right
+        matrix profile indices
+
+    start : int
+        The (global) index of the first subsequence in the tile
+
+    ρ : numpy.ndarray
+        The Pearson correlations of the tile
+
+    I_tile : numpy.ndarray
+        The (global) matrix profile indices of the tile
+
+    m : int
+        Window size
+
+    Returns
+    -------
+    None
+    """
+    stop = start + ρ.shape[0]
+    p_norm = np.abs(2 * m * (1 - ρ))
+    p_norm[p_norm < config.STUMPY_P_NORM_THRESHOLD] = 0.0
+    P_tile = np.sqrt(p_norm)
+
+    P_view = P[start:stop]
+    I_view = I[start:stop]
+    cond = P_tile < P_view
+    P_view[cond] = P_tile[cond]
+    I_view[cond] = I_tile[cond]
+
+
+def mmap_stump(T_A, m, P, I, T_B=None, ignore_trivial=True, max_memory=None):
+    """
+    Compute the z-normalized matrix profile for a time series that does not fit in
+    memory
+
+    This is an out-of-core convenience wrapper around the Numba JIT-compiled
+    parallelized `_mmap_stump_tile` function, which computes the matrix profile
+    according to STOMPopt with Pearson correlations. Rather than preprocessing the
+    full time series, the distance matrix is traversed one tile at a time and only
+    the pieces of `T_A` and `T_B` that are needed for the current tile are read and
+    preprocessed. Results are written directly into `P` and `I`, which are typically
+    `numpy.memmap` arrays.
+
+    Parameters
+    ----------
+    T_A : numpy.ndarray
+        The time series or sequence for which to compute the matrix profile. This is
+        typically a (read-only) `numpy.memmap` array.
+
+    m : int
+        Window size
+
+    P : numpy.ndarray
+        A writeable `np.float64` array with shape `(T_A.shape[0] - m + 1, 3)`
+        (typically a `numpy.memmap` array) that will be filled with the matrix profile,
+        the left matrix profile, and the right matrix profile, respectively
+
+    I : numpy.ndarray
+        A writeable `np.int64` array with shape `(T_A.shape[0] - m + 1, 3)`
+        (typically a `numpy.memmap` array) that will be filled with the matrix profile
+        indices, the left matrix profile indices, and the right matrix profile indices,
+        respectively
+
+    T_B : numpy.ndarray, default None
+        The time series or sequence that will be used to annotate T_A. For every
+        subsequence in T_A, its nearest neighbor in T_B will be recorded. Default is
+        `None` which corresponds to a self-join.
+
+    ignore_trivial : bool, default True
+        Set to `True` if this is a self-join. Otherwise, for AB-join, set this
+        to `False`. Default is `True`.
+
+    max_memory : int, default None
+        The (approximate) maximum number of bytes to use for processing any single tile.
+        This determines the size of each tile and, along with the pages that are
+        cached by the operating system, bounds the peak memory usage. When set to
+        `None`, the value of `config.STUMPY_MMAP_MAX_MEMORY` is used.
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    stumpy.stump : Compute the z-normalized matrix profile
+    stumpy.stumped : Compute the z-normalized matrix profile with a distributed dask
+        cluster
+
+    Notes
+    -----
+    `DOI: 10.1007/s10115-017-1138-x \
+    <https://www.cs.ucr.edu/~eamonn/ten_quadrillion.pdf>`__
+
+    See Section 4.5
+
+    The above reference outlines a general approach for traversing the distance
+    matrix in a diagonal fashion rather than in a row-wise fashion.
+
+    `DOI: 10.1145/3357223.3362721 \
+    <https://www.cs.ucr.edu/~eamonn/public/GPU_Matrix_profile_VLDB_30DraftOnly.pdf>`__
+
+    See Section 3.1 and Section 3.3
+
+    The above reference outlines the use of the Pearson correlation via Welford's
+    centered sum-of-products along each diagonal of the distance matrix in place of the
+    sliding window dot product found in the original STOMP method.
+
+    For self-joins, only the tiles that are on or above the main diagonal of the
+    distance matrix are computed and, within each tile, both the rows and the columns
+    are updated. For AB-joins, every tile is computed but only the rows are updated.
+
+    Note that left and right matrix profiles are only available for self-joins.
+
+    Examples
+    --------
+    >>> import stumpy
+    >>> T = np.array([584., -11., 23., 79., 1001., 0., -19.])
+    >>> P = np.empty((5, 3), dtype=np.float64)
+    >>> I = np.empty((5, 3), dtype=np.int64)
+    >>> stumpy.mmap_stump(T, 3, P, I)
+    >>> P[:, 0]
+    array([0.11633857, 2.69407392, 3.00009263, 2.69407392, 0.11633857])
+    >>> I
+    array([[ 4, -1,  4],
+           [ 3, -1,  3],
+           [ 0,  0,  4],
+           [ 1,  1, -1],
+           [ 0,  0, -1]])
+    """
+    if T_B is None:
+        T_B = T_A
+        ignore_trivial = True
+
+    T_A = np.asarray(core.transpose_dataframe(T_A))
+    T_B = np.asarray(core.transpose_dataframe(T_B))
+    core.check_dtype(T_A)
+    core.check_dtype(T_B)
+
+    if T_A.ndim != 1:  # pragma: no cover
+        raise ValueError(f"T_A is {T_A.ndim}-dimensional and must be 1-dimensional. ")
+
+    if T_B.ndim != 1:  # pragma: no cover
+        raise ValueError(f"T_B is {T_B.ndim}-dimensional and must be 1-dimensional. ")
+
+    core.check_window_size(m, max_size=min(T_A.shape[0], T_B.shape[0]))
+
+    l_A = T_A.shape[0] - m + 1
+    l_B = T_B.shape[0] - m + 1
+    if ignore_trivial and l_A != l_B:  # pragma: no cover
+        raise ValueError(
+            "For a self-join, `T_A` and `T_B` must have the same length. "
+            "Try setting `ignore_trivial = False`."
+        )
+
+    if P.shape != (l_A, 3) or I.shape != (l_A, 3):
+        raise ValueError(f"`P` and `I` must both have a shape of {(l_A, 3)}")
+    core.check_dtype(P, dtype=np.float64)
+    core.check_dtype(I, dtype=np.int64)
+
+    if max_memory is None:
+        max_memory = config.STUMPY_MMAP_MAX_MEMORY
+    tile_size = _get_mmap_tile_size(m, max_memory)
+    excl_zone = int(np.ceil(m / config.STUMPY_EXCL_ZONE_DENOM))
+
+    for start in range(0, l_A, tile_size):
+        P[start : start + tile_size] = np.inf
+        I[start : start + tile_size] = -1
+
+    for row_start in range(0, l_A, tile_size):
+        row_stop = min(row_start + tile_size, l_A)
+        (
+            T_A_tile,
+            μ_Q,
+            σ_Q_inverse,
+            μ_Q_m_1,
+            T_A_subseq_isfinite,
+            T_A_subseq_isconstant,
+        ) = core.preprocess_diagonal(T_A[row_start : row_stop + m - 1], m)
+
+        ρ = np.full((row_stop - row_start, 3), -np.inf, dtype=np.float64)
+        I_rows = np.full((row_stop - row_start, 3), -1, dtype=np.int64)
+
+        if ignore_trivial:
+            col_tile_start = row_start
+        else:
+            col_tile_start = 0
+
+        for col_start in range(col_tile_start, l_B, tile_size):
+            col_stop = min(col_start + tile_size, l_B)
+            (
+                T_B_tile,
+                M_T,
+                Σ_T_inverse,
+                M_T_m_1,
+                T_B_subseq_isfinite,
+                T_B_subseq_isconstant,
+            ) = core.preprocess_diagonal(T_B[col_start : col_stop + m - 1], m)
+
+            # Diagonal indices are relative to the start of each piece
+            lower_diag = -(row_stop - row_start) + 1
+            if ignore_trivial:
+                lower_diag = max(lower_diag, excl_zone + 1 - (col_start - row_start))
+            diags = np.arange(lower_diag, col_stop - col_start, dtype=np.int64)
+            if diags.shape[0] == 0:  # pragma: no cover
+                continue
+
+            ρ_A, I_A, ρ_B, I_B = _mmap_stump_tile(
+                T_A_tile,
+                T_B_tile,
+                m,
+                M_T,
+                μ_Q,
+                Σ_T_inverse,
+                σ_Q_inverse,
+                M_T_m_1,
+                μ_Q_m_1,
+                T_A_subseq_isfinite,
+                T_B_subseq_isfinite,
+                T_A_subseq_isconstant,
+                T_B_subseq_isconstant,
+                diags,
+                row_start,
+                col_start,
+                ignore_trivial,
+            )
+
+            cond = ρ_A > ρ
+            ρ[cond] = ρ_A[cond]
+            I_rows[cond] = I_A[cond]
+
+            if ignore_trivial:
+                _merge_mmap_stump(P, I, col_start, ρ_B, I_B, m)
+
+        _merge_mmap_stump(P, I, row_start, ρ, I_rows, m)
+
+        if isinstance(P, np.memmap):
+            P.flush()
+        if isinstance(I, np.memmap):
+            I.flush()
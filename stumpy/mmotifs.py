@@ -7,7 +7,8 @@ import logging
 import numpy as np
 
 from .aamp_mmotifs import aamp_mmotifs
-from . import core, config, mdl, match
+from . import core, config, mdl
+from .motifs import _match
 
 logger = logging.getLogger(__name__)
 
@@ -138,6 +139,8 @@ def mmotifs(
         max_motifs = 1
 
     T, M_T, Σ_T = core.preprocess(T, m)
+    # The FFTs of each dimension of `T` are shared across all motifs
+    T_keys = [core._array_id(T, True, i) for i in range(T.shape[0])]
     P = P.copy()
 
     excl_zone = int(np.ceil(m / config.STUMPY_EXCL_ZONE_DENOM))
@@ -183,26 +186,27 @@ def mmotifs(
         ):  # pragma: no cover
             break
 
-        query_matches = match(
-            Q=T[subspace_k, motif_idx : motif_idx + m],
-            T=T[subspace_k],
-            M_T=M_T[subspace_k],
-            Σ_T=Σ_T[subspace_k],
-            max_matches=max_matches,
-            max_distance=max_distance,
-            atol=atol,
-            query_idx=motif_idx,
-            normalize=normalize,
-            p=p,
+        query_matches = core._matches(
+            _match(
+                T[subspace_k, motif_idx : motif_idx + m],
+                T[subspace_k],
+                M_T[subspace_k],
+                Σ_T[subspace_k],
+                max_distance,
+                max_matches,
+                atol,
+                motif_idx,
+                [T_keys[i] for i in subspace_k],
+            )
         )
 
-        if len(query_matches) > min_neighbors:
-            motif_distances.append(query_matches[:, 0])
-            motif_indices.append(query_matches[:, 1])
+        if len(query_matches.I) > min_neighbors:
+            motif_distances.append(query_matches.D)
+            motif_indices.append(query_matches.I)
             motif_subspaces.append(subspace_k)
             motif_mdls.append(mdls)
 
-        for idx in query_matches[:, 1]:
+        for idx in query_matches.I:
             core.apply_exclusion_zone(P, idx, excl_zone, np.inf)
         candidate_idx = np.argmin(P, axis=1)
         nn_idx = I[np.arange(len(candidate_idx)), candidate_idx]
@@ -6,7 +6,7 @@ import logging
 
 import numpy as np
 
-from .aamp_motifs import aamp_motifs, aamp_match
+from .aamp_motifs import aamp_motifs, aamp_match, aamp_match_many
 from . import core, config
 
 logger = logging.getLogger(__name__)
@@ -24,6 +24,7 @@ def _motifs(
     max_matches,
     max_motifs,
     atol=1e-8,
+    T_key=None,
 ):
     """
     Find the top motifs for time series `T`.
@@ -76,6 +77,10 @@ def _motifs(
         The absolute tolerance parameter. This value will be added to `max_distance`
         when comparing distances between subsequences.
 
+    T_key : tuple, default None
+        The key that identifies `T[-1]` for the FFT cache (see `core._array_id`).
+        When `None`, `T[-1]` is identified by `T` itself.
+
     Return
     ------
     motif_distances : numpy.ndarray
@@ -91,55 +96,28 @@ def _motifs(
     n = T.shape[1]
     l = P.shape[1]
     m = n - l + 1
+    max_memory = config.STUMPY_MASS_BATCH_MAX_MEMORY
+    # The FFTs of `T` are shared across all batches of candidates
+    if T_key is None:
+        T_key = core._array_id(T, True, T.shape[0] - 1)
 
-    motif_indices = []
-    motif_distances = []
-
-    candidate_idx = np.argmin(P[-1])
-    while len(motif_indices) < max_motifs:
-        profile_value = P[-1, candidate_idx]
-        if profile_value > cutoff or not np.isfinite(profile_value):  # pragma: no cover
-            break
-
-        # If max_distance is a constant (independent of the distance profile D of Q
-        # and T), then we can stop the iteration if the matrix profile value of Q is
-        # larger than the maximum distance.
-        if (
-            isinstance(max_distance, float) and profile_value > max_distance
-        ):  # pragma: no cover
-            break
-
-        Q = T[:, candidate_idx : candidate_idx + m]
-
-        query_matches = match(
-            Q,
-            T,
-            M_T=M_T,
-            Σ_T=Σ_T,
-            max_matches=None,
-            max_distance=max_distance,
-            atol=atol,
-            query_idx=candidate_idx,
-        )
-
-        if len(query_matches) > min_neighbors:
-            motif_distances.append(query_matches[:max_matches, 0])
-            motif_indices.append(query_matches[:max_matches, 1])
-
-        for idx in query_matches[:, 1]:
-            core.apply_exclusion_zone(P, int(idx), excl_zone, np.inf)
-
-        candidate_idx = np.argmin(P[-1])
+    def compute_distance_profiles(candidates):
+        Qs = core.rolling_window(T[-1], m)[candidates]
+        return core._mass_batch(Qs, T[-1], M_T[-1], Σ_T[-1], max_memory, T_key)
 
-    motif_distances = core._jagged_list_to_array(
-        motif_distances, fill_value=np.nan, dtype=np.float64
-    )
-    motif_indices = core._jagged_list_to_array(
-        motif_indices, fill_value=-1, dtype=np.int64
+    return core._find_motifs(
+        P[-1],
+        excl_zone,
+        min_neighbors,
+        max_distance,
+        cutoff,
+        max_matches,
+        max_motifs,
+        atol,
+        compute_distance_profiles,
+        max_memory,
     )
 
-    return motif_distances, motif_indices
-
 
 @core.non_normalized(aamp_motifs)
 def motifs(
@@ -263,6 +241,8 @@ def motifs(
     ...     max_distance=2.0)
     (array([[0.        , 0.11633857]]), array([[0, 4]]))
     """
+    # All non-finite values in `T` are replaced by zero
+    T_key = core._array_id(T, True)
     T = core._preprocess(T)
 
     if max_motifs < 1:  # pragma: no cover
@@ -311,11 +291,79 @@ def motifs(
         max_matches,
         max_motifs,
         atol=atol,
+        T_key=T_key,
     )
 
     return motif_distances, motif_indices
 
 
+def _match(Q, T, M_T, Σ_T, max_distance, max_matches, atol, query_idx, T_keys):
+    """
+    Find all matches of a (multi-dimensional) query `Q` in a pre-processed
+    (multi-dimensional) time series `T`
+
+    Parameters
+    ----------
+    Q : numpy.ndarray
+        The 2-dimensional query sequence, which must only contain finite values
+
+    T : numpy.ndarray
+        The 2-dimensional time series of interest. All non-finite values must be
+        replaced by finite values.
+
+    M_T : numpy.ndarray
+        Sliding mean of time series, `T`
+
+    Σ_T : numpy.ndarray
+        Sliding standard deviation of time series, `T`
+
+    max_distance : float or function
+        Maximum distance between `Q` and a subsequence `S` for `S` to be considered a
+        match (see `match`)
+
+    max_matches : int
+        The maximum amount of similar occurrences to be returned (see `match`)
+
+    atol : float
+        The absolute tolerance parameter. This value will be added to `max_distance`
+        when comparing distances between subsequences.
+
+    query_idx : int
+        This is the index position along the time series, `T`, where the query
+        subsequence, `Q`, is located (see `match`)
+
+    T_keys : list
+        The key that identifies each dimension of `T` for the FFT cache (see
+        `core._array_id`) or `None` for dimensions that should not be cached
+
+    Returns
+    -------
+    matches : list
+        A list of `[distance, index]` pairs (see `core._find_matches`)
+    """
+    d, n = T.shape
+    m = Q.shape[1]
+
+    excl_zone = int(np.ceil(m / config.STUMPY_EXCL_ZONE_DENOM))
+    if max_matches is None:  # pragma: no cover
+        max_matches = np.inf
+
+    if max_distance is None:  # pragma: no cover
+        max_distance = core._compute_max_distance
+
+    D = np.empty((d, n - m + 1))
+    for i in range(d):
+        QT = core.sliding_dot_product(Q[i], T[i], T_keys[i])
+        μ_Q, σ_Q = core.compute_mean_std(Q[i], m)
+        D[i, :] = core._mass(Q[i], T[i], QT, μ_Q[0], σ_Q[0], M_T[i], Σ_T[i])
+
+    D = np.mean(D, axis=0)
+    if not isinstance(max_distance, float):
+        max_distance = max_distance(D)
+
+    return core._find_matches(D, excl_zone, atol + max_distance, max_matches, query_idx)
+
+
 @core.non_normalized(
     aamp_match,
     exclude=["normalize", "M_T", "Σ_T", "T_subseq_isfinite", "p"],
@@ -332,6 +380,7 @@ def match(
     query_idx=None,
     normalize=True,
     p=2.0,
+    typed=None,
 ):
     """
     Find all matches of a query `Q` in a time series `T`
@@ -340,6 +389,9 @@ def match(
     `max_distance`, sorted by distance (lowest to highest). Around each occurrence an
     exclusion zone is applied before searching for the next.
 
+    Like in `stumpy.mass`, the FFTs of `T` are cached by the identity of `T` so that
+    `T` must not be modified in place between calls.
+
     Parameters
     ----------
     Q : numpy.ndarray
@@ -390,12 +442,21 @@ def match(
         The p-norm to apply for computing the Minkowski distance. This parameter is
         ignored when `normalize == True`.
 
+    typed : bool, default None
+        When set to `True`, a `Matches` named tuple is returned where the distances,
+        `D`, are stored in a floating point array and the indices, `I`, are stored in
+        an integer array. When set to `False`, a `numpy.ndarray` with `dtype=object`
+        is returned. The default value of `None` defers to
+        `config.STUMPY_TYPED_OUTPUT`.
+
     Returns
     -------
-    out : numpy.ndarray
+    out : numpy.ndarray or Matches
         The first column consists of distances of subsequences of `T` whose distances
         to `Q` are less than or equal to `max_distance`, sorted by distance (lowest to
-        highest). The second column consists of the corresponding indices in `T`.
+        highest). The second column consists of the corresponding indices in `T`. When
+        `typed=True`, a `Matches` named tuple with fields `D` and `I` is returned
+        instead.
 
     See Also
     --------
@@ -417,57 +478,175 @@ def match(
     array([[0.0011129739290248121, 1]], dtype=object)
     """
     Q = core._preprocess(Q)
+    # The FFTs of `T` are shared with later calls for the same (unmodified) `T`
+    T_key = core._array_id(T, M_T is None or Σ_T is None)
     T = core._preprocess(T)
+    if T_key is None or T.ndim == 1:
+        T_keys = [T_key]
+    else:
+        T_keys = [T_key + (i,) for i in range(T.shape[0])]
 
     if len(Q.shape) == 1:
         Q = Q[np.newaxis, :]
     if len(T.shape) == 1:
         T = T[np.newaxis, :]
 
-    d, n = T.shape
     m = Q.shape[1]
 
-    excl_zone = int(np.ceil(m / config.STUMPY_EXCL_ZONE_DENOM))
-    if max_matches is None:  # pragma: no cover
-        max_matches = np.inf
-
     if np.any(np.isnan(Q)) or np.any(np.isinf(Q)):  # pragma: no cover
         raise ValueError("Q contains illegal values (NaN or inf)")
 
-    if max_distance is None:  # pragma: no cover
-
-        def max_distance(D):
-            D_copy = D.copy().astype(np.float64)
-            D_copy[np.isinf(D_copy)] = np.nan
-            return np.nanmax(
-                [np.nanmean(D_copy) - 2.0 * np.nanstd(D_copy), np.nanmin(D_copy)]
-            )
-
     if M_T is None or Σ_T is None:  # pragma: no cover
         T, M_T, Σ_T = core.preprocess(T, m)
 
-    D = np.empty((d, n - m + 1))
-    for i in range(d):
-        D[i, :] = core.mass(Q[i], T[i], M_T[i], Σ_T[i])
+    matches = _match(Q, T, M_T, Σ_T, max_distance, max_matches, atol, query_idx, T_keys)
 
-    D = np.mean(D, axis=0)
-    if not isinstance(max_distance, float):
-        max_distance = max_distance(D)
+    if typed is None:
+        typed = config.STUMPY_TYPED_OUTPUT
+    if typed:
+        return core._matches(matches)
+
+    return np.array(matches, dtype=object)
 
-    matches = []
 
-    if query_idx is not None:
-        candidate_idx = query_idx
+@core.non_normalized(
+    aamp_match_many,
+    exclude=["normalize", "M_T", "Σ_T", "T_subseq_isfinite", "p"],
+    replace={"M_T": "T_subseq_isfinite", "Σ_T": None},
+)
+def match_many(
+    Qs,
+    T,
+    M_T=None,
+    Σ_T=None,
+    max_distance=None,
+    max_matches=None,
+    atol=1e-8,
+    normalize=True,
+    p=2.0,
+    max_memory=None,
+    typed=None,
+    lazy=False,
+):
+    """
+    Find all matches of each query in `Qs` in a time series `T`
+
+    This is equivalent to calling `match` for each query but the FFT of `T` is only
+    computed once and is shared by all of the queries, whose distance profiles are
+    computed in memory-bounded batches.
+
+    Parameters
+    ----------
+    Qs : numpy.ndarray
+        A 2-dimensional array where each row is a query sequence. All of the queries
+        must have the same length and they don't have to be subsequences of `T`
+
+    T : numpy.ndarray
+        The (1-dimensional) time series of interest
+
+    M_T : numpy.ndarray, default None
+        Sliding mean of time series, `T`
+
+    Σ_T : numpy.ndarray, default None
+        Sliding standard deviation of time series, `T`
+
+    max_distance : float or function, default None
+        Maximum distance between a query `Q` and a subsequence `S` for `S` to be
+        considered a match.
+        If a function, then it has to be a function of one argument `D`, which will be
+        the distance profile of `Q` with `T` (a 1D numpy array of size `n-m+1`).
+        If None, this defaults to
+        `np.nanmax([np.nanmean(D) - 2 * np.nanstd(D), np.nanmin(D)])` (i.e. at
+        least the closest match will be returned).
+
+    max_matches : int, default None
+        The maximum amount of similar occurrences to be returned for each query. If
+        `None`, then all occurrences are returned.
+
+    atol : float, default 1e-8
+        The absolute tolerance parameter. This value will be added to `max_distance`
+        when comparing distances between subsequences.
+
+    normalize : bool, default True
+        When set to `True`, this z-normalizes subsequences prior to computing distances.
+        Otherwise, this function gets re-routed to its complementary non-normalized
+        equivalent set in the `@core.non_normalized` function decorator.
+
+    p : float, default 2.0
+        The p-norm to apply for computing the Minkowski distance. This parameter is
+        ignored when `normalize == True`.
+
+    max_memory : int, default None
+        The maximum number of (temporary) bytes that are used for each batch of
+        queries. When `max_memory=None`, this defaults to
+        `config.STUMPY_MASS_BATCH_MAX_MEMORY`.
+
+    typed : bool, default None
+        When set to `True`, a `Matches` named tuple is returned for each query.
+        When set to `False`, a `numpy.ndarray` with `dtype=object` is returned for
+        each query. The default value of `None` defers to
+        `config.STUMPY_TYPED_OUTPUT`.
+
+    lazy : bool, default False
+        When set to `True`, a generator that yields the matches of one query at a time
+        is returned instead of a list. Since only one batch of distance profiles is
+        ever held in memory, the total memory usage is then bounded by `max_memory`
+        (plus the matches that are kept by the caller) regardless of the number of
+        queries.
+
+    Returns
+    -------
+    out : list or generator
+        The matches of each query in `Qs` in the same format as `match` or, when
+        `lazy=True`, a generator that yields them one query at a time
+
+    See Also
+    --------
+    stumpy.match : Find all matches of a query `Q` in a time series `T`
+    stumpy.mass_batch : Compute the distance profile of every query in `Qs` with the
+        time series `T`
+
+    Examples
+    --------
+    >>> stumpy.match_many(
+    ...     np.array([[-11.1, 23.4, 79.5, 1001.0], [584., -11., 23., 79.]]),
+    ...     np.array([584., -11., 23., 79., 1001., 0., -19.])
+    ...     )
+    [array([[0.0011129739302218461, 1]], dtype=object), array([[0.0, 0]], dtype=object)]
+    """
+    # All non-finite values in `T` are replaced by zero
+    T_key = core._array_id(T, True)
+    Qs, T = core._preprocess_batch(Qs, T)
+    m = Qs.shape[1]
+
+    excl_zone = int(np.ceil(m / config.STUMPY_EXCL_ZONE_DENOM))
+
+    if np.any(np.isnan(Qs)) or np.any(np.isinf(Qs)):  # pragma: no cover
+        raise ValueError("Qs contains illegal values (NaN or inf)")
+
+    if max_distance is None:  # pragma: no cover
+        max_distance = core._compute_max_distance
+
+    if M_T is None or Σ_T is None:
+        T, M_T, Σ_T = core.preprocess(T, m)
     else:
-        candidate_idx = np.argmin(D)
+        T[~np.isfinite(T)] = 0.0
 
-    while (
-        D[candidate_idx] <= atol + max_distance
-        and np.isfinite(D[candidate_idx])
-        and len(matches) < max_matches
-    ):
-        matches.append([D[candidate_idx], candidate_idx])
-        core.apply_exclusion_zone(D, candidate_idx, excl_zone, np.inf)
-        candidate_idx = np.argmin(D)
+    if max_memory is None:
+        max_memory = config.STUMPY_MASS_BATCH_MAX_MEMORY
 
-    return np.array(matches, dtype=object)
+    if typed is None:
+        typed = config.STUMPY_TYPED_OUTPUT
+
+    out = core._find_matches_batch(
+        core._mass_batch(Qs, T, M_T, Σ_T, max_memory, T_key),
+        excl_zone,
+        max_distance,
+        atol,
+        max_matches,
+        typed,
+    )
+    if lazy:
+        return out
+
+    return list(out)
@@ -44,6 +44,8 @@ def _compute_P_ABBA(
         Dask workers. Setting up a Dask distributed cluster is beyond the
         scope of this library. Please refer to the Dask Distributed
         documentation.
+        Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+        the work across local processes without a Dask scheduler.
 
     device_id : int or list, default None
         The (GPU) device number to use. The default value is `0`. A list of
@@ -70,8 +72,12 @@ def _compute_P_ABBA(
         mp_func, dask_client=dask_client, device_id=device_id
     )
 
-    P_ABBA[: n_A - m + 1] = partial_mp_func(T_A, m, T_B, ignore_trivial=False)[:, 0]
-    P_ABBA[n_A - m + 1 :] = partial_mp_func(T_B, m, T_A, ignore_trivial=False)[:, 0]
+    P_ABBA[: n_A - m + 1] = partial_mp_func(
+        T_A, m, T_B, ignore_trivial=False, typed=True
+    ).P
+    P_ABBA[n_A - m + 1 :] = partial_mp_func(
+        T_B, m, T_A, ignore_trivial=False, typed=True
+    ).P
 
 
 def _select_P_ABBA_value(P_ABBA, k, custom_func=None):
@@ -170,6 +176,8 @@ def _mpdist(
         Dask workers. Setting up a Dask distributed cluster is beyond the
         scope of this library. Please refer to the Dask Distributed
         documentation.
+        Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+        the work across local processes without a Dask scheduler.
 
     device_id : int or list, default None
         The (GPU) device number to use. The default value is `0`. A list of
@@ -378,6 +386,8 @@ def mpdisted(dask_client, T_A, T_B, m, percentage=0.05, k=None, normalize=True,
         Dask workers. Setting up a Dask distributed cluster is beyond the
         scope of this library. Please refer to the Dask Distributed
         documentation.
+        Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+        the work across local processes without a Dask scheduler.
 
     T_A : numpy.ndarray
         The first time series or sequence for which to compute the matrix profile
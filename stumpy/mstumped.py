@@ -35,6 +35,8 @@ def mstumped(dask_client, T, m, include=None, discords=False, normalize=True):
         Dask workers. Setting up a Dask distributed cluster is beyond the
         scope of this library. Please refer to the Dask Distributed
         documentation.
+        Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+        the work across local processes without a Dask scheduler.
 
     T : numpy.ndarray
         The time series or sequence for which to compute the multi-dimensional
@@ -139,11 +141,11 @@ def mstumped(dask_client, T, m, include=None, discords=False, normalize=True):
         )
 
     # Scatter data to Dask cluster
-    T_A_future = dask_client.scatter(T_A, broadcast=True, hash=False)
-    M_T_future = dask_client.scatter(M_T, broadcast=True, hash=False)
-    Σ_T_future = dask_client.scatter(Σ_T, broadcast=True, hash=False)
-    μ_Q_future = dask_client.scatter(μ_Q, broadcast=True, hash=False)
-    σ_Q_future = dask_client.scatter(σ_Q, broadcast=True, hash=False)
+    T_A_future = core._dask_scatter(dask_client, T_A)
+    M_T_future = core._dask_scatter(dask_client, M_T)
+    Σ_T_future = core._dask_scatter(dask_client, Σ_T)
+    μ_Q_future = core._dask_scatter(dask_client, μ_Q)
+    σ_Q_future = core._dask_scatter(dask_client, σ_Q)
 
     QT_futures = []
     QT_first_futures = []
@@ -162,7 +164,8 @@ def mstumped(dask_client, T, m, include=None, discords=False, normalize=True):
         stop = min(k, start + step)
 
         futures.append(
-            dask_client.submit(
+            core._dask_submit(
+                dask_client,
                 _mstump,
                 T_A_future,
                 m,
@@ -187,11 +190,11 @@ def mstumped(dask_client, T, m, include=None, discords=False, normalize=True):
         P[:, start + 1 : stop], I[:, start + 1 : stop] = results[i]
 
     # Delete data from Dask cluster
-    dask_client.cancel(T_A_future)
-    dask_client.cancel(M_T_future)
-    dask_client.cancel(Σ_T_future)
-    dask_client.cancel(μ_Q_future)
-    dask_client.cancel(σ_Q_future)
+    core._dask_cancel(dask_client, T_A_future)
+    core._dask_cancel(dask_client, M_T_future)
+    core._dask_cancel(dask_client, Σ_T_future)
+    core._dask_cancel(dask_client, μ_Q_future)
+    core._dask_cancel(dask_client, σ_Q_future)
     for QT_future in QT_futures:
         dask_client.cancel(QT_future)
     for QT_first_future in QT_first_futures:
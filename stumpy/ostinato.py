@@ -51,7 +51,9 @@ def _across_series_nearest_neighbors(Ts, Ts_idx, subseq_idx, m, M_Ts, Σ_Ts):
     nns_subseq_idx = np.zeros(k, dtype=np.int64)
 
     for i in range(k):
-        QT = core.sliding_dot_product(Ts[Ts_idx][subseq_idx : subseq_idx + m], Ts[i])
+        QT = core.sliding_dot_product(
+            Ts[Ts_idx][subseq_idx : subseq_idx + m], Ts[i], core._array_id(Ts[i])
+        )
         distance_profile = core._mass(
             Q,
             Ts[i],
@@ -154,6 +156,8 @@ def _ostinato(Ts, m, M_Ts, Σ_Ts, dask_client=None, device_id=None, mp_func=stum
         Dask workers. Setting up a Dask distributed cluster is beyond the
         scope of this library. Please refer to the Dask Distributed
         documentation.
+        Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+        the work across local processes without a Dask scheduler.
 
     device_id : int or list, default None
         The (GPU) device number to use. The default value is `0`. A list of
@@ -211,15 +215,17 @@ def _ostinato(Ts, m, M_Ts, Σ_Ts, dask_client=None, device_id=None, mp_func=stum
         else:
             h = 0
 
-        mp = partial_mp_func(Ts[j], m, Ts[h], ignore_trivial=False)
-        si = np.argsort(mp[:, 0])
+        mp = partial_mp_func(Ts[j], m, Ts[h], ignore_trivial=False, typed=True)
+        si = np.argsort(mp.P)
         for q in si:
-            radius = mp[q, 0]
+            radius = mp.P[q]
             if radius >= bsf_radius:
                 break
             for i in range(k):
                 if i != j and i != h:
-                    QT = core.sliding_dot_product(Ts[j][q : q + m], Ts[i])
+                    QT = core.sliding_dot_product(
+                        Ts[j][q : q + m], Ts[i], core._array_id(Ts[i])
+                    )
                     radius = np.max(
                         (
                             radius,
@@ -351,6 +357,8 @@ def ostinatoed(dask_client, Ts, m, normalize=True, p=2.0):
         Dask workers. Setting up a Dask distributed cluster is beyond the
         scope of this library. Please refer to the Dask Distributed
         documentation.
+        Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+        the work across local processes without a Dask scheduler.
 
     Ts : list
         A list of time series for which to find the most central consensus motif
@@ -0,0 +1,389 @@
+# STUMPY
+# Copyright 2019 TD Ameritrade. Released under the terms of the 3-Clause BSD license.
+# STUMPY is a trademark of TD Ameritrade IP Company, Inc. All rights reserved.
+
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+import multiprocessing
+import os
+import threading
+
+import numba
+import numpy as np
+
+from .core import _SharedArray, _share_array, _run
+
+
+def _set_num_threads(n_threads):
+    """
+    Set the number of Numba threads that are used by each worker process
+
+    Parameters
+    ----------
+    n_threads : int
+        The number of threads
+
+    Returns
+    -------
+    None
+    """
+    numba.set_num_threads(n_threads)
+
+
+def _resolve(x):
+    """
+    Replace a future by its result
+
+    Parameters
+    ----------
+    x : object
+        A future or any other object
+
+    Returns
+    -------
+    out : object
+        The result of `x` if it is a future and `x` otherwise
+    """
+    if isinstance(x, Future):
+        return x.result()
+    else:
+        return x
+
+
+def _submit_when_done(pool, future, dependencies, func, args, kwargs):
+    """
+    Submit `func` to `pool` as soon as all of the `dependencies` have finished and
+    forward its outcome to `future`
+
+    Rather than waiting for the `dependencies`, a callback is attached to each of them
+    and the last one to finish submits `func` (with all futures in `args` and
+    `kwargs` replaced by their results). If any of the `dependencies` fails, then its
+    exception is set on `future` instead.
+
+    Parameters
+    ----------
+    pool : concurrent.futures.ProcessPoolExecutor
+        The process pool
+
+    future : concurrent.futures.Future
+        The (pending) future that is returned to the caller
+
+    dependencies : list
+        The futures in `args` and `kwargs`
+
+    func : function
+        The function to call
+
+    args : tuple
+        Positional arguments for `func`
+
+    kwargs : dict
+        Keyword arguments for `func`
+
+    Returns
+    -------
+    None
+    """
+    lock = threading.Lock()
+    n_pending = [len(dependencies)]
+
+    def forward(pool_future):
+        if pool_future.cancelled():
+            future.set_exception(CancelledError())
+        elif pool_future.exception() is not None:
+            future.set_exception(pool_future.exception())
+        else:
+            future.set_result(pool_future.result())
+
+    def on_done(dependency):
+        with lock:
+            n_pending[0] -= 1
+            if n_pending[0] > 0:
+                return
+
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            resolved_args = tuple(_resolve(x) for x in args)
+            resolved_kwargs = {k: _resolve(v) for k, v in kwargs.items()}
+            pool_future = pool.submit(_run, func, resolved_args, resolved_kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            pool_future.add_done_callback(forward)
+
+    for dependency in dependencies:
+        dependency.add_done_callback(on_done)
+
+
+class ProcessPoolClient:
+    """
+    A process pool executor that can be used in place of a Dask client
+
+    This executor implements the (small) subset of the Dask Distributed client
+    interface that is used by STUMPY (i.e., `ncores`, `scatter`, `submit`, `gather`,
+    and `cancel`) on top of a `concurrent.futures.ProcessPoolExecutor`. So, it can be
+    passed as the `dask_client` to any of the distributed functions (e.g., `stumped`,
+    `aamped`, `mstumped`, `ostinatoed`, `mpdisted`, or `stimped`) in order to spread
+    the work across multiple local processes without a Dask scheduler. Rather than
+    pickling the (potentially large) inputs for every task, scattered arrays are
+    copied into shared memory exactly once and each worker process attaches to them
+    without any copying.
+
+    Parameters
+    ----------
+    n_workers : int, default None
+        The number of worker processes. When `n_workers=None`, the number of CPUs is
+        used.
+
+    threads_per_worker : int, default None
+        The number of Numba threads that are used by each worker process. When
+        `threads_per_worker=None`, the Numba default is used.
+
+    mp_context : multiprocessing.context.BaseContext, default None
+        The multiprocessing context that is used to start the worker processes. When
+        `mp_context=None`, the "spawn" context is used since forking a process after
+        Numba has started its (e.g., TBB) threads is not safe.
+
+    Attributes
+    ----------
+    n_workers : int
+        The number of worker processes
+
+    Methods
+    -------
+    ncores()
+        Return the number of threads for each worker
+
+    scatter(data, broadcast=True, hash=False, workers=None)
+        Share `data` with the worker processes
+
+    submit(func, *args, **kwargs)
+        Call `func` with `args` and `kwargs` in a worker process
+
+    gather(futures)
+        Wait for and return the results of `futures`
+
+    cancel(futures)
+        Cancel `futures` and release any shared memory
+
+    close()
+        Shut down the worker processes and release all shared memory
+
+    Examples
+    --------
+    >>> import stumpy
+    >>> import numpy as np
+    >>> with stumpy.ProcessPoolClient(n_workers=2) as client:
+    ...     stumpy.stumped(
+    ...         client,
+    ...         np.array([584., -11., 23., 79., 1001., 0., -19.]),
+    ...         m=3)
+    array([[0.11633857113691416, 4, -1, 4],
+           [2.6940739180634385, 3, -1, 3],
+           [3.0000926340485923, 0, 0, 4],
+           [2.6940739180634385, 1, 1, -1],
+           [0.11633857113691416, 0, 0, -1]], dtype=object)
+    """
+
+    def __init__(self, n_workers=None, threads_per_worker=None, mp_context=None):
+        """
+        Initialize the executor and start the worker processes
+
+        Parameters
+        ----------
+        n_workers : int, default None
+            The number of worker processes. When `n_workers=None`, the number of CPUs
+            is used.
+
+        threads_per_worker : int, default None
+            The number of Numba threads that are used by each worker process. When
+            `threads_per_worker=None`, the Numba default is used.
+
+        mp_context : multiprocessing.context.BaseContext, default None
+            The multiprocessing context that is used to start the worker processes.
+            When `mp_context=None`, the "spawn" context is used since forking a
+            process after Numba has started its (e.g., TBB) threads is not safe.
+        """
+        if n_workers is None:
+            n_workers = os.cpu_count()
+        self.n_workers = n_workers
+
+        if threads_per_worker is None:
+            self._threads_per_worker = numba.config.NUMBA_NUM_THREADS
+            initializer, initargs = None, ()
+        else:
+            self._threads_per_worker = threads_per_worker
+            initializer, initargs = _set_num_threads, (threads_per_worker,)
+
+        if mp_context is None:
+            mp_context = multiprocessing.get_context("spawn")
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=mp_context,
+            initializer=initializer,
+            initargs=initargs,
+        )
+        self._shms = {}
+
+    def __enter__(self):
+        """
+        Enter the runtime context of the executor
+
+        Returns
+        -------
+        self : ProcessPoolClient
+            The executor
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        Shut down the worker processes and release all shared memory upon exiting the
+        runtime context of the executor
+
+        Returns
+        -------
+        None
+        """
+        self.close()
+
+    def ncores(self):
+        """
+        Return the number of threads for each worker
+
+        Returns
+        -------
+        out : dict
+            A dictionary that maps a (unique) name for each worker to its number of
+            threads
+        """
+        return {f"worker-{i}": self._threads_per_worker for i in range(self.n_workers)}
+
+    def scatter(self, data, broadcast=True, hash=False, workers=None):
+        """
+        Share `data` with the worker processes
+
+        Arrays are copied into shared memory (once) and a lightweight handle is
+        returned in their place. All other data is returned as is and is pickled
+        along with each task that it is submitted with.
+
+        Parameters
+        ----------
+        data : object
+            The data to share
+
+        broadcast : bool, default True
+            Ignored since shared memory is accessible to all workers. This parameter
+            is only accepted for compatibility with Dask.
+
+        hash : bool, default False
+            Ignored. This parameter is only accepted for compatibility with Dask.
+
+        workers : list, default None
+            Ignored since shared memory is accessible to all workers. This parameter
+            is only accepted for compatibility with Dask.
+
+        Returns
+        -------
+        out : object
+            A handle to the shared array or the original `data`
+        """
+        if not isinstance(data, np.ndarray):
+            return data
+
+        shm, handle = _share_array(data)
+        self._shms[shm.name] = shm
+
+        return handle
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Call `func` with `args` and `kwargs` in a worker process
+
+        Any futures that are found in `args` or `kwargs` are replaced by their results
+        so that tasks may depend on each other just like in Dask. This never blocks
+        since a task with dependencies is only handed to the worker processes once all
+        of its dependencies have finished (see `_submit_when_done`).
+
+        Parameters
+        ----------
+        func : function
+            The function to call
+
+        args : tuple
+            Positional arguments for `func`
+
+        kwargs : dict
+            Keyword arguments for `func`
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            A future for the output of `func`
+        """
+        dependencies = [
+            x for x in list(args) + list(kwargs.values()) if isinstance(x, Future)
+        ]
+        if len(dependencies) == 0:
+            return self._pool.submit(_run, func, args, kwargs)
+
+        future = Future()
+        _submit_when_done(self._pool, future, dependencies, func, args, kwargs)
+
+        return future
+
+    def gather(self, futures):
+        """
+        Wait for and return the results of `futures`
+
+        Parameters
+        ----------
+        futures : list
+            A list of futures
+
+        Returns
+        -------
+        out : list
+            The results of `futures`
+        """
+        return [future.result() for future in futures]
+
+    def cancel(self, futures):
+        """
+        Cancel `futures` and release the shared memory of any scattered arrays
+
+        Parameters
+        ----------
+        futures : object
+            A future, a handle that was returned by `scatter`, or a list of either
+
+        Returns
+        -------
+        None
+        """
+        if not isinstance(futures, (list, tuple)):
+            futures = [futures]
+
+        for future in futures:
+            if isinstance(future, Future):
+                future.cancel()
+            elif isinstance(future, _SharedArray) and future.name in self._shms:
+                shm = self._shms.pop(future.name)
+                shm.close()
+                shm.unlink()
+
+    def close(self):
+        """
+        Shut down the worker processes and release all shared memory
+
+        Returns
+        -------
+        None
+        """
+        self._pool.shutdown(wait=True)
+        for shm in self._shms.values():
+            shm.close()
+            shm.unlink()
+        self._shms = {}
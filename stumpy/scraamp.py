@@ -57,8 +57,8 @@ def _compute_PI(
             for k in range(1, min(s, l - max(i, j))):
                 p_norm_j = (
                     p_norm_j
-                    - abs(T_B[i + k - 1] - T_A[j + k - 1]) ** p
-                    + abs(T_B[i + k + m - 1] - T_A[j + k + m - 1]) ** p
+                    - core._abs_pow(T_B[i + k - 1] - T_A[j + k - 1], p)
+                    + core._abs_pow(T_B[i + k + m - 1] - T_A[j + k + m - 1], p)
                 )
                 if (
                     not T_A_subseq_isfinite[i + k] or not T_B_subseq_isfinite[j + k]
@@ -78,8 +78,8 @@ def _compute_PI(
             for k in range(1, min(s, i + 1, j + 1)):
                 p_norm_j = (
                     p_norm_j
-                    - abs(T_B[i - k + m] - T_A[j - k + m]) ** p
-                    + abs(T_B[i - k] - T_A[j - k]) ** p
+                    - core._abs_pow(T_B[i - k + m] - T_A[j - k + m], p)
+                    + core._abs_pow(T_B[i - k] - T_A[j - k], p)
                 )
                 if (
                     not T_A_subseq_isfinite[i - k] or not T_B_subseq_isfinite[j - k]
@@ -223,7 +223,8 @@ def prescraamp(T_A, m, T_B=None, s=None, p=2.0):
         `int(np.ceil(m / config.STUMPY_EXCL_ZONE_DENOM))`
 
     p : float, default 2.0
-        The p-norm to apply for computing the Minkowski distance.
+        The p-norm to apply for computing the Minkowski distance, which must be
+        finite.
 
     Returns
     -------
@@ -240,6 +241,7 @@ def prescraamp(T_A, m, T_B=None, s=None, p=2.0):
 
     See Algorithm 2
     """
+    core.check_finite_p(p)
     if T_B is None:
         T_B = T_A
         excl_zone = int(np.ceil(m / config.STUMPY_EXCL_ZONE_DENOM))
@@ -310,7 +312,8 @@ class scraamp:
         zone.
 
     p : float, default 2.0
-        The p-norm to apply for computing the Minkowski distance.
+        The p-norm to apply for computing the Minkowski distance, which must be
+        finite.
 
     Attributes
     ----------
@@ -380,8 +383,10 @@ class scraamp:
             size of the exclusion zone.
 
         p : float, default 2.0
-            The p-norm to apply for computing the Minkowski distance.
+            The p-norm to apply for computing the Minkowski distance, which must be
+            finite.
         """
+        core.check_finite_p(p)
         self._ignore_trivial = ignore_trivial
         self._p = p
 
@@ -2,8 +2,11 @@
 # Copyright 2019 TD Ameritrade. Released under the terms of the 3-Clause BSD license.
 # STUMPY is a trademark of TD Ameritrade IP Company, Inc. All rights reserved.
 
+import numba
 import numpy as np
-from . import core, stump, scrump, stumped
+from numba import njit, prange
+
+from . import config, core, stump, scrump, stumped
 from .aamp_stimp import aamp_stimp, aamp_stimped
 
 
@@ -36,6 +39,501 @@ def _normalize_pan(pan, ms, bfs_indices, n_processed):
     pan[idx] = np.minimum(1.0, pan[idx] * norm[:, np.newaxis])
 
 
+@njit(
+    # "f8(f8[:], i8, f8, f8, i8, i8)",
+    fastmath=True,
+)
+def _pan_comoment(T, m, μ_i, μ_j, i, j):
+    """
+    A Numba JIT-compiled function for directly computing the co-moment (i.e., the sum
+    of the products of the deviations from the mean) of two subsequences in `T`
+
+    Parameters
+    ----------
+    T : numpy.ndarray
+        The time series or sequence (where all non-finite values are replaced by zero)
+
+    m : int
+        Window size
+
+    μ_i : float
+        The mean of the subsequence that starts at index `i`
+
+    μ_j : float
+        The mean of the subsequence that starts at index `j`
+
+    i : int
+        The start index of the first subsequence
+
+    j : int
+        The start index of the second subsequence
+
+    Returns
+    -------
+    C : float
+        The co-moment of the two subsequences
+    """
+    C = 0.0
+    for k in range(m):
+        C += (T[i + k] - μ_i) * (T[j + k] - μ_j)
+
+    return C
+
+
+@njit(
+    # "(f8[:], f8[:], f8[:])",
+    fastmath=True,
+)
+def _pan_comoment_update(C, Δ_i, Δ_j):
+    """
+    A Numba JIT-compiled function for extending the co-moments of a contiguous range
+    of pairs of subsequences along a diagonal of the distance matrix by one element
+    (inplace) with Welford's online update
+
+    Parameters
+    ----------
+    C : numpy.ndarray
+        The co-moments for the previous window size. This is updated inplace.
+
+    Δ_i : numpy.ndarray
+        The deviation of the new (i.e., last) element of the first subsequence of
+        each pair from its mean for the previous window size
+
+    Δ_j : numpy.ndarray
+        The deviation of the new (i.e., last) element of the second subsequence of
+        each pair from its mean for the new window size
+
+    Returns
+    -------
+    None
+    """
+    for k in range(C.shape[0]):
+        C[k] += Δ_i[k] * Δ_j[k]
+
+
+@njit(
+    # "(f8[:], f8[:], f8[:], f8[:], f8[:])",
+    fastmath=True,
+)
+def _pan_correlation_update(C, Σ_inverse_i, Σ_inverse_j, ρ_i, ρ_j):
+    """
+    A Numba JIT-compiled function for updating the largest Pearson correlations of
+    both subsequences of a contiguous range of pairs of subsequences along a diagonal
+    of the distance matrix (inplace)
+
+    Parameters
+    ----------
+    C : numpy.ndarray
+        The co-moments of the pairs of subsequences
+
+    Σ_inverse_i : numpy.ndarray
+        The inverted square root of the sum of squared deviations from the mean of
+        the first subsequence of each pair, which is zero for all non-finite and
+        constant subsequences
+
+    Σ_inverse_j : numpy.ndarray
+        The inverted square root of the sum of squared deviations from the mean of
+        the second subsequence of each pair, which is zero for all non-finite and
+        constant subsequences
+
+    ρ_i : numpy.ndarray
+        The largest Pearson correlations of the first subsequences. This is updated
+        inplace.
+
+    ρ_j : numpy.ndarray
+        The largest Pearson correlations of the second subsequences. This is updated
+        inplace.
+
+    Returns
+    -------
+    None
+    """
+    for k in range(C.shape[0]):
+        Σ_inverse = Σ_inverse_i[k] * Σ_inverse_j[k]
+        ρ_ij = C[k] * Σ_inverse if Σ_inverse > 0.0 else -4.0
+        ρ_i[k] = max(ρ_i[k], ρ_ij)
+        ρ_j[k] = max(ρ_j[k], ρ_ij)
+
+
+@njit(
+    # "f8[:, :](f8[:], i8, f8[:], f8[:], f8[:], f8[:, :], f8[:, :], f8[:, :], i8[:],"
+    # "i8[:], i8[:, :], i8, i8)",
+    parallel=True,
+    fastmath=True,
+)
+def _pan_band(
+    T,
+    m,
+    μ_m,
+    cov_a,
+    cov_c,
+    Δ_i,
+    Δ_j,
+    Σ_inverse,
+    ws,
+    diags,
+    diags_ranges,
+    tile_height,
+    tile_width,
+):
+    """
+    A Numba JIT-compiled function for computing the largest Pearson correlation of
+    every subsequence for a band of window sizes, `m + ws[0]`, `m + ws[1]`, ...,
+    in a single sweep over the distance matrix
+
+    The co-moment of every pair of subsequences is computed for the window size `m`
+    (from the co-moment of its predecessor along the same diagonal) and is then
+    extended by one element at a time with Welford's online update to all of the
+    larger window sizes up to `m + ws[-1]`. So, each additional window size only
+    adds a couple of (vectorized) multiply-adds for every pair of subsequences and
+    the Pearson correlations are only computed for the window sizes in `ws`. Just
+    like in `stump`, only the diagonals of the upper triangle of the (symmetric)
+    distance matrix are swept and both the row and the column of each distance are
+    updated. Each thread processes its own range of diagonals, one tile of
+    `tile_width` diagonals and `tile_height` rows at a time, with its own copy of the
+    largest Pearson correlations, which are then reduced.
+
+    Parameters
+    ----------
+    T : numpy.ndarray
+        The time series or sequence (where all non-finite values are replaced by zero)
+
+    m : int
+        The smallest window size in the band
+
+    μ_m : numpy.ndarray
+        The sliding mean of `T` for the window size `m`
+
+    cov_a : numpy.ndarray
+        The deviation of the last element of each subsequence of length `m` from the
+        sliding mean of `T` for a window size of `m - 1` (see `stump`)
+
+    cov_c : numpy.ndarray
+        The deviation of the element preceding each subsequence from the sliding mean
+        of `T` for a window size of `m - 1` (see `stump`)
+
+    Δ_i : numpy.ndarray
+        The deviation of the last element of each subsequence from its mean for the
+        previous window size for each window size from `m` to `m + ws[-1]`
+
+    Δ_j : numpy.ndarray
+        The deviation of the last element of each subsequence from its mean for each
+        window size from `m` to `m + ws[-1]`
+
+    Σ_inverse : numpy.ndarray
+        The inverted square root of the sums of squared deviations from the mean of
+        all subsequences for each window size in `ws`, which is zero for all
+        non-finite and constant subsequences
+
+    ws : numpy.ndarray
+        The (sorted) offsets of the window sizes in the band relative to `m`, where
+        `ws[0]` must be zero
+
+    diags : numpy.ndarray
+        The (positive) diagonals of the distance matrix to sweep
+
+    diags_ranges : numpy.ndarray
+        The start and (exclusive) stop index in `diags` of each thread
+
+    tile_height : int
+        The number of consecutive pairs of subsequences along each diagonal that are
+        processed at once
+
+    tile_width : int
+        The number of consecutive diagonals that are processed together
+
+    Returns
+    -------
+    ρ : numpy.ndarray
+        The largest Pearson correlation of every subsequence (with any subsequence
+        that is outside of its exclusion zone and that is both finite and
+        non-constant) for each window size in `ws`. Subsequences without any such
+        neighbor have a value of `-4.0`.
+    """
+    n = T.shape[0]
+    l = n - m + 1
+    n_threads = diags_ranges.shape[0]
+    n_windows = ws[-1] + 1
+    constant = (m - 1) / m
+
+    ρ = np.full((n_threads, ws.shape[0], l), -4.0, dtype=np.float64)
+    for thread_idx in prange(n_threads):
+        C = np.empty(tile_height, dtype=np.float64)
+        C_m = np.empty(tile_height, dtype=np.float64)
+        C_m_diags = np.empty(tile_width, dtype=np.float64)
+        diag_start = diags_ranges[thread_idx, 0]
+        diag_stop = diags_ranges[thread_idx, 1]
+        for tile_start in range(diag_start, diag_stop, tile_width):
+            tile_stop = min(diag_stop, tile_start + tile_width)
+            for diag_idx in range(tile_start, tile_stop):
+                g = diags[diag_idx]
+                C_m_diags[diag_idx - tile_start] = _pan_comoment(
+                    T, m, μ_m[0], μ_m[g], 0, g
+                )
+
+            # All of the diagonals in a tile are processed for the same rows so that
+            # the sliding statistics of the rows and columns remain in the cache
+            for start in range(0, l - diags[tile_start], tile_height):
+                for diag_idx in range(tile_start, tile_stop):
+                    g = diags[diag_idx]
+                    stop = min(l - g, start + tile_height)
+                    if start >= stop:
+                        break
+
+                    C_m_i = C_m_diags[diag_idx - tile_start]
+                    for i in range(max(1, start), stop):
+                        C_m_i += constant * (
+                            cov_a[i] * cov_a[i + g] - cov_c[i] * cov_c[i + g]
+                        )
+                        C_m[i - start] = C_m_i
+                    if start == 0:
+                        C_m[0] = C_m_diags[diag_idx - tile_start]
+                    C_m_diags[diag_idx - tile_start] = C_m_i
+                    C[: stop - start] = C_m[: stop - start]
+
+                    r = 0
+                    for w in range(n_windows):
+                        m_w = m + w
+                        # The exclusion zone only grows and the number of
+                        # subsequences only shrinks with the window size
+                        if g <= int(np.ceil(m_w / config.STUMPY_EXCL_ZONE_DENOM)):
+                            break
+                        b = min(stop, l - w - g)
+                        if start >= b:
+                            break
+
+                        if w > 0:
+                            _pan_comoment_update(
+                                C[: b - start],
+                                Δ_i[w, start:b],
+                                Δ_j[w, start + g : b + g],
+                            )
+
+                        if w == ws[r]:
+                            _pan_correlation_update(
+                                C[: b - start],
+                                Σ_inverse[r, start:b],
+                                Σ_inverse[r, start + g : b + g],
+                                ρ[thread_idx, r, start:b],
+                                ρ[thread_idx, r, start + g : b + g],
+                            )
+                            r += 1
+
+    for thread_idx in range(1, n_threads):
+        for r in prange(ws.shape[0]):
+            for i in range(l):
+                ρ[0, r, i] = max(ρ[0, r, i], ρ[thread_idx, r, i])
+
+    return ρ[0]
+
+
+@njit(
+    # "(f8[:, :], i8[:], b1[:, :], b1[:, :])",
+    parallel=True,
+    fastmath={"nsz", "arcp", "contract", "afn", "reassoc"},
+)
+def _pan_apply_constant(ρ, ms, T_subseq_isfinite, T_subseq_isconstant):
+    """
+    A Numba JIT-compiled function for applying the conventions for non-finite and
+    constant subsequences to the largest Pearson correlations (inplace)
+
+    A non-finite subsequence has no nearest neighbor. A constant subsequence has a
+    Pearson correlation of `1.0` with any other constant subsequence and a Pearson
+    correlation of `0.5` with any non-constant subsequence (see `stump`).
+
+    Parameters
+    ----------
+    ρ : numpy.ndarray
+        The largest Pearson correlations that were computed by `_pan_band`. This is
+        updated inplace.
+
+    ms : numpy.ndarray
+        The (sorted) window sizes in the band
+
+    T_subseq_isfinite : numpy.ndarray
+        A boolean array that indicates whether a subsequence in `T` contains a
+        `np.nan`/`np.inf` value (False) for each window size in the band
+
+    T_subseq_isconstant : numpy.ndarray
+        A boolean array that indicates whether a subsequence in `T` is constant (True)
+        for each window size in the band
+
+    Returns
+    -------
+    None
+    """
+    n_windows, l = ρ.shape
+    for w in range(n_windows):
+        m_w = ms[w]
+        l_w = l - (ms[w] - ms[0])
+        excl_zone = int(np.ceil(m_w / config.STUMPY_EXCL_ZONE_DENOM))
+
+        # Cumulative counts of the finite non-constant and finite constant subsequences
+        n_varying = np.zeros(l_w + 1, dtype=np.int64)
+        n_constant = np.zeros(l_w + 1, dtype=np.int64)
+        for i in range(l_w):
+            n_varying[i + 1] = n_varying[i]
+            n_constant[i + 1] = n_constant[i]
+            if T_subseq_isfinite[w, i]:
+                if T_subseq_isconstant[w, i]:
+                    n_constant[i + 1] += 1
+                else:
+                    n_varying[i + 1] += 1
+
+        for i in prange(l):
+            if i >= l_w or not T_subseq_isfinite[w, i]:
+                ρ[w, i] = -np.inf
+                continue
+
+            start = max(0, i - excl_zone)
+            stop = min(l_w, i + excl_zone + 1)
+            has_constant = n_constant[start] + n_constant[l_w] - n_constant[stop] > 0
+            if T_subseq_isconstant[w, i]:
+                if has_constant:
+                    ρ[w, i] = 1.0
+                elif n_varying[start] + n_varying[l_w] - n_varying[stop] > 0:
+                    ρ[w, i] = 0.5
+                else:
+                    ρ[w, i] = -np.inf
+            else:
+                if ρ[w, i] < -2.0:
+                    ρ[w, i] = -np.inf
+                if has_constant:
+                    ρ[w, i] = max(ρ[w, i], 0.5)
+
+
+def _pan(T, ms, mean_std=None):
+    """
+    Compute the exact (z-normalized) matrix profiles of a time series for all of the
+    window sizes in a band
+
+    Rather than computing each matrix profile independently (i.e., with `stump`), the
+    distance matrix is only swept once for the entire band and the co-moments of all
+    pairs of subsequences are extended from one window size to the next. This is
+    several times faster than calling `stump` for each of the window sizes. The
+    co-moments are extended to every window size between `ms[0]` and `ms[-1]` but
+    the Pearson correlations (and, therefore, the matrix profiles) are only computed
+    for the window sizes in `ms`.
+
+    Parameters
+    ----------
+    T : numpy.ndarray
+        The time series or sequence
+
+    ms : numpy.ndarray
+        The (sorted) window sizes in the band
+
+    mean_std : core._MultiWindowMeanStd, default None
+        The sliding mean and standard deviation engine for `T` (where all non-finite
+        values are replaced by zero). When `mean_std = None`, it is created from `T`.
+
+    Returns
+    -------
+    P : numpy.ndarray
+        The matrix profiles for all of the window sizes in the band, where `P[i]` is
+        the matrix profile for a window size of `ms[i]` and is padded with `np.inf`
+    """
+    T = core._preprocess(T)
+    T_isfinite = np.isfinite(T)
+    T[~T_isfinite] = 0.0
+    if mean_std is None:
+        mean_std = core._MultiWindowMeanStd(T)
+
+    ms = np.asarray(ms, dtype=np.int64)
+    m_start = ms[0]
+    n = T.shape[0]
+    l = n - m_start + 1
+    μ_m_1, _ = mean_std.compute_mean_std(m_start - 1)
+    cov_a = T[m_start - 1 :] - μ_m_1[:-1]
+    cov_c = np.zeros(l, dtype=np.float64)
+    cov_c[1:] = T[: l - 1] - μ_m_1[1:l]
+
+    # The deviations that are needed for extending the co-moments to the next window
+    # size only depend on a single subsequence and are computed once for every
+    # window size in between `ms[0]` and `ms[-1]`
+    μ_m, _ = mean_std.compute_mean_std(m_start)
+    Δ_i = np.zeros((ms[-1] - m_start + 1, l), dtype=np.float64)
+    Δ_j = np.zeros((ms[-1] - m_start + 1, l), dtype=np.float64)
+    μ_prev = μ_m
+    for w in range(1, Δ_i.shape[0]):
+        m = m_start + w
+        l_w = n - m + 1
+        μ_w, _ = mean_std.compute_mean_std(m)
+        Δ_i[w, :l_w] = T[m - 1 :] - μ_prev[:l_w]
+        Δ_j[w, :l_w] = T[m - 1 :] - μ_w
+        μ_prev = μ_w
+
+    Σ_inverse = np.zeros((ms.shape[0], n), dtype=np.float64)
+    T_subseq_isfinite = np.zeros((ms.shape[0], l), dtype=bool)
+    T_subseq_isconstant = np.zeros((ms.shape[0], l), dtype=bool)
+    for r, m in enumerate(ms):
+        l_w = n - m + 1
+        _, Σ = mean_std.compute_mean_std(m)
+        T_subseq_isfinite[r, :l_w] = core.rolling_isfinite(T_isfinite, m)
+        T_subseq_isconstant[r, :l_w] = Σ < config.STUMPY_STDDEV_THRESHOLD
+        mask = T_subseq_isfinite[r, :l_w] & ~T_subseq_isconstant[r, :l_w]
+        Σ_inverse[r, :l_w][mask] = 1.0 / (np.sqrt(m) * Σ[mask])
+
+    # Only the diagonals of the upper triangle that are outside of the (smallest)
+    # exclusion zone are swept and they are split among the threads according to
+    # their lengths
+    n_threads = numba.config.NUMBA_NUM_THREADS
+    excl_zone = int(np.ceil(m_start / config.STUMPY_EXCL_ZONE_DENOM))
+    diags = np.arange(excl_zone + 1, l, dtype=np.int64)
+    diags_ranges = core._get_array_ranges(l - diags, n_threads, False)
+    ρ = _pan_band(
+        T,
+        m_start,
+        μ_m,
+        cov_a,
+        cov_c,
+        Δ_i,
+        Δ_j,
+        Σ_inverse,
+        ms - m_start,
+        diags,
+        diags_ranges,
+        config.STUMPY_DIAGONAL_TILE_HEIGHT,
+        config.STUMPY_DIAGONAL_TILE_WIDTH,
+    )
+    _pan_apply_constant(ρ, ms, T_subseq_isfinite, T_subseq_isconstant)
+
+    p_norm = np.abs(2 * ms[:, np.newaxis] * (1 - ρ))
+    p_norm[p_norm < config.STUMPY_P_NORM_THRESHOLD] = 0.0
+    P = np.full((ms.shape[0], n), np.inf, dtype=np.float64)
+    P[:, :l] = np.sqrt(p_norm)
+
+    return P
+
+
+def _get_band_size(n):
+    """
+    Compute the number of consecutive window sizes in a band (see `_pan`) so that
+    the band does not need more than `config.STUMPY_STIMP_BAND_MAX_MEMORY` bytes
+
+    Parameters
+    ----------
+    n : int
+        The length of the time series
+
+    Returns
+    -------
+    band_size : int
+        The number of window sizes in each band, which is at most
+        `config.STUMPY_STIMP_BAND_SIZE`
+    """
+    # The two deviations for extending the co-moments, the inverted standard
+    # deviations, the Pearson correlations of each thread, the squared distances, and
+    # the matrix profiles (float64) as well as the finite and constant subsequence
+    # masks (bool) for each window size
+    nbytes_per_window = (5 * 8 + 8 * numba.config.NUMBA_NUM_THREADS + 2) * n
+
+    return min(
+        config.STUMPY_STIMP_BAND_SIZE,
+        core._get_batch_size(nbytes_per_window, config.STUMPY_STIMP_BAND_MAX_MEMORY),
+    )
+
+
 class _stimp:
     """
     Compute the Pan Matrix Profile
@@ -75,6 +573,8 @@ class _stimp:
         Dask workers. Setting up a Dask distributed cluster is beyond the
         scope of this library. Please refer to the Dask Distributed
         documentation.
+        Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+        the work across local processes without a Dask scheduler.
 
     device_id : int or list, default None
         The (GPU) device number to use. The default value is `0`. A list of
@@ -157,6 +657,8 @@ class _stimp:
             Dask workers. Setting up a Dask distributed cluster is beyond the
             scope of this library. Please refer to the Dask Distributed
             documentation.
+            Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+            the work across local processes without a Dask scheduler.
 
         device_id : int or list, default None
             The (GPU) device number to use. The default value is `0`. A list of
@@ -192,6 +694,18 @@ class _stimp:
         self._PAN = np.full(
             (self._M.shape[0], self._T.shape[0]), fill_value=np.inf, dtype=np.float64
         )
+        self._mean_stds = None
+        # The exact matrix profiles of a band of window sizes can be computed at once
+        # (see `_pan`) but the co-moments are still extended to every window size in
+        # between, which only pays off for a small `step`
+        self._band = (
+            percentage == 1.0
+            and mp_func is stump
+            and dask_client is None
+            and device_id is None
+            and step <= 4
+        )
+        self._band_P = {}
 
     def update(self):
         """
@@ -207,29 +721,94 @@ class _stimp:
         """
         if self._n_processed < self._M.shape[0]:
             m = self._M[self._n_processed]
-            if self._percentage < 1.0:
-                approx = scrump(
-                    self._T,
-                    m,
-                    ignore_trivial=True,
-                    percentage=self._percentage,
-                    pre_scrump=self._pre_scrump,
-                )
-                approx.update()
+            if self._band:
+                # `_pan` computes the sliding statistics from the cumulative sums itself
+                idx = self._bfs_indices[self._n_processed]
+                self._PAN[idx] = self._get_band_P(idx)
+            elif self._percentage < 1.0:
+                with core._use_mean_std(self._get_mean_stds()):
+                    approx = scrump(
+                        self._T,
+                        m,
+                        ignore_trivial=True,
+                        percentage=self._percentage,
+                        pre_scrump=self._pre_scrump,
+                    )
+                    approx.update()
                 self._PAN[
                     self._bfs_indices[self._n_processed], : approx.P_.shape[0]
                 ] = approx.P_
             else:
-                out = self._mp_func(
-                    self._T,
-                    m,
-                    ignore_trivial=True,
-                )
+                with core._use_mean_std(self._get_mean_stds()):
+                    out = self._mp_func(
+                        self._T,
+                        m,
+                        ignore_trivial=True,
+                        typed=True,
+                    )
                 self._PAN[
-                    self._bfs_indices[self._n_processed], : out[:, 0].shape[0]
-                ] = out[:, 0]
+                    self._bfs_indices[self._n_processed], : out.P.shape[0]
+                ] = out.P
             self._n_processed += 1
 
+    def _get_band_P(self, idx):
+        """
+        Return the matrix profile for the `idx`-th smallest subsequence window size
+
+        The matrix profiles for all of the (requested) window sizes within the same
+        band of consecutive window sizes (see `_get_band_size`) are computed at once
+        and are kept until they are requested. Note that when `step > 1`, the
+        co-moments are still extended to the window sizes in between, which only
+        adds a couple of multiply-adds per window size and pair of subsequences.
+
+        Parameters
+        ----------
+        idx : int
+            The index of the subsequence window size in the sorted window sizes
+
+        Returns
+        -------
+        P : numpy.ndarray
+            The matrix profile (padded with `np.inf`)
+        """
+        if idx not in self._band_P:
+            M = np.sort(self._M)
+            band = (M - M[0]) // _get_band_size(self._T.shape[0])
+            band_idx = np.flatnonzero(band == band[idx])
+            P = _pan(self._T, M[band_idx], self._get_mean_stds()[-1])
+            for i, P_i in zip(band_idx, P):
+                self._band_P[i] = P_i
+
+        return self._band_P.pop(idx)
+
+    def _get_mean_stds(self):
+        """
+        Return the (shared) cumulative sums from which the sliding mean and standard
+        deviation of the time series are computed for any window size
+
+        Only the matrix profile functions that are called by this object use them
+        (see `core._use_mean_std`) so that the results of any other caller are not
+        affected. Since only the cumulative sums are kept, the memory usage is
+        independent of the number of window sizes.
+
+        Returns
+        -------
+        mean_stds : list
+            The `core._MultiWindowMeanStd` objects for the time series exactly as
+            `core.preprocess` (NaN) and `core.preprocess_diagonal` (zero) pass it to
+            `core.compute_mean_std`
+        """
+        if self._mean_stds is None:
+            T = core._preprocess(self._T)
+            T[np.isinf(T)] = np.nan
+            self._mean_stds = [core._MultiWindowMeanStd(T)]
+            if np.isnan(T).any():
+                T = T.copy()
+                T[np.isnan(T)] = 0.0
+                self._mean_stds.append(core._MultiWindowMeanStd(T))
+
+        return self._mean_stds
+
     def pan(self, threshold=0.2, normalize=True, contrast=True, binary=True, clip=True):
         """
         Generate a transformed (i.e., normalized, contrasted, binarized, and repeated)
@@ -486,6 +1065,8 @@ class stimped(_stimp):
             Dask workers. Setting up a Dask distributed cluster is beyond the
             scope of this library. Please refer to the Dask Distributed
             documentation.
+            Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+            the work across local processes without a Dask scheduler.
 
     T : numpy.ndarray
         The time series or sequence for which to compute the pan matrix profile
@@ -573,6 +1154,8 @@ class stimped(_stimp):
             Dask workers. Setting up a Dask distributed cluster is beyond the
             scope of this library. Please refer to the Dask Distributed
             documentation.
+            Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+            the work across local processes without a Dask scheduler.
 
         T : numpy.ndarray
             The time series or sequence for which to compute the pan matrix profile
@@ -14,12 +14,176 @@ from .aamp import aamp
 logger = logging.getLogger(__name__)
 
 
+@njit(
+    # "i8(i8, i8, i8[:], i8)",
+    fastmath=True,
+)
+def _get_rank(i, j, diags_rank, l_A):
+    """
+    Compute (Numba JIT-compiled) the rank of the distance between the `i`th
+    subsequence in `T_A` and the `j`th subsequence in `T_B`
+
+    The rank reflects the order in which the distances would be visited when walking
+    the diagonals one by one (in the order that they were provided) and is used to
+    break ties between equal Pearson correlations so that the results do not depend
+    on the number of threads or the size of the tiles.
+
+    Parameters
+    ----------
+    i : int
+        The index of the subsequence in `T_A`
+
+    j : int
+        The index of the subsequence in `T_B`
+
+    diags_rank : numpy.ndarray
+        The position of each diagonal, `k`, in the original array of diagonals
+        multiplied by `l_A` and stored at `diags_rank[k + l_A - 1]`
+
+    l_A : int
+        The total number of subsequences in `T_A`
+
+    Returns
+    -------
+    rank : int
+        The rank of the distance
+    """
+    return diags_rank[j - i + l_A - 1] + i
+
+
+@njit(
+    # "(f8[:, :], i8[:, :], i8, f8, i8, i8, b1, i8, i8[:], i8)",
+    fastmath=True,
+)
+def _update_row(ρ, I, r, pearson, i, j, right, T_B_offset, diags_rank, l_A):
+    """
+    Compute (Numba JIT-compiled) and update the Pearson correlations, ρ, and I of
+    the `i`th subsequence in `T_A` with its distance to the `j`th subsequence in `T_B`
+
+    Equal Pearson correlations are resolved in favor of the distance with the lowest
+    rank (see `_get_rank`).
+
+    Parameters
+    ----------
+    ρ : numpy.ndarray
+        The Pearson correlations for the subsequences in `T_A`
+
+    I : numpy.ndarray
+        The matrix profile indices for the subsequences in `T_A`
+
+    r : int
+        The row in `ρ` and `I` that corresponds to the `i`th subsequence in `T_A`
+
+    pearson : float
+        The Pearson correlation between the `i`th subsequence in `T_A` and the `j`th
+        subsequence in `T_B`
+
+    i : int
+        The index of the subsequence in `T_A`
+
+    j : int
+        The index of the subsequence in `T_B`
+
+    right : bool
+        When `True`, the right Pearson correlation and the right matrix profile index
+        are also updated
+
+    T_B_offset : int
+        The index of the first subsequence in `T_B` relative to the full time series
+
+    diags_rank : numpy.ndarray
+        The (scaled) position of each diagonal in the original array of diagonals
+
+    l_A : int
+        The total number of subsequences in `T_A`
+
+    Returns
+    -------
+    None
+    """
+    for idx in range(0, 3, 2):
+        if idx == 2 and not right:
+            break
+
+        if pearson > ρ[r, idx] or (
+            pearson == ρ[r, idx]
+            and _get_rank(i, j, diags_rank, l_A)
+            < _get_rank(i, I[r, idx] - T_B_offset, diags_rank, l_A)
+        ):
+            ρ[r, idx] = pearson
+            I[r, idx] = j + T_B_offset
+
+
+@njit(
+    # "(f8[:, :], i8[:, :], i8, f8, i8, i8, b1, i8, i8[:], i8)",
+    fastmath=True,
+)
+def _update_col(ρ, I, c, pearson, i, j, left, T_A_offset, diags_rank, l_A):
+    """
+    Compute (Numba JIT-compiled) and update the Pearson correlations, ρ, and I of
+    the `j`th subsequence in `T_B` with its distance to the `i`th subsequence in `T_A`
+
+    Equal Pearson correlations are resolved in favor of the distance with the lowest
+    rank (see `_get_rank`).
+
+    Parameters
+    ----------
+    ρ : numpy.ndarray
+        The Pearson correlations for the subsequences in `T_B`
+
+    I : numpy.ndarray
+        The matrix profile indices for the subsequences in `T_B`
+
+    c : int
+        The row in `ρ` and `I` that corresponds to the `j`th subsequence in `T_B`
+
+    pearson : float
+        The Pearson correlation between the `i`th subsequence in `T_A` and the `j`th
+        subsequence in `T_B`
+
+    i : int
+        The index of the subsequence in `T_A`
+
+    j : int
+        The index of the subsequence in `T_B`
+
+    left : bool
+        When `True`, the left Pearson correlation and the left matrix profile index
+        are also updated
+
+    T_A_offset : int
+        The index of the first subsequence in `T_A` relative to the full time series
+
+    diags_rank : numpy.ndarray
+        The (scaled) position of each diagonal in the original array of diagonals
+
+    l_A : int
+        The total number of subsequences in `T_A`
+
+    Returns
+    -------
+    None
+    """
+    for idx in range(2):
+        if idx == 1 and not left:
+            break
+
+        if pearson > ρ[c, idx] or (
+            pearson == ρ[c, idx]
+            and _get_rank(i, j, diags_rank, l_A)
+            < _get_rank(I[c, idx] - T_A_offset, j, diags_rank, l_A)
+        ):
+            ρ[c, idx] = pearson
+            I[c, idx] = i + T_A_offset
+
+
 @njit(
     # "(f8[:], f8[:], i8, f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:],"
-    # "b1[:], b1[:], b1[:], b1[:], i8[:], i8, i8, i8, f8[:, :, :], i8[:, :, :], b1)",
+    # "b1[:], b1[:], b1[:], b1[:], i8[:], i8[:], i8, i8, i8, i8, f8[:], f8[:, :],"
+    # "i8[:, :], f8[:, :], i8[:, :], f8[:, :], i8[:, :], i8, i8, i8, b1)",
     fastmath=True,
 )
-def _compute_diagonal(
+def _compute_tile(
     T_A,
     T_B,
     m,
@@ -36,17 +200,41 @@ def _compute_diagonal(
     T_A_subseq_isconstant,
     T_B_subseq_isconstant,
     diags,
+    diags_rank,
     diags_start_idx,
     diags_stop_idx,
-    thread_idx,
-    ρ,
-    I,
+    row_start,
+    row_stop,
+    diags_cov,
+    ρ_A,
+    I_A,
+    ρ_B,
+    I_B,
+    ρ_B_head,
+    I_B_head,
+    head_start,
+    T_A_offset,
+    T_B_offset,
     ignore_trivial,
 ):
     """
-    Compute (Numba JIT-compiled) and update the Pearson correlation, ρ, and I
-    sequentially along individual diagonals using a single thread and avoiding race
-    conditions
+    Compute (Numba JIT-compiled) and update the Pearson correlations, ρ, and I for a
+    tile of the distance matrix that is bounded by a range of diagonals and a range
+    of rows using a single thread
+
+    The rows (subsequences of `T_A`) and the columns (subsequences of `T_B`) are
+    updated in separate arrays and the indices that are recorded are shifted by
+    `T_A_offset` and `T_B_offset`, respectively. This allows `T_A` and `T_B` to be
+    (non-overlapping) pieces of a much longer time series. The column updates for the
+    subsequences in `T_B` that fall in `[head_start, head_start + len(ρ_B_head))` are
+    diverted to `ρ_B_head` and `I_B_head` so that they can be kept private to a thread.
+
+    The covariance is only computed from scratch at the start of each diagonal.
+    Otherwise, the covariance that was left behind in `diags_cov` by the tile that
+    was processed immediately above this one (i.e., the tile with the same range of
+    diagonals and whose `row_stop` equals this tile's `row_start`) is carried over.
+    For single precision (`np.float32`) inputs, the covariance is always computed from
+    scratch at the start of the tile instead.
 
     Parameters
     ----------
@@ -85,10 +273,6 @@ def _compute_diagonal(
     cov_d : numpy.ndarray
         The fourth covariance term relating T_B[i - 1] and μ_Q_m_1[i]
 
-    μ_Q_m_1 : numpy.ndarray
-        Mean of the query sequence, `Q`, relative to the current sliding window and
-        using a window size of `m-1`
-
     T_A_subseq_isfinite : numpy.ndarray
         A boolean array that indicates whether a subsequence in `T_A` contains a
         `np.nan`/`np.inf` value (False)
@@ -106,63 +290,83 @@ def _compute_diagonal(
     diags : numpy.ndarray
         The diagonal indices
 
+    diags_rank : numpy.ndarray
+        The (scaled) position of each diagonal in the original array of diagonals,
+        which is used to break ties between equal Pearson correlations. See
+        `_get_rank`.
+
     diags_start_idx : int
         The starting (inclusive) diagonal index
 
     diags_stop_idx : int
         The stopping (exclusive) diagonal index
 
-    thread_idx : int
-        The thread index
+    row_start : int
+        The starting (inclusive) row index
 
-    ρ : numpy.ndarray
-        The Pearson correlations
+    row_stop : int
+        The stopping (exclusive) row index
 
-    I : numpy.ndarray
-        The matrix profile indices
+    diags_cov : numpy.ndarray
+        The most recent covariance along each diagonal in
+        `diags[diags_start_idx : diags_stop_idx]`. This is updated inplace.
 
-    ignore_trivial : bool
-        Set to `True` if this is a self-join. Otherwise, for AB-join, set this to
-        `False`. Default is `True`.
+    ρ_A : numpy.ndarray
+        The Pearson correlations for the rows, `[row_start, row_stop)`, of the tile
 
-    Returns
-    -------
-    None
+    I_A : numpy.ndarray
+        The matrix profile indices for the rows, `[row_start, row_stop)`, of the tile
 
-    Notes
-    -----
-    `DOI: 10.1007/s10115-017-1138-x \
-    <https://www.cs.ucr.edu/~eamonn/ten_quadrillion.pdf>`__
+    ρ_B : numpy.ndarray
+        The Pearson correlations for all of the subsequences in `T_B`. This is only
+        updated when `ignore_trivial = True`.
 
-    See Section 4.5
+    I_B : numpy.ndarray
+        The matrix profile indices for all of the subsequences in `T_B`. This is only
+        updated when `ignore_trivial = True`.
 
-    The above reference outlines a general approach for traversing the distance
-    matrix in a diagonal fashion rather than in a row-wise fashion.
+    ρ_B_head : numpy.ndarray
+        The Pearson correlations for the subsequences in `T_B` that start at
+        `head_start`. This is only updated when `ignore_trivial = True`.
 
-    `DOI: 10.1145/3357223.3362721 \
-    <https://www.cs.ucr.edu/~eamonn/public/GPU_Matrix_profile_VLDB_30DraftOnly.pdf>`__
+    I_B_head : numpy.ndarray
+        The matrix profile indices for the subsequences in `T_B` that start at
+        `head_start`. This is only updated when `ignore_trivial = True`.
 
-    See Section 3.1 and Section 3.3
+    head_start : int
+        The index of the first subsequence in `T_B` that is tracked by `ρ_B_head`
 
-    The above reference outlines the use of the Pearson correlation via Welford's
-    centered sum-of-products along each diagonal of the distance matrix in place of the
-    sliding window dot product found in the original STOMP method.
+    T_A_offset : int
+        The index of the first subsequence in `T_A` relative to the full time series
+
+    T_B_offset : int
+        The index of the first subsequence in `T_B` relative to the full time series
+
+    ignore_trivial : bool
+        Set to `True` if this is a self-join. Otherwise, for AB-join, set this to
+        `False`.
+
+    Returns
+    -------
+    None
     """
     n_A = T_A.shape[0]
     n_B = T_B.shape[0]
+    l_A = n_A - m + 1
     m_inverse = 1.0 / m
     constant = (m - 1) * m_inverse * m_inverse  # (m - 1)/(m * m)
+    head_stop = head_start + ρ_B_head.shape[0]
 
     for diag_idx in range(diags_start_idx, diags_stop_idx):
         k = diags[diag_idx]
 
-        if k >= 0:
-            iter_range = range(0, min(n_A - m + 1, n_B - m + 1 - k))
-        else:
-            iter_range = range(-k, min(n_A - m + 1, n_B - m + 1 - k))
+        iter_start = max(row_start, max(0, -k))
+        iter_stop = min(row_stop, min(n_A - m + 1, n_B - m + 1 - k))
 
-        for i in iter_range:
-            if i == 0 or (k < 0 and i == -k):
+        for i in range(iter_start, iter_stop):
+            # In single precision, the covariance is re-anchored at the start of every
+            # tile in order to keep the rounding errors from accumulating
+            if i == max(0, -k) or (T_A.itemsize == 4 and i == iter_start):
                 cov = (
                     np.dot(
                         (T_B[i + k : i + k + m] - M_T[i + k]), (T_A[i : i + m] - μ_Q[i])
@@ -170,6 +374,8 @@ def _compute_diagonal(
                     * m_inverse
                 )
             else:
+                if i == iter_start:
+                    cov = diags_cov[diag_idx - diags_start_idx]
                 # The next lines are equivalent and left for reference
                 # cov = cov + constant * (
                 #     (T_B[i + k + m - 1] - M_T_m_1[i + k])
@@ -190,29 +396,410 @@ def _compute_diagonal(
                 if T_B_subseq_isconstant[i + k] and T_A_subseq_isconstant[i]:
                     pearson = 1.0
 
-                if pearson > ρ[thread_idx, i, 0]:
-                    ρ[thread_idx, i, 0] = pearson
-                    I[thread_idx, i, 0] = i + k
+                # The left/right matrix profiles are only available for self-joins
+                left_right = ignore_trivial and i + T_A_offset < i + k + T_B_offset
+                _update_row(
+                    ρ_A,
+                    I_A,
+                    i - row_start,
+                    pearson,
+                    i,
+                    i + k,
+                    left_right,
+                    T_B_offset,
+                    diags_rank,
+                    l_A,
+                )
 
                 if ignore_trivial:  # self-joins only
-                    if pearson > ρ[thread_idx, i + k, 0]:
-                        ρ[thread_idx, i + k, 0] = pearson
-                        I[thread_idx, i + k, 0] = i
+                    if head_start <= i + k < head_stop:
+                        _update_col(
+                            ρ_B_head,
+                            I_B_head,
+                            i + k - head_start,
+                            pearson,
+                            i,
+                            i + k,
+                            left_right,
+                            T_A_offset,
+                            diags_rank,
+                            l_A,
+                        )
+                    else:
+                        _update_col(
+                            ρ_B,
+                            I_B,
+                            i + k,
+                            pearson,
+                            i,
+                            i + k,
+                            left_right,
+                            T_A_offset,
+                            diags_rank,
+                            l_A,
+                        )
+
+        if iter_start < iter_stop:
+            diags_cov[diag_idx - diags_start_idx] = cov
+
+    return
 
-                    if i < i + k:
-                        # left pearson correlation and left matrix profile index
-                        if pearson > ρ[thread_idx, i + k, 1]:
-                            ρ[thread_idx, i + k, 1] = pearson
-                            I[thread_idx, i + k, 1] = i
 
-                        # right pearson correlation and right matrix profile index
-                        if pearson > ρ[thread_idx, i, 2]:
-                            ρ[thread_idx, i, 2] = pearson
-                            I[thread_idx, i, 2] = i + k
+@njit(
+    # "(f8[:], f8[:], i8, f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:],"
+    # "b1[:], b1[:], b1[:], b1[:], i8[:], f8[:, :], i8[:, :], f8[:, :], i8[:, :],"
+    # "i8, i8, b1)",
+    parallel=True,
+    fastmath=True,
+)
+def _compute_diagonal(
+    T_A,
+    T_B,
+    m,
+    M_T,
+    μ_Q,
+    Σ_T_inverse,
+    σ_Q_inverse,
+    cov_a,
+    cov_b,
+    cov_c,
+    cov_d,
+    T_A_subseq_isfinite,
+    T_B_subseq_isfinite,
+    T_A_subseq_isconstant,
+    T_B_subseq_isconstant,
+    diags,
+    ρ_A,
+    I_A,
+    ρ_B,
+    I_B,
+    T_A_offset,
+    T_B_offset,
+    ignore_trivial,
+):
+    """
+    Compute (Numba JIT-compiled) and update the Pearson correlation, ρ, and I in
+    parallel along individual diagonals while avoiding race conditions
+
+    The distance matrix is swept from top to bottom in steps that are
+    `config.STUMPY_DIAGONAL_TILE_HEIGHT` rows tall. In each step, the (sorted)
+    diagonals are split into contiguous ranges that contain the same number of
+    distances and every thread sweeps its range in bands of
+    `config.STUMPY_DIAGONAL_TILE_WIDTH` diagonals. This keeps the parts of `T_A`,
+    `T_B`, their sliding statistics, and `ρ` that are touched by a single tile in the
+    CPU cache while the covariance along each diagonal is carried over from one step
+    to the next.
+
+    Instead of giving every thread its own copy of `ρ` and `I`, the row updates are
+    collected in a small private buffer that is merged after each step. Since the
+    diagonals of neighboring threads are contiguous, the columns that are updated by
+    a thread can only overlap with the first `config.STUMPY_DIAGONAL_TILE_HEIGHT`
+    columns of the next thread and so only those columns need a private buffer while
+    all other column updates are written directly to `ρ_B` and `I_B`. Thus, the memory
+    usage scales with the length of the time series rather than with the number of
+    threads times the length of the time series.
+
+    Parameters
+    ----------
+    T_A : numpy.ndarray
+        The time series or sequence for which to compute the matrix profile
+
+    T_B : numpy.ndarray
+        The time series or sequence that will be used to annotate T_A. For every
+        subsequence in T_A, its nearest neighbor in T_B will be recorded.
+
+    m : int
+        Window size
+
+    M_T : numpy.ndarray
+        Sliding mean of time series, `T`
+
+    μ_Q : numpy.ndarray
+        Mean of the query sequence, `Q`, relative to the current sliding window
+
+    Σ_T_inverse : numpy.ndarray
+        Inverse sliding standard deviation of time series, `T`
+
+    σ_Q_inverse : numpy.ndarray
+        Inverse standard deviation of the query sequence, `Q`, relative to the current
+        sliding window
+
+    cov_a : numpy.ndarray
+        The first covariance term relating T_A[i + k + m - 1] and M_T_m_1[i + k]
+
+    cov_b : numpy.ndarray
+        The second covariance term relating T_B[i + m - 1] and μ_Q_m_1[i]
+
+    cov_c : numpy.ndarray
+        The third covariance term relating T_A[i + k - 1] and M_T_m_1[i + k]
+
+    cov_d : numpy.ndarray
+        The fourth covariance term relating T_B[i - 1] and μ_Q_m_1[i]
+
+    T_A_subseq_isfinite : numpy.ndarray
+        A boolean array that indicates whether a subsequence in `T_A` contains a
+        `np.nan`/`np.inf` value (False)
+
+    T_B_subseq_isfinite : numpy.ndarray
+        A boolean array that indicates whether a subsequence in `T_B` contains a
+        `np.nan`/`np.inf` value (False)
+
+    T_A_subseq_isconstant : numpy.ndarray
+        A boolean array that indicates whether a subsequence in `T_A` is constant (True)
+
+    T_B_subseq_isconstant : numpy.ndarray
+        A boolean array that indicates whether a subsequence in `T_B` is constant (True)
+
+    diags : numpy.ndarray
+        The diagonal indices
+
+    ρ_A : numpy.ndarray
+        The Pearson correlations for all of the subsequences in `T_A`. This is updated
+        inplace.
+
+    I_A : numpy.ndarray
+        The matrix profile indices for all of the subsequences in `T_A`. This is
+        updated inplace.
+
+    ρ_B : numpy.ndarray
+        The Pearson correlations for all of the subsequences in `T_B`. For a
+        self-join, this is typically the same array as `ρ_A`. This is updated inplace.
+
+    I_B : numpy.ndarray
+        The matrix profile indices for all of the subsequences in `T_B`. For a
+        self-join, this is typically the same array as `I_A`. This is updated inplace.
+
+    T_A_offset : int
+        The index of the first subsequence in `T_A` relative to the full time series
+
+    T_B_offset : int
+        The index of the first subsequence in `T_B` relative to the full time series
+
+    ignore_trivial : bool
+        Set to `True` if this is a self-join. Otherwise, for AB-join, set this to
+        `False`. Default is `True`.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    `DOI: 10.1007/s10115-017-1138-x \
+    <https://www.cs.ucr.edu/~eamonn/ten_quadrillion.pdf>`__
+
+    See Section 4.5
+
+    The above reference outlines a general approach for traversing the distance
+    matrix in a diagonal fashion rather than in a row-wise fashion.
+
+    `DOI: 10.1145/3357223.3362721 \
+    <https://www.cs.ucr.edu/~eamonn/public/GPU_Matrix_profile_VLDB_30DraftOnly.pdf>`__
+
+    See Section 3.1 and Section 3.3
+
+    The above reference outlines the use of the Pearson correlation via Welford's
+    centered sum-of-products along each diagonal of the distance matrix in place of the
+    sliding window dot product found in the original STOMP method.
+    """
+    l_A = T_A.shape[0] - m + 1
+    l_B = T_B.shape[0] - m + 1
+    n_threads = numba.config.NUMBA_NUM_THREADS
+    tile_height = config.STUMPY_DIAGONAL_TILE_HEIGHT
+    tile_width = config.STUMPY_DIAGONAL_TILE_WIDTH
+
+    # Equal Pearson correlations are resolved in favor of the diagonal that appears
+    # first in `diags` regardless of the order in which the diagonals are processed
+    diags_rank = np.empty(l_A + l_B - 1, dtype=np.int64)
+    for diag_idx in range(diags.shape[0]):
+        diags_rank[diags[diag_idx] + l_A - 1] = diag_idx * l_A
+
+    diags = np.sort(diags)
+    diags_cov = np.empty(diags.shape[0], dtype=np.float64)
+    diags_ndist = np.empty(diags.shape[0], dtype=np.int64)
+    ρ_rows = np.empty((n_threads, tile_height, 3), dtype=ρ_A.dtype)
+    I_rows = np.empty((n_threads, tile_height, 3), dtype=np.int64)
+    ρ_head = np.empty((n_threads, tile_height, 3), dtype=ρ_B.dtype)
+    I_head = np.empty((n_threads, tile_height, 3), dtype=np.int64)
+    head_start = np.empty(n_threads, dtype=np.int64)
+
+    # Find the range of rows that is covered by all of the diagonals
+    rows_start = l_A
+    rows_stop = 0
+    for diag_idx in range(diags.shape[0]):
+        k = diags[diag_idx]
+        if max(0, -k) < min(l_A, l_B - k):
+            rows_start = min(rows_start, max(0, -k))
+            rows_stop = max(rows_stop, min(l_A, l_B - k))
+
+    for row_start in range(rows_start, rows_stop, tile_height):
+        row_stop = min(row_start + tile_height, rows_stop)
+
+        # Balance the distances within this step across all threads
+        for diag_idx in prange(diags.shape[0]):
+            k = diags[diag_idx]
+            diags_ndist[diag_idx] = max(0, min(row_stop, l_B - k) - max(row_start, -k))
+        if diags_ndist.sum() == 0:
+            continue
+        diags_ranges = core._get_array_ranges(diags_ndist, n_threads, False)
+
+        for thread_idx in prange(n_threads):
+            diags_start_idx = diags_ranges[thread_idx, 0]
+            diags_stop_idx = diags_ranges[thread_idx, 1]
+            ρ_rows[thread_idx] = -np.inf
+            I_rows[thread_idx] = -1
+            ρ_head[thread_idx] = -np.inf
+            I_head[thread_idx] = -1
+            head_start[thread_idx] = l_B
+            if diags_start_idx < diags_stop_idx:
+                head_start[thread_idx] = max(0, row_start + diags[diags_start_idx])
+
+            for band_start_idx in range(diags_start_idx, diags_stop_idx, tile_width):
+                band_stop_idx = min(band_start_idx + tile_width, diags_stop_idx)
+                _compute_tile(
+                    T_A,
+                    T_B,
+                    m,
+                    M_T,
+                    μ_Q,
+                    Σ_T_inverse,
+                    σ_Q_inverse,
+                    cov_a,
+                    cov_b,
+                    cov_c,
+                    cov_d,
+                    T_A_subseq_isfinite,
+                    T_B_subseq_isfinite,
+                    T_A_subseq_isconstant,
+                    T_B_subseq_isconstant,
+                    diags,
+                    diags_rank,
+                    band_start_idx,
+                    band_stop_idx,
+                    row_start,
+                    row_stop,
+                    diags_cov[band_start_idx:band_stop_idx],
+                    ρ_rows[thread_idx],
+                    I_rows[thread_idx],
+                    ρ_B,
+                    I_B,
+                    ρ_head[thread_idx],
+                    I_head[thread_idx],
+                    head_start[thread_idx],
+                    T_A_offset,
+                    T_B_offset,
+                    ignore_trivial,
+                )
+
+        # Merge the private buffers from all threads
+        if ignore_trivial:
+            for thread_idx in range(n_threads):
+                head_size = min(tile_height, max(0, l_B - head_start[thread_idx]))
+                for j in prange(
+                    head_start[thread_idx], head_start[thread_idx] + head_size
+                ):
+                    for idx in range(3):
+                        ρ_col = ρ_head[thread_idx, j - head_start[thread_idx], idx]
+                        I_col = I_head[thread_idx, j - head_start[thread_idx], idx]
+                        if ρ_B[j, idx] < ρ_col:
+                            ρ_B[j, idx] = ρ_col
+                            I_B[j, idx] = I_col
+                        elif ρ_B[j, idx] == ρ_col and I_col >= 0:
+                            rank = _get_rank(I_col - T_A_offset, j, diags_rank, l_A)
+                            ref_rank = _get_rank(
+                                I_B[j, idx] - T_A_offset, j, diags_rank, l_A
+                            )
+                            if rank < ref_rank:
+                                I_B[j, idx] = I_col
+
+        for thread_idx in range(n_threads):
+            for i in prange(row_start, row_stop):
+                for idx in range(3):
+                    ρ_row = ρ_rows[thread_idx, i - row_start, idx]
+                    I_row = I_rows[thread_idx, i - row_start, idx]
+                    if ρ_A[i, idx] < ρ_row:
+                        ρ_A[i, idx] = ρ_row
+                        I_A[i, idx] = I_row
+                    elif ρ_A[i, idx] == ρ_row and I_row >= 0:
+                        if ignore_trivial and I_A[i, idx] < i + T_A_offset:
+                            # A column update from a self-join
+                            ref_rank = _get_rank(
+                                I_A[i, idx] - T_A_offset,
+                                i + T_A_offset - T_B_offset,
+                                diags_rank,
+                                l_A,
+                            )
+                        else:
+                            ref_rank = _get_rank(
+                                i, I_A[i, idx] - T_B_offset, diags_rank, l_A
+                            )
+                        if _get_rank(i, I_row - T_B_offset, diags_rank, l_A) < ref_rank:
+                            I_A[i, idx] = I_row
 
     return
 
 
+@njit(
+    # "UniTuple(f8[:], 4)(f8[:], f8[:], i8, f8[:], f8[:])",
+    fastmath=True,
+)
+def _compute_cov_terms(T_A, T_B, m, M_T_m_1, μ_Q_m_1):
+    """
+    Compute (Numba JIT-compiled) the four terms that are needed to update the
+    covariance when moving from one cell to the next along a diagonal of the
+    distance matrix
+
+    Parameters
+    ----------
+    T_A : numpy.ndarray
+        The time series or sequence for which to compute the matrix profile
+
+    T_B : numpy.ndarray
+        The time series or sequence that will be used to annotate T_A
+
+    m : int
+        Window size
+
+    M_T_m_1 : numpy.ndarray
+        Sliding mean of time series, `T_B`, using a window size of `m-1`
+
+    μ_Q_m_1 : numpy.ndarray
+        Sliding mean of time series, `T_A`, using a window size of `m-1`
+
+    Returns
+    -------
+    cov_a : numpy.ndarray
+        The first covariance term relating T_A[i + k + m - 1] and M_T_m_1[i + k]
+
+    cov_b : numpy.ndarray
+        The second covariance term relating T_B[i + m - 1] and μ_Q_m_1[i]
+
+    cov_c : numpy.ndarray
+        The third covariance term relating T_A[i + k - 1] and M_T_m_1[i + k]
+
+    cov_d : numpy.ndarray
+        The fourth covariance term relating T_B[i - 1] and μ_Q_m_1[i]
+    """
+    cov_a = T_B[m - 1 :] - M_T_m_1[:-1]
+    cov_b = T_A[m - 1 :] - μ_Q_m_1[:-1]
+    # The next lines are equivalent and left for reference
+    # cov_c = np.roll(T_A, 1)
+    # cov_ = cov_c[:M_T_m_1.shape[0]] - M_T_m_1[:]
+    cov_c = np.empty(M_T_m_1.shape[0], dtype=T_B.dtype)
+    cov_c[1:] = T_B[: M_T_m_1.shape[0] - 1]
+    cov_c[0] = T_B[-1]
+    cov_c[:] = cov_c - M_T_m_1
+    # The next lines are equivalent and left for reference
+    # cov_d = np.roll(T_B, 1)
+    # cov_d = cov_d[:μ_Q_m_1.shape[0]] - μ_Q_m_1[:]
+    cov_d = np.empty(μ_Q_m_1.shape[0], dtype=T_A.dtype)
+    cov_d[1:] = T_A[: μ_Q_m_1.shape[0] - 1]
+    cov_d[0] = T_A[-1]
+    cov_d[:] = cov_d - μ_Q_m_1
+
+    return cov_a, cov_b, cov_c, cov_d
+
+
 @njit(
     # "(f8[:], f8[:], i8, f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], b1[:], b1[:],"
     # "b1[:], b1[:], i8[:], b1)",
@@ -350,76 +937,40 @@ def _stump(
     Note that left and right matrix profiles are only available for self-joins.
     """
     n_A = T_A.shape[0]
-    n_B = T_B.shape[0]
     l = n_A - m + 1
-    n_threads = numba.config.NUMBA_NUM_THREADS
-    ρ = np.full((n_threads, l, 3), -np.inf, dtype=np.float64)
-    I = np.full((n_threads, l, 3), -1, dtype=np.int64)
-
-    ndist_counts = core._count_diagonal_ndist(diags, m, n_A, n_B)
-    diags_ranges = core._get_array_ranges(ndist_counts, n_threads, False)
-
-    cov_a = T_B[m - 1 :] - M_T_m_1[:-1]
-    cov_b = T_A[m - 1 :] - μ_Q_m_1[:-1]
-    # The next lines are equivalent and left for reference
-    # cov_c = np.roll(T_A, 1)
-    # cov_ = cov_c[:M_T_m_1.shape[0]] - M_T_m_1[:]
-    cov_c = np.empty(M_T_m_1.shape[0], dtype=np.float64)
-    cov_c[1:] = T_B[: M_T_m_1.shape[0] - 1]
-    cov_c[0] = T_B[-1]
-    cov_c[:] = cov_c - M_T_m_1
-    # The next lines are equivalent and left for reference
-    # cov_d = np.roll(T_B, 1)
-    # cov_d = cov_d[:μ_Q_m_1.shape[0]] - μ_Q_m_1[:]
-    cov_d = np.empty(μ_Q_m_1.shape[0], dtype=np.float64)
-    cov_d[1:] = T_A[: μ_Q_m_1.shape[0] - 1]
-    cov_d[0] = T_A[-1]
-    cov_d[:] = cov_d - μ_Q_m_1
+    ρ = np.full((l, 3), -np.inf, dtype=T_A.dtype)
+    I = np.full((l, 3), -1, dtype=np.int64)
 
-    for thread_idx in prange(n_threads):
-        # Compute and update cov, I within a single thread to avoiding race conditions
-        _compute_diagonal(
-            T_A,
-            T_B,
-            m,
-            M_T,
-            μ_Q,
-            Σ_T_inverse,
-            σ_Q_inverse,
-            cov_a,
-            cov_b,
-            cov_c,
-            cov_d,
-            T_A_subseq_isfinite,
-            T_B_subseq_isfinite,
-            T_A_subseq_isconstant,
-            T_B_subseq_isconstant,
-            diags,
-            diags_ranges[thread_idx, 0],
-            diags_ranges[thread_idx, 1],
-            thread_idx,
-            ρ,
-            I,
-            ignore_trivial,
-        )
+    cov_a, cov_b, cov_c, cov_d = _compute_cov_terms(T_A, T_B, m, M_T_m_1, μ_Q_m_1)
 
-    # Reduction of results from all threads
-    for thread_idx in range(1, n_threads):
-        for i in prange(l):
-            if ρ[0, i, 0] < ρ[thread_idx, i, 0]:
-                ρ[0, i, 0] = ρ[thread_idx, i, 0]
-                I[0, i, 0] = I[thread_idx, i, 0]
-            # left pearson correlation and left matrix profile indices
-            if ρ[0, i, 1] < ρ[thread_idx, i, 1]:
-                ρ[0, i, 1] = ρ[thread_idx, i, 1]
-                I[0, i, 1] = I[thread_idx, i, 1]
-            # right pearson correlation and right matrix profile indices
-            if ρ[0, i, 2] < ρ[thread_idx, i, 2]:
-                ρ[0, i, 2] = ρ[thread_idx, i, 2]
-                I[0, i, 2] = I[thread_idx, i, 2]
+    _compute_diagonal(
+        T_A,
+        T_B,
+        m,
+        M_T,
+        μ_Q,
+        Σ_T_inverse,
+        σ_Q_inverse,
+        cov_a,
+        cov_b,
+        cov_c,
+        cov_d,
+        T_A_subseq_isfinite,
+        T_B_subseq_isfinite,
+        T_A_subseq_isconstant,
+        T_B_subseq_isconstant,
+        diags,
+        ρ,
+        I,
+        ρ,
+        I,
+        0,
+        0,
+        ignore_trivial,
+    )
 
     # Convert pearson correlations to distances
-    p_norm = np.abs(2 * m * (1 - ρ[0, :, :]))
+    p_norm = np.abs(2 * m * (1 - ρ))
     for i in prange(p_norm.shape[0]):
         if p_norm[i, 0] < config.STUMPY_P_NORM_THRESHOLD:
             p_norm[i, 0] = 0.0
@@ -429,11 +980,20 @@ def _stump(
             p_norm[i, 2] = 0.0
     P = np.sqrt(p_norm)
 
-    return P[:, :], I[0, :, :]
+    return P, I
 
 
 @core.non_normalized(aamp)
-def stump(T_A, m, T_B=None, ignore_trivial=True, normalize=True, p=2.0):
+def stump(
+    T_A,
+    m,
+    T_B=None,
+    ignore_trivial=True,
+    normalize=True,
+    p=2.0,
+    dtype=np.float64,
+    typed=None,
+):
     """
     Compute the z-normalized matrix profile
 
@@ -467,13 +1027,33 @@ def stump(T_A, m, T_B=None, ignore_trivial=True, normalize=True, p=2.0):
         The p-norm to apply for computing the Minkowski distance. This parameter is
         ignored when `normalize == True`.
 
+    dtype : dtype, default np.float64
+        The floating point precision that is used to compute the matrix profile.
+        Setting this to `np.float32` roughly halves the memory usage (and the
+        memory traffic) at the cost of accuracy. The sliding window statistics are
+        always computed in double precision and the covariance along each diagonal is
+        periodically recomputed from scratch so that the rounding errors do not
+        accumulate. However, the matrix profile will still deviate slightly from the
+        double precision result and near-ties may resolve to different indices.
+
+    typed : bool, default None
+        When set to `True`, a `MatrixProfile` named tuple is returned where the
+        (global) matrix profile, `P`, the left matrix profile, `left_P`, and the right
+        matrix profile, `right_P`, are stored in floating point arrays alongside their
+        corresponding integer matrix profile indices (i.e., `I`, `left_I`, and
+        `right_I`). When set to `False`, the left and right matrix profiles are
+        discarded and a `numpy.ndarray` with `dtype=object` is returned. The default
+        value of `None` defers to `config.STUMPY_TYPED_OUTPUT`.
+
     Returns
     -------
-    out : numpy.ndarray
+    out : numpy.ndarray or MatrixProfile
         The first column consists of the matrix profile, the second column
         consists of the matrix profile indices, the third column consists of
         the left matrix profile indices, and the fourth column consists of
-        the right matrix profile indices.
+        the right matrix profile indices. When `typed=True`, a `MatrixProfile` named
+        tuple with fields `P`, `I`, `left_P`, `left_I`, `right_P`, and `right_I` is
+        returned instead.
 
     See Also
     --------
@@ -560,6 +1140,15 @@ def stump(T_A, m, T_B=None, ignore_trivial=True, normalize=True, p=2.0):
         T_B_subseq_isconstant,
     ) = core.preprocess_diagonal(T_B, m)
 
+    dtype = core.check_precision(dtype)
+    if dtype != np.float64:
+        T_A, μ_Q, σ_Q_inverse, μ_Q_m_1 = (
+            a.astype(dtype) for a in (T_A, μ_Q, σ_Q_inverse, μ_Q_m_1)
+        )
+        T_B, M_T, Σ_T_inverse, M_T_m_1 = (
+            a.astype(dtype) for a in (T_B, M_T, Σ_T_inverse, M_T_m_1)
+        )
+
     if T_A.ndim != 1:  # pragma: no cover
         raise ValueError(
             f"T_A is {T_A.ndim}-dimensional and must be 1-dimensional. "
@@ -612,12 +1201,17 @@ def stump(T_A, m, T_B=None, ignore_trivial=True, normalize=True, p=2.0):
         ignore_trivial,
     )
 
-    out[:, 0] = P[:, 0]
-    out[:, 1:] = I
-
     threshold = 10e-6
-    if core.are_distances_too_small(out[:, 0], threshold=threshold):  # pragma: no cover
+    if core.are_distances_too_small(P[:, 0], threshold=threshold):  # pragma: no cover
         logger.warning(f"A large number of values are smaller than {threshold}.")
         logger.warning("For a self-join, try setting `ignore_trivial = True`.")
 
+    if typed is None:
+        typed = config.STUMPY_TYPED_OUTPUT
+    if typed:
+        return core._matrix_profile(P, I)
+
+    out[:, 0] = P[:, 0]
+    out[:, 1:] = I
+
     return out
@@ -13,8 +13,84 @@ from .aamped import aamped
 logger = logging.getLogger(__name__)
 
 
+def _dask_stump(
+    T_A,
+    T_B,
+    m,
+    M_T,
+    μ_Q,
+    Σ_T_inverse,
+    σ_Q_inverse,
+    M_T_m_1,
+    μ_Q_m_1,
+    T_A_subseq_isfinite,
+    T_B_subseq_isfinite,
+    T_A_subseq_isconstant,
+    T_B_subseq_isconstant,
+    diags_start,
+    diags_stop,
+    ignore_trivial,
+):
+    """
+    Compute the matrix profile for a single tile of consecutive diagonals on a dask
+    worker
+
+    Only the start and (exclusive) stop diagonals are shipped with each task so that
+    the task graph stays small regardless of the length of the time series.
+
+    Parameters
+    ----------
+    diags_start : int
+        The first diagonal of the tile
+
+    diags_stop : int
+        The (exclusive) last diagonal of the tile
+
+    See `_stump` for the description of all other parameters
+
+    Returns
+    -------
+    PI : list
+        A list of `(start, P, I)` segments that only contain the rows of the matrix
+        profile and matrix profile indices that can be updated by this tile (see
+        `core._merge_PI`)
+    """
+    diags = np.arange(diags_start, diags_stop, dtype=np.int64)
+
+    P, I = _stump(
+        T_A,
+        T_B,
+        m,
+        M_T,
+        μ_Q,
+        Σ_T_inverse,
+        σ_Q_inverse,
+        M_T_m_1,
+        μ_Q_m_1,
+        T_A_subseq_isfinite,
+        T_B_subseq_isfinite,
+        T_A_subseq_isconstant,
+        T_B_subseq_isconstant,
+        diags,
+        ignore_trivial,
+    )
+
+    return core._get_PI_segments(
+        P, I, diags_start, diags_stop, T_B.shape[0] - m + 1, ignore_trivial
+    )
+
+
 @core.non_normalized(aamped)
-def stumped(dask_client, T_A, m, T_B=None, ignore_trivial=True, normalize=True, p=2.0):
+def stumped(
+    dask_client,
+    T_A,
+    m,
+    T_B=None,
+    ignore_trivial=True,
+    normalize=True,
+    p=2.0,
+    typed=None,
+):
     """
     Compute the z-normalized matrix profile with a distributed dask cluster
 
@@ -29,6 +105,8 @@ def stumped(dask_client, T_A, m, T_B=None, ignore_trivial=True, normalize=True,
         Dask workers. Setting up a Dask distributed cluster is beyond the
         scope of this library. Please refer to the Dask Distributed
         documentation.
+        Alternatively, a `stumpy.ProcessPoolClient` may be used to distribute
+        the work across local processes without a Dask scheduler.
 
     T_A : numpy.ndarray
         The time series or sequence for which to compute the matrix profile
@@ -54,13 +132,24 @@ def stumped(dask_client, T_A, m, T_B=None, ignore_trivial=True, normalize=True,
         The p-norm to apply for computing the Minkowski distance. This parameter is
         ignored when `normalize == True`.
 
+    typed : bool, default None
+        When set to `True`, a `MatrixProfile` named tuple is returned where the
+        (global) matrix profile, `P`, the left matrix profile, `left_P`, and the right
+        matrix profile, `right_P`, are stored in floating point arrays alongside their
+        corresponding integer matrix profile indices (i.e., `I`, `left_I`, and
+        `right_I`). When set to `False`, the left and right matrix profiles are
+        discarded and a `numpy.ndarray` with `dtype=object` is returned. The default
+        value of `None` defers to `config.STUMPY_TYPED_OUTPUT`.
+
     Returns
     -------
-    out : numpy.ndarray
+    out : numpy.ndarray or MatrixProfile
         The first column consists of the matrix profile, the second column
         consists of the matrix profile indices, the third column consists of
         the left matrix profile indices, and the fourth column consists of
-        the right matrix profile indices.
+        the right matrix profile indices. When `typed=True`, a `MatrixProfile` named
+        tuple with fields `P`, `I`, `left_P`, `left_I`, `right_P`, and `right_I` is
+        returned instead.
 
     See Also
     --------
@@ -193,46 +282,37 @@ def stumped(dask_client, T_A, m, T_B=None, ignore_trivial=True, normalize=True,
     else:
         diags = np.arange(-(n_A - m + 1) + 1, n_B - m + 1, dtype=np.int64)
 
+    # Split the diagonals into many small tiles (rather than one per worker) so that
+    # the scheduler can balance the load and retry any tile that is lost
+    n_tiles = nworkers * config.STUMPY_DASK_TASKS_PER_WORKER
     ndist_counts = core._count_diagonal_ndist(diags, m, n_A, n_B)
-    diags_ranges = core._get_array_ranges(ndist_counts, nworkers, False)
+    diags_ranges = core._get_tile_ranges(ndist_counts, n_tiles)
     diags_ranges += diags[0]
 
     # Scatter data to Dask cluster
-    T_A_future = dask_client.scatter(T_A, broadcast=True, hash=False)
-    T_B_future = dask_client.scatter(T_B, broadcast=True, hash=False)
-    M_T_future = dask_client.scatter(M_T, broadcast=True, hash=False)
-    μ_Q_future = dask_client.scatter(μ_Q, broadcast=True, hash=False)
-    Σ_T_inverse_future = dask_client.scatter(Σ_T_inverse, broadcast=True, hash=False)
-    σ_Q_inverse_future = dask_client.scatter(σ_Q_inverse, broadcast=True, hash=False)
-    M_T_m_1_future = dask_client.scatter(M_T_m_1, broadcast=True, hash=False)
-    μ_Q_m_1_future = dask_client.scatter(μ_Q_m_1, broadcast=True, hash=False)
-    T_A_subseq_isfinite_future = dask_client.scatter(
-        T_A_subseq_isfinite, broadcast=True, hash=False
-    )
-    T_B_subseq_isfinite_future = dask_client.scatter(
-        T_B_subseq_isfinite, broadcast=True, hash=False
+    T_A_future = core._dask_scatter(dask_client, T_A)
+    T_B_future = core._dask_scatter(dask_client, T_B)
+    M_T_future = core._dask_scatter(dask_client, M_T)
+    μ_Q_future = core._dask_scatter(dask_client, μ_Q)
+    Σ_T_inverse_future = core._dask_scatter(dask_client, Σ_T_inverse)
+    σ_Q_inverse_future = core._dask_scatter(dask_client, σ_Q_inverse)
+    M_T_m_1_future = core._dask_scatter(dask_client, M_T_m_1)
+    μ_Q_m_1_future = core._dask_scatter(dask_client, μ_Q_m_1)
+    T_A_subseq_isfinite_future = core._dask_scatter(dask_client, T_A_subseq_isfinite)
+    T_B_subseq_isfinite_future = core._dask_scatter(dask_client, T_B_subseq_isfinite)
+    T_A_subseq_isconstant_future = core._dask_scatter(
+        dask_client, T_A_subseq_isconstant
     )
-    T_A_subseq_isconstant_future = dask_client.scatter(
-        T_A_subseq_isconstant, broadcast=True, hash=False
+    T_B_subseq_isconstant_future = core._dask_scatter(
+        dask_client, T_B_subseq_isconstant
     )
-    T_B_subseq_isconstant_future = dask_client.scatter(
-        T_B_subseq_isconstant, broadcast=True, hash=False
-    )
-
-    diags_futures = []
-    for i, host in enumerate(hosts):
-        diags_future = dask_client.scatter(
-            np.arange(diags_ranges[i, 0], diags_ranges[i, 1], dtype=np.int64),
-            workers=[host],
-            hash=False,
-        )
-        diags_futures.append(diags_future)
 
     futures = []
-    for i in range(len(hosts)):
+    for diags_start, diags_stop in diags_ranges:
         futures.append(
-            dask_client.submit(
-                _stump,
+            core._dask_submit(
+                dask_client,
+                _dask_stump,
                 T_A_future,
                 T_B_future,
                 m,
@@ -246,44 +326,43 @@ def stumped(dask_client, T_A, m, T_B=None, ignore_trivial=True, normalize=True,
                 T_B_subseq_isfinite_future,
                 T_A_subseq_isconstant_future,
                 T_B_subseq_isconstant_future,
-                diags_futures[i],
+                diags_start,
+                diags_stop,
                 ignore_trivial,
             )
         )
 
-    results = dask_client.gather(futures)
-    profile, indices = results[0]
-    for i in range(1, len(hosts)):
-        P, I = results[i]
-        for col in range(P.shape[1]):  # pragma: no cover
-            cond = P[:, col] < profile[:, col]
-            profile[:, col] = np.where(cond, P[:, col], profile[:, col])
-            indices[:, col] = np.where(cond, I[:, col], indices[:, col])
+    # Merge the tiles on the cluster so that only a single (l, 3) result is gathered
+    future = core._dask_tree_reduce(dask_client, futures, core._merge_PI)
+    del futures  # Allow the workers to release each tile as soon as it is merged
+    profile, indices = core._assemble_PI(future.result(), l)
 
     out[:, 0] = profile[:, 0]
     out[:, 1:4] = indices
 
     # Delete data from Dask cluster
-    dask_client.cancel(T_A_future)
-    dask_client.cancel(T_B_future)
-    dask_client.cancel(M_T_future)
-    dask_client.cancel(μ_Q_future)
-    dask_client.cancel(Σ_T_inverse_future)
-    dask_client.cancel(σ_Q_inverse_future)
-    dask_client.cancel(M_T_m_1_future)
-    dask_client.cancel(μ_Q_m_1_future)
-    dask_client.cancel(T_A_subseq_isfinite_future)
-    dask_client.cancel(T_B_subseq_isfinite_future)
-    dask_client.cancel(T_A_subseq_isconstant_future)
-    dask_client.cancel(T_B_subseq_isconstant_future)
-    for diags_future in diags_futures:
-        dask_client.cancel(diags_future)
-    for future in futures:
-        dask_client.cancel(future)
+    dask_client.cancel(future)
+    core._dask_cancel(dask_client, T_A_future)
+    core._dask_cancel(dask_client, T_B_future)
+    core._dask_cancel(dask_client, M_T_future)
+    core._dask_cancel(dask_client, μ_Q_future)
+    core._dask_cancel(dask_client, Σ_T_inverse_future)
+    core._dask_cancel(dask_client, σ_Q_inverse_future)
+    core._dask_cancel(dask_client, M_T_m_1_future)
+    core._dask_cancel(dask_client, μ_Q_m_1_future)
+    core._dask_cancel(dask_client, T_A_subseq_isfinite_future)
+    core._dask_cancel(dask_client, T_B_subseq_isfinite_future)
+    core._dask_cancel(dask_client, T_A_subseq_isconstant_future)
+    core._dask_cancel(dask_client, T_B_subseq_isconstant_future)
 
     threshold = 10e-6
     if core.are_distances_too_small(out[:, 0], threshold=threshold):  # pragma: no cover
         logger.warning(f"A large number of values are smaller than {threshold}.")
         logger.warning("For a self-join, try setting `ignore_trivial = True`.")
 
+    if typed is None:
+        typed = config.STUMPY_TYPED_OUTPUT
+    if typed:
+        return core._matrix_profile(profile, indices)
+
     return out
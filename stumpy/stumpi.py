@@ -3,10 +3,191 @@
 # STUMPY is a trademark of TD Ameritrade IP Company, Inc. All rights reserved.
 
 import numpy as np
-from . import core, stump, config
+from numba import njit
+from . import core, config
+from .stump import _stump
 from .aampi import aampi
 
 
+@njit(
+    # "(f8[:], i8, i8, b1, f8[:], b1[:], f8[:], f8[:], f8[:], f8[:], f8[:], i8[:],"
+    # "f8[:], i8[:], i8, i8, i8)",
+    fastmath={"nsz", "arcp", "contract", "afn", "reassoc"},
+)
+def _update(
+    ts,
+    m,
+    excl_zone,
+    egress,
+    T,
+    T_isfinite,
+    M_T,
+    Σ_T,
+    QT,
+    QT_new,
+    P,
+    I,
+    left_P,
+    left_I,
+    start,
+    n,
+    n_appended,
+):
+    """
+    A Numba JIT-compiled function for ingressing the new data points, `ts`, one at a
+    time and updating the (left) matrix profile and (left) matrix profile indices
+
+    All of the arrays (except for `QT` and `QT_new`) are buffers that hold the current
+    window, which starts at `start` and has a length of `n` (or `n - m + 1` for the
+    per-subsequence arrays). Each buffer must have enough capacity to hold all of the
+    data points in `ts`.
+
+    Parameters
+    ----------
+    ts : numpy.ndarray
+        The new data points
+
+    m : int
+        Window size
+
+    excl_zone : int
+        The half width for the exclusion zone
+
+    egress : bool
+        If set to `True`, the oldest data point is egressed for each new data point
+
+    T : numpy.ndarray
+        The time series buffer where non-finite values have been replaced with zero
+
+    T_isfinite : numpy.ndarray
+        The buffer that tracks whether each data point in `T` is finite
+
+    M_T : numpy.ndarray
+        The sliding mean buffer
+
+    Σ_T : numpy.ndarray
+        The sliding standard deviation buffer
+
+    QT : numpy.ndarray
+        The dot product between the last subsequence and every subsequence in the
+        current window
+
+    QT_new : numpy.ndarray
+        A buffer for the updated dot product. Note that `QT` and `QT_new` are swapped
+        after each new data point
+
+    P : numpy.ndarray
+        The matrix profile buffer
+
+    I : numpy.ndarray
+        The matrix profile indices buffer
+
+    left_P : numpy.ndarray
+        The left matrix profile buffer
+
+    left_I : numpy.ndarray
+        The left matrix profile indices buffer
+
+    start : int
+        The start of the current window
+
+    n : int
+        The length of the current window
+
+    n_appended : int
+        The number of data points that have been egressed
+
+    Returns
+    -------
+    start : int
+        The start of the updated window
+
+    n : int
+        The length of the updated window
+
+    n_appended : int
+        The updated number of data points that have been egressed
+
+    Notes
+    -----
+    `DOI: 10.1007/s10618-017-0519-9 \
+    <https://www.cs.ucr.edu/~eamonn/MP_journal.pdf>`__
+
+    See Table V
+    """
+    for t in ts:
+        if egress:
+            start += 1
+            n_appended += 1
+            QT_offset = 1  # Drop the dot product of the egressed subsequence
+        else:
+            n += 1
+            QT_offset = 0
+        l = n - m + 1
+        T_window = T[start : start + n]
+        T_isfinite_window = T_isfinite[start : start + n]
+
+        if np.isfinite(t):
+            T_isfinite_window[-1] = True
+        else:
+            T_isfinite_window[-1] = False
+            t = 0.0
+        T_window[-1] = t
+        S = T_window[l - 1 :]
+        t_drop = T_window[l - 2]
+
+        Q_isfinite = np.all(T_isfinite_window[-m:])
+        if Q_isfinite:
+            μ_Q = np.mean(S)
+            σ_Q = np.std(S)
+        else:
+            μ_Q = np.inf
+            σ_Q = np.nan
+
+        M_T_window = M_T[start : start + l]
+        Σ_T_window = Σ_T[start : start + l]
+        M_T_window[-1] = μ_Q
+        Σ_T_window[-1] = σ_Q
+
+        for i in range(1, l):
+            QT_new[i] = (
+                QT[i - 1 + QT_offset]
+                - T_window[i - 1] * t_drop
+                + T_window[i - 1 + m] * t
+            )
+        QT_new[0] = np.sum(T_window[:m] * S)
+
+        D = core.calculate_distance_profile(
+            m, QT_new[:l], μ_Q, σ_Q, M_T_window, Σ_T_window
+        )
+        if not Q_isfinite:
+            D[:] = np.inf
+
+        core._apply_exclusion_zone(D, l - 1, excl_zone, np.inf)
+
+        P_window = P[start : start + l]
+        I_window = I[start : start + l]
+        for i in range(l - 1):
+            if D[i] < P_window[i]:
+                P_window[i] = D[i]
+                I_window[i] = l - 1 + n_appended
+
+        I_last = np.argmin(D)
+        if np.isinf(D[I_last]):
+            I_window[-1] = -1
+            P_window[-1] = np.inf
+        else:
+            I_window[-1] = I_last + n_appended
+            P_window[-1] = D[I_last]
+
+        left_I[start + l - 1] = I_last + n_appended
+        left_P[start + l - 1] = D[I_last]
+
+        QT, QT_new = QT_new, QT
+
+    return start, n, n_appended
+
+
 @core.non_normalized(aampi)
 class stumpi:
     """
@@ -60,6 +241,10 @@ class stumpi:
         Append a single new data point, `t`, to the time series, `T`, and update the
         matrix profile
 
+    update_many(ts)
+        Append multiple new data points, `ts`, to the time series, `T`, and update the
+        matrix profile
+
     Notes
     -----
     `DOI: 10.1007/s10618-017-0519-9 \
@@ -115,25 +300,65 @@ class stumpi:
         self._T_isfinite = np.isfinite(self._T)
         self._egress = egress
 
-        mp = stump(self._T, self._m)
-        self._P = mp[:, 0].astype(np.float64)
-        self._I = mp[:, 1].astype(np.int64)
-        self._left_I = mp[:, 2].astype(np.int64)
-        self._left_P = np.empty(self._P.shape, dtype=np.float64)
-        self._left_P[:] = np.inf
+        # Compute the (left) matrix profile with a single call to `_stump`, which
+        # already tracks the left matrix profile values
+        (
+            T,
+            μ_Q,
+            σ_Q_inverse,
+            μ_Q_m_1,
+            T_subseq_isfinite,
+            T_subseq_isconstant,
+        ) = core.preprocess_diagonal(self._T, self._m)
+        diags = np.arange(self._excl_zone + 1, self._n - self._m + 1, dtype=np.int64)
+        P, I = _stump(
+            T,
+            T,
+            self._m,
+            μ_Q,
+            μ_Q,
+            σ_Q_inverse,
+            σ_Q_inverse,
+            μ_Q_m_1,
+            μ_Q_m_1,
+            T_subseq_isfinite,
+            T_subseq_isfinite,
+            T_subseq_isconstant,
+            T_subseq_isconstant,
+            diags,
+            True,
+        )
+        self._P = P[:, 0].astype(np.float64)
+        self._I = I[:, 0].astype(np.int64)
+        self._left_P = P[:, 1].astype(np.float64)
+        self._left_I = I[:, 1].astype(np.int64)
 
         self._T, self._M_T, self._Σ_T = core.preprocess(self._T, self._m)
-        # Retrieve the left matrix profile values
-        for i, j in enumerate(self._left_I):
-            if j >= 0:
-                D = core.mass(self._T[i : i + self._m], self._T[j : j + self._m])
-                self._left_P[i] = D[0]
 
         Q = self._T[-m:]
         self._QT = core.sliding_dot_product(Q, self._T)
+        self._n_appended = 0
+
+        # The state is stored in buffers and each private attribute (e.g., `self._T`)
+        # is a view of the current window within its buffer. With egress, the buffers
+        # have `self._n` elements of slack so that the oldest data point is egressed by
+        # advancing a head offset, `self._head`, rather than by shifting every array.
+        # Without egress, the buffers double in capacity whenever they are full.
         if self._egress:
-            self._QT_new = np.empty(self._QT.shape[0], dtype=np.float64)
-            self._n_appended = 0
+            capacity = 2 * self._n
+        else:
+            capacity = self._n
+        self._head = 0
+        self._T_buffer = core._grow_buffer(self._T, capacity)
+        self._T_isfinite_buffer = core._grow_buffer(self._T_isfinite, capacity)
+        self._M_T_buffer = core._grow_buffer(self._M_T, capacity - self._m + 1)
+        self._Σ_T_buffer = core._grow_buffer(self._Σ_T, capacity - self._m + 1)
+        self._P_buffer = core._grow_buffer(self._P, capacity - self._m + 1)
+        self._I_buffer = core._grow_buffer(self._I, capacity - self._m + 1)
+        self._left_P_buffer = core._grow_buffer(self._left_P, capacity - self._m + 1)
+        self._left_I_buffer = core._grow_buffer(self._left_I, capacity - self._m + 1)
+        self._QT_buffer = self._QT
+        self._QT_new_buffer = np.empty(self._QT.shape[0], dtype=np.float64)
 
     def update(self, t):
         """
@@ -154,171 +379,154 @@ class stumpi:
 
         Note that line 11 is missing an important `sqrt` operation!
         """
-        if self._egress:
-            self._update_egress(t)
-        else:
-            self._update(t)
+        self._update(np.array([t], dtype=np.float64))
 
-    def _update_egress(self, t):
+    def update_many(self, ts):
         """
-        Ingress a new data point, egress the oldest data point, and update the matrix
-        profile and matrix profile indices
-        """
-        self._n = self._T.shape[0]
-        l = self._n - self._m + 1 - 1  # Subtract 1 due to egress
-        self._T[:-1] = self._T[1:]
-        self._T[-1] = t
-        self._n_appended += 1
-        self._QT[:-1] = self._QT[1:]
-        S = self._T[l:]
-        t_drop = self._T[l - 1]
-        self._T_isfinite[:-1] = self._T_isfinite[1:]
-
-        self._I[:-1] = self._I[1:]
-        self._P[:-1] = self._P[1:]
-        self._left_I[:-1] = self._left_I[1:]
-        self._left_P[:-1] = self._left_P[1:]
-
-        if np.isfinite(t):
-            self._T_isfinite[-1] = True
-        else:
-            self._T_isfinite[-1] = False
-            t = 0
-            self._T[-1] = 0
-            S[-1] = 0
-
-        if np.any(~self._T_isfinite[-self._m :]):
-            μ_Q = np.inf
-            σ_Q = np.nan
-        else:
-            μ_Q, σ_Q = core.compute_mean_std(S, self._m)
-            μ_Q = μ_Q[0]
-            σ_Q = σ_Q[0]
-
-        self._M_T[:-1] = self._M_T[1:]
-        self._Σ_T[:-1] = self._Σ_T[1:]
-        self._M_T[-1] = μ_Q
-        self._Σ_T[-1] = σ_Q
-
-        self._QT_new[1:] = self._QT[:l] - self._T[:l] * t_drop + self._T[self._m :] * t
-        self._QT_new[0] = np.sum(self._T[: self._m] * S[: self._m])
-
-        D = core.calculate_distance_profile(
-            self._m, self._QT_new, μ_Q, σ_Q, self._M_T, self._Σ_T
-        )
-        if np.any(~self._T_isfinite[-self._m :]):
-            D[:] = np.inf
-
-        core.apply_exclusion_zone(D, D.shape[0] - 1, self._excl_zone, np.inf)
-
-        update_idx = np.argwhere(D < self._P).flatten()
-        self._I[update_idx] = D.shape[0] + self._n_appended - 1  # D.shape[0] is base-1
-        self._P[update_idx] = D[update_idx]
-
-        I_last = np.argmin(D)
-
-        if np.isinf(D[I_last]):
-            self._I[-1] = -1
-            self._P[-1] = np.inf
-        else:
-            self._I[-1] = I_last + self._n_appended
-            self._P[-1] = D[I_last]
+        Append multiple new data points, `ts`, to the existing time series `T` and
+        update the matrix profile and matrix profile indices.
 
-        self._left_I[-1] = I_last + self._n_appended
-        self._left_P[-1] = D[I_last]
+        This produces the same result as calling `update` for each data point in `ts`
+        but all of the data points are ingested in a single Numba JIT-compiled pass.
 
-        self._QT[:] = self._QT_new
+        Parameters
+        ----------
+        ts : numpy.ndarray
+            The new data points to be appended to `T`
+        """
+        ts = core._preprocess(ts)
+        if ts.ndim != 1:  # pragma: no cover
+            raise ValueError(f"`ts` is {ts.ndim}-dimensional and must be 1-dimensional")
+        self._update(ts)
 
-    def _update(self, t):
+    def _update(self, ts):
         """
-        Ingress a new data point and update the matrix profile and matrix profile
-        indices without egressing the oldest data point
+        Ingress the new data points, `ts`, egress the same number of the oldest data
+        points (if `self._egress` is `True`), and update the matrix profile and matrix
+        profile indices
         """
         n = self._T.shape[0]
-        l = n - self._m + 1
-        T_new = np.append(self._T, t)
-        QT_new = np.empty(self._QT.shape[0] + 1, dtype=np.float64)
-        S = T_new[l:]
-        t_drop = T_new[l - 1]
-
-        if np.isfinite(t):
-            self._T_isfinite = np.append(self._T_isfinite, True)
-        else:
-            self._T_isfinite = np.append(self._T_isfinite, False)
-            t = 0
-            T_new[-1] = 0
-            S[-1] = 0
-
-        if np.any(~self._T_isfinite[-self._m :]):
-            μ_Q = np.inf
-            σ_Q = np.nan
+        if self._egress:
+            max_chunk_size = self._n  # The number of elements of slack
         else:
-            μ_Q, σ_Q = core.compute_mean_std(S, self._m)
-            μ_Q = μ_Q[0]
-            σ_Q = σ_Q[0]
-
-        M_T_new = np.append(self._M_T, μ_Q)
-        Σ_T_new = np.append(self._Σ_T, σ_Q)
-
-        QT_new[1:] = self._QT[:l] - T_new[:l] * t_drop + T_new[self._m :] * t
-        QT_new[0] = np.sum(T_new[: self._m] * S[: self._m])
-
-        D = core.calculate_distance_profile(self._m, QT_new, μ_Q, σ_Q, M_T_new, Σ_T_new)
-        if np.any(~self._T_isfinite[-self._m :]):
-            D[:] = np.inf
-
-        core.apply_exclusion_zone(D, D.shape[0] - 1, self._excl_zone, np.inf)
-
-        update_idx = np.argwhere(D[:l] < self._P[:l]).flatten()
-        self._I[update_idx] = l
-        self._P[update_idx] = D[update_idx]
+            max_chunk_size = ts.shape[0]
+            self._grow_buffers(n + ts.shape[0])
+
+        for chunk_start in range(0, ts.shape[0], max(1, max_chunk_size)):
+            chunk = ts[chunk_start : chunk_start + max_chunk_size]
+            if self._egress and self._head + n + chunk.shape[0] > len(self._T_buffer):
+                self._compact_buffers()
+
+            self._head, n, self._n_appended = _update(
+                chunk,
+                self._m,
+                self._excl_zone,
+                self._egress,
+                self._T_buffer,
+                self._T_isfinite_buffer,
+                self._M_T_buffer,
+                self._Σ_T_buffer,
+                self._QT_buffer,
+                self._QT_new_buffer,
+                self._P_buffer,
+                self._I_buffer,
+                self._left_P_buffer,
+                self._left_I_buffer,
+                self._head,
+                n,
+                self._n_appended,
+            )
+            if chunk.shape[0] % 2 == 1:
+                self._QT_buffer, self._QT_new_buffer = (
+                    self._QT_new_buffer,
+                    self._QT_buffer,
+                )
+
+        self._set_views(n)
+
+    def _grow_buffers(self, n):
+        """
+        Ensure that the growable buffers can hold a time series of length `n` (and its
+        corresponding subsequences)
+        """
+        l = n - self._m + 1
+        self._T_buffer = core._grow_buffer(self._T_buffer, n)
+        self._T_isfinite_buffer = core._grow_buffer(self._T_isfinite_buffer, n)
+        self._M_T_buffer = core._grow_buffer(self._M_T_buffer, l)
+        self._Σ_T_buffer = core._grow_buffer(self._Σ_T_buffer, l)
+        self._P_buffer = core._grow_buffer(self._P_buffer, l)
+        self._I_buffer = core._grow_buffer(self._I_buffer, l)
+        self._left_P_buffer = core._grow_buffer(self._left_P_buffer, l)
+        self._left_I_buffer = core._grow_buffer(self._left_I_buffer, l)
+        self._QT_buffer = core._grow_buffer(self._QT_buffer, l)
+        self._QT_new_buffer = core._grow_buffer(self._QT_new_buffer, l)
+
+    def _compact_buffers(self):
+        """
+        Move the current window of each egress buffer back to the start of its buffer
 
-        I_last = np.argmin(D)
-        if np.isinf(D[I_last]):
-            I_new = np.append(self._I, -1)
-            P_new = np.append(self._P, np.inf)
-        else:
-            I_new = np.append(self._I, I_last)
-            P_new = np.append(self._P, D[I_last])
-        left_I_new = np.append(self._left_I, I_last)
-        left_P_new = np.append(self._left_P, D[I_last])
-
-        self._T = T_new
-        self._P = P_new
-        self._I = I_new
-        self._left_I = left_I_new
-        self._left_P = left_P_new
-        self._QT = QT_new
-        self._M_T = M_T_new
-        self._Σ_T = Σ_T_new
+        This only happens once every `self._n` ingested data points and so each data
+        point is copied a constant (amortized) number of times.
+        """
+        n = self._T.shape[0]
+        l = self._P.shape[0]
+        start = self._head
+        self._T_buffer[:n] = self._T_buffer[start : start + n]
+        self._T_isfinite_buffer[:n] = self._T_isfinite_buffer[start : start + n]
+        self._M_T_buffer[:l] = self._M_T_buffer[start : start + l]
+        self._Σ_T_buffer[:l] = self._Σ_T_buffer[start : start + l]
+        self._P_buffer[:l] = self._P_buffer[start : start + l]
+        self._I_buffer[:l] = self._I_buffer[start : start + l]
+        self._left_P_buffer[:l] = self._left_P_buffer[start : start + l]
+        self._left_I_buffer[:l] = self._left_I_buffer[start : start + l]
+        self._head = 0
+        self._set_views(n)
+
+    def _set_views(self, n):
+        """
+        Set each private attribute to a view of the current window of length `n`
+        (and its corresponding subsequences) within its buffer
+        """
+        l = n - self._m + 1
+        start = self._head
+        self._n = n
+        self._T = self._T_buffer[start : start + n]
+        self._T_isfinite = self._T_isfinite_buffer[start : start + n]
+        self._M_T = self._M_T_buffer[start : start + l]
+        self._Σ_T = self._Σ_T_buffer[start : start + l]
+        self._P = self._P_buffer[start : start + l]
+        self._I = self._I_buffer[start : start + l]
+        self._left_P = self._left_P_buffer[start : start + l]
+        self._left_I = self._left_I_buffer[start : start + l]
+        self._QT = self._QT_buffer[:l]
 
     @property
     def P_(self):
         """
         Get the matrix profile
         """
-        return self._P.astype(np.float64)
+        return self._P
 
     @property
     def I_(self):
         """
         Get the matrix profile indices
         """
-        return self._I.astype(np.int64)
+        return self._I
 
     @property
     def left_P_(self):
         """
         Get the left matrix profile
         """
-        return self._left_P.astype(np.float64)
+        return self._left_P
 
     @property
     def left_I_(self):
         """
         Get the left matrix profile indices
         """
-        return self._left_I.astype(np.int64)
+        return self._left_I
 
     @property
     def T_(self):
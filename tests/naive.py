@@ -231,6 +231,9 @@ def aamp(T_A, m, T_B=None, exclusion_zone=None, p=2.0):
         exclusion_zone = int(np.ceil(m / config.STUMPY_EXCL_ZONE_DENOM))
 
     distance_matrix = cdist(rolling_T_A, rolling_T_B, metric="minkowski", p=p)
+    # Unlike the other p-norms, the Chebyshev distance (`p=np.inf`) ignores NaNs
+    distance_matrix[~np.isfinite(rolling_T_A).all(axis=1), :] = np.inf
+    distance_matrix[:, ~np.isfinite(rolling_T_B).all(axis=1)] = np.inf
 
     if ignore_trivial:
         diags = np.arange(exclusion_zone + 1, n_A - m + 1)
@@ -275,6 +278,24 @@ def aamp(T_A, m, T_B=None, exclusion_zone=None, p=2.0):
     return result
 
 
+def indexed_P(T_A, m, I, T_B=None, normalize=True, p=2.0):
+    # Compute the matrix profile value that corresponds to each index in `I`
+    if T_B is None:
+        T_B = T_A
+
+    P = np.full(I.shape, np.inf)
+    for i in range(I.shape[0]):
+        if normalize:
+            D = distance_profile(T_A[i : i + m], T_B, m)
+        else:
+            D = aamp_distance_profile(T_A[i : i + m], T_B, m, p=p)
+        for col in range(I.shape[1]):
+            if I[i, col] >= 0:
+                P[i, col] = D[I[i, col]]
+
+    return P
+
+
 def replace_inf(x, value=0):
     x[x == np.inf] = value
     x[x == -np.inf] = value
@@ -55,6 +55,31 @@ def test_aamp_A_B_join(T_A, T_B):
         npt.assert_almost_equal(ref_mp, comp_mp)
 
 
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_aamp_chebyshev_self_join(T_A, T_B):
+    m = 3
+    T_B_sub = T_B.copy()
+    for substitution_location in [slice(0, 0), 0, -1, slice(1, 3)]:
+        T_B_sub[:] = T_B[:]
+        T_B_sub[substitution_location] = np.nan
+
+        ref_mp = naive.aamp(T_B_sub, m, p=np.inf)
+        comp_mp = aamp(T_B_sub, m, p=np.inf)
+        naive.replace_inf(ref_mp)
+        naive.replace_inf(comp_mp)
+        npt.assert_almost_equal(ref_mp, comp_mp)
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_aamp_chebyshev_A_B_join(T_A, T_B):
+    m = 3
+    ref_mp = naive.aamp(T_A, m, T_B=T_B, p=np.inf)
+    comp_mp = aamp(T_A, m, T_B, ignore_trivial=False, p=np.inf)
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(comp_mp)
+    npt.assert_almost_equal(ref_mp, comp_mp)
+
+
 def test_aamp_constant_subsequence_self_join():
     T_A = np.concatenate((np.zeros(20, dtype=np.float64), np.ones(5, dtype=np.float64)))
     m = 3
@@ -236,3 +261,93 @@ def test_aamp_nan_zero_mean_self_join():
     naive.replace_inf(ref_mp)
     naive.replace_inf(comp_mp)
     npt.assert_almost_equal(ref_mp, comp_mp)
+
+
+def test_aamp_bad_dtype():
+    with pytest.raises(ValueError):
+        aamp(np.random.rand(10), 5, dtype=np.int64)
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_aamp_float32_self_join(T_A, T_B):
+    m = 3
+    zone = int(np.ceil(m / 4))
+    ref_mp = naive.aamp(T_B, m, exclusion_zone=zone)
+    comp_mp = aamp(T_B, m, ignore_trivial=True, dtype=np.float32)
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(comp_mp)
+    # The absolute error of the (single precision) p-norm scales with the data
+    tol = np.sqrt(m * 1e-6) * np.max(np.abs(T_B))
+    npt.assert_allclose(
+        ref_mp[:, 0].astype(np.float64),
+        comp_mp[:, 0].astype(np.float64),
+        rtol=1e-5,
+        atol=tol,
+    )
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_aamp_float32_A_B_join(T_A, T_B):
+    m = 3
+    ref_mp = naive.aamp(T_A, m, T_B=T_B)
+    comp_mp = aamp(T_A, m, T_B, ignore_trivial=False, dtype=np.float32)
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(comp_mp)
+    # The absolute error of the (single precision) p-norm scales with the data
+    tol = np.sqrt(m * 1e-6) * max(np.max(np.abs(T_A)), np.max(np.abs(T_B)))
+    npt.assert_allclose(
+        ref_mp[:, 0].astype(np.float64),
+        comp_mp[:, 0].astype(np.float64),
+        rtol=1e-5,
+        atol=tol,
+    )
+
+
+def test_aamp_float32_self_join_multiple_tiles():
+    T = np.cumsum(np.random.normal(size=config.STUMPY_DIAGONAL_TILE_HEIGHT * 3))
+    m = 50
+    zone = int(np.ceil(m / 4))
+    ref_mp = naive.aamp(T, m, exclusion_zone=zone)
+    comp_mp = aamp(T, m, ignore_trivial=True, dtype=np.float32)
+
+    ref_P = ref_mp[:, 0].astype(np.float64)
+    comp_P = comp_mp[:, 0].astype(np.float64)
+    tol = np.sqrt(m * 1e-6) * np.max(np.abs(T))
+    npt.assert_array_less(np.abs(ref_P - comp_P), tol)
+
+    # Indices only differ for near-ties
+    for i in np.flatnonzero(ref_mp[:, 1] != comp_mp[:, 1]):
+        D = naive.aamp_distance_profile(T[i : i + m], T, m)
+        assert abs(D[comp_mp[i, 1]] - ref_P[i]) < tol
+
+
+def test_aamp_float32_p():
+    T = np.random.uniform(-1.0, 1.0, [64])
+    m = 8
+    zone = int(np.ceil(m / 4))
+    for p in [1.0, 2.0, 3.0, np.inf]:
+        ref_mp = naive.aamp(T, m, exclusion_zone=zone, p=p)
+        comp_mp = aamp(T, m, p=p, dtype=np.float32, typed=True)
+
+        # The output dtype is the same for all p-norms
+        assert comp_mp.P.dtype == np.float32
+        assert comp_mp.left_P.dtype == np.float32
+        npt.assert_allclose(ref_mp[:, 0].astype(np.float64), comp_mp.P, rtol=1e-5)
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_aamp_typed_self_join(T_A, T_B):
+    m = 3
+    zone = int(np.ceil(m / 4))
+    for p in [1.0, 2.0, 3.0]:
+        ref_mp = naive.aamp(T_B, m, exclusion_zone=zone, p=p)
+        comp_mp = aamp(T_B, m, ignore_trivial=True, p=p, typed=True)
+        ref_I = ref_mp[:, 1:].astype(np.int64)
+        ref_P = naive.indexed_P(T_B, m, ref_I, normalize=False, p=p)
+
+        npt.assert_almost_equal(ref_mp[:, 0].astype(np.float64), comp_mp.P)
+        npt.assert_almost_equal(ref_I[:, 0], comp_mp.I)
+        npt.assert_almost_equal(ref_I[:, 1], comp_mp.left_I)
+        npt.assert_almost_equal(ref_I[:, 2], comp_mp.right_I)
+        npt.assert_almost_equal(ref_P[:, 1], comp_mp.left_P)
+        npt.assert_almost_equal(ref_P[:, 2], comp_mp.right_P)
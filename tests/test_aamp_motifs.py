@@ -2,7 +2,7 @@ import numpy as np
 import numpy.testing as npt
 import pytest
 
-from stumpy import aamp_motifs, aamp_match
+from stumpy import core, config, aamp_motifs, aamp_match, aamp_match_many
 
 import naive
 
@@ -211,3 +211,120 @@ def test_aamp_match(Q, T):
         )
 
         npt.assert_almost_equal(left, right)
+
+
+@pytest.mark.parametrize("Q, T", test_data)
+def test_aamp_match_typed(Q, T):
+    m = Q.shape[0]
+    excl_zone = int(np.ceil(m / 4))
+    max_distance = 0.3
+
+    for p in [1.0, 2.0, 3.0]:
+        left = np.array(
+            naive_aamp_match(Q, T, p=p, excl_zone=excl_zone, max_distance=max_distance)
+        ).reshape(-1, 2)
+        right = aamp_match(Q, T, p=p, max_distance=max_distance, typed=True)
+
+        assert right.D.dtype == np.float64
+        assert right.I.dtype == np.int64
+        npt.assert_almost_equal(left[:, 0], right.D)
+        npt.assert_almost_equal(left[:, 1], right.I)
+
+
+@pytest.mark.parametrize("Q, T", test_data)
+def test_aamp_match_many(Q, T):
+    m = Q.shape[0]
+    Qs = np.array([Q, T[:m], np.random.uniform(-1000, 1000, m)])
+
+    for p in [1.0, 2.0, 3.0]:
+        for max_distance in [0.3, np.inf, None]:
+            ref = [aamp_match(Q, T, max_distance=max_distance, p=p) for Q in Qs]
+            comp = aamp_match_many(Qs, T, max_distance=max_distance, p=p, max_memory=1)
+            assert len(ref) == len(comp)
+            for left, right in zip(ref, comp):
+                npt.assert_almost_equal(left, right)
+
+
+def test_aamp_match_many_lazy():
+    Qs = np.random.rand(3, 5)
+    T = np.random.rand(64)
+
+    ref = aamp_match_many(Qs, T, max_distance=np.inf, max_memory=1)
+    comp = aamp_match_many(Qs, T, max_distance=np.inf, max_memory=1, lazy=True)
+    assert not isinstance(comp, list)
+    comp = list(comp)
+    assert len(ref) == len(comp)
+    for left, right in zip(ref, comp):
+        npt.assert_almost_equal(left, right)
+
+
+def naive_aamp_motifs(T, P, m, max_distance, cutoff, max_matches, max_motifs, p):
+    excl_zone = int(np.ceil(m / 4))
+    P = P.copy()
+    motif_distances = []
+    motif_indices = []
+
+    candidate_idx = np.argmin(P)
+    while len(motif_indices) < max_motifs:
+        if not np.isfinite(P[candidate_idx]):
+            break
+        if P[candidate_idx] > cutoff or P[candidate_idx] > max_distance:
+            break
+
+        query_matches = aamp_match(
+            T[candidate_idx : candidate_idx + m],
+            T,
+            max_distance=max_distance,
+            query_idx=candidate_idx,
+            p=p,
+            typed=True,
+        )
+        if len(query_matches.I) > 1:
+            motif_distances.append(query_matches.D[:max_matches])
+            motif_indices.append(query_matches.I[:max_matches])
+
+        for idx in query_matches.I:
+            naive.apply_exclusion_zone(P, idx, excl_zone, np.inf)
+
+        candidate_idx = np.argmin(P)
+
+    motif_distances = core._jagged_list_to_array(
+        motif_distances, fill_value=np.nan, dtype=np.float64
+    )
+    motif_indices = core._jagged_list_to_array(
+        motif_indices, fill_value=-1, dtype=np.int64
+    )
+
+    return motif_distances, motif_indices
+
+
+@pytest.mark.parametrize("max_memory", [0, 2**28])
+def test_aamp_motifs_many(max_memory):
+    T = np.random.rand(256)
+    T[100:110] = T[10:20] + np.random.uniform(-0.05, 0.05, 10)
+    T[200:210] = T[10:20] + np.random.uniform(-0.05, 0.05, 10)
+    T[150] = np.nan
+    m = 8
+
+    max_memory_ref = config.STUMPY_MASS_BATCH_MAX_MEMORY
+    try:
+        config.STUMPY_MASS_BATCH_MAX_MEMORY = max_memory
+        for p in [1.0, 2.0]:
+            P = naive.aamp(T, m, p=p)[:, 0].astype(np.float64)
+            for max_distance in [0.5, 2.0, np.inf]:
+                ref_distances, ref_indices = naive_aamp_motifs(
+                    T, P, m, max_distance, np.inf, 5, 100, p
+                )
+                comp_distances, comp_indices = aamp_motifs(
+                    T,
+                    P,
+                    max_distance=max_distance,
+                    cutoff=np.inf,
+                    max_matches=5,
+                    max_motifs=100,
+                    p=p,
+                )
+                npt.assert_almost_equal(ref_distances, comp_distances)
+                npt.assert_almost_equal(ref_indices, comp_indices)
+    finally:
+        config.STUMPY_MASS_BATCH_MAX_MEMORY = max_memory_ref
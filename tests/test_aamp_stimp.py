@@ -252,3 +252,17 @@ def test_aamp_stimped(T, dask_cluster):
         naive.replace_inf(cmp_pan)
 
         npt.assert_almost_equal(ref_pan, cmp_pan)
+
+
+def test_aamp_stimp_chebyshev():
+    T = np.random.rand(64)
+    with pytest.raises(ValueError):
+        aamp_stimp(T, min_m=3, max_m=5, percentage=0.5, p=np.inf)
+
+    # The Chebyshev distance is supported when `aamp` is used
+    pan = aamp_stimp(T, min_m=3, max_m=5, percentage=1.0, p=np.inf)
+    pan.update()
+    m = pan.M_[0]
+    ref_mp = naive.aamp(T, m, exclusion_zone=int(np.ceil(m / 4)), p=np.inf)
+    cmp_P = pan._PAN[pan._bfs_indices[0], : ref_mp.shape[0]]
+    npt.assert_almost_equal(ref_mp[:, 0].astype(np.float64), cmp_P)
@@ -52,6 +52,21 @@ def test_aamped_self_join(T_A, T_B, dask_cluster):
             npt.assert_almost_equal(ref_mp, comp_mp)
 
 
+@pytest.mark.filterwarnings("ignore:numpy.dtype size changed")
+@pytest.mark.filterwarnings("ignore:numpy.ufunc size changed")
+@pytest.mark.filterwarnings("ignore:numpy.ndarray size changed")
+@pytest.mark.filterwarnings("ignore:\\s+Port 8787 is already in use:UserWarning")
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_aamped_chebyshev_self_join(T_A, T_B, dask_cluster):
+    with Client(dask_cluster) as dask_client:
+        m = 3
+        ref_mp = naive.aamp(T_B, m, p=np.inf)
+        comp_mp = aamped(dask_client, T_B, m, p=np.inf)
+        naive.replace_inf(ref_mp)
+        naive.replace_inf(comp_mp)
+        npt.assert_almost_equal(ref_mp, comp_mp)
+
+
 @pytest.mark.filterwarnings("ignore:numpy.dtype size changed")
 @pytest.mark.filterwarnings("ignore:numpy.ufunc size changed")
 @pytest.mark.filterwarnings("ignore:numpy.ndarray size changed")
@@ -101,6 +116,59 @@ def test_aamped_self_join_larger_window_df(T_A, T_B, m, dask_cluster):
             npt.assert_almost_equal(ref_mp, comp_mp)
 
 
+@pytest.mark.filterwarnings("ignore:numpy.dtype size changed")
+@pytest.mark.filterwarnings("ignore:numpy.ufunc size changed")
+@pytest.mark.filterwarnings("ignore:numpy.ndarray size changed")
+@pytest.mark.filterwarnings("ignore:\\s+Port 8787 is already in use:UserWarning")
+@pytest.mark.parametrize("tasks_per_worker", [1, 3, 100])
+def test_aamped_tasks_per_worker(tasks_per_worker, dask_cluster):
+    T = np.random.rand(256)
+    m = 8
+    ref_mp = naive.aamp(T, m)
+
+    tasks_per_worker_ref = config.STUMPY_DASK_TASKS_PER_WORKER
+    config.STUMPY_DASK_TASKS_PER_WORKER = tasks_per_worker
+    try:
+        with Client(dask_cluster) as dask_client:
+            comp_mp = aamped(dask_client, T, m)
+    finally:
+        config.STUMPY_DASK_TASKS_PER_WORKER = tasks_per_worker_ref
+
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(comp_mp)
+    npt.assert_almost_equal(ref_mp, comp_mp)
+
+
+@pytest.mark.filterwarnings("ignore:numpy.dtype size changed")
+@pytest.mark.filterwarnings("ignore:numpy.ufunc size changed")
+@pytest.mark.filterwarnings("ignore:numpy.ndarray size changed")
+@pytest.mark.filterwarnings("ignore:\\s+Port 8787 is already in use:UserWarning")
+def test_aamped_shared_memory(dask_cluster):
+    T = np.random.rand(256)
+    m = 8
+    zone = int(np.ceil(m / 4))
+    ref_mp = naive.aamp(T, m, exclusion_zone=zone)
+    T_A = np.random.rand(64)
+    ref_AB_mp = naive.aamp(T_A, m, T_B=T)
+
+    shared_memory_ref = config.STUMPY_DASK_SHARED_MEMORY
+    config.STUMPY_DASK_SHARED_MEMORY = True
+    try:
+        with Client(dask_cluster) as dask_client:
+            comp_mp = aamped(dask_client, T, m, ignore_trivial=True)
+            comp_AB_mp = aamped(dask_client, T_A, m, T, ignore_trivial=False)
+    finally:
+        config.STUMPY_DASK_SHARED_MEMORY = shared_memory_ref
+
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(comp_mp)
+    npt.assert_almost_equal(ref_mp, comp_mp)
+
+    naive.replace_inf(ref_AB_mp)
+    naive.replace_inf(comp_AB_mp)
+    npt.assert_almost_equal(ref_AB_mp, comp_AB_mp)
+
+
 @pytest.mark.filterwarnings("ignore:numpy.dtype size changed")
 @pytest.mark.filterwarnings("ignore:numpy.ufunc size changed")
 @pytest.mark.filterwarnings("ignore:numpy.ndarray size changed")
@@ -602,3 +670,25 @@ def test_aamped_two_subsequences_nan_inf_A_B_join_swap(
         naive.replace_inf(ref_mp)
         naive.replace_inf(comp_mp)
         npt.assert_almost_equal(ref_mp, comp_mp)
+
+
+@pytest.mark.filterwarnings("ignore:numpy.dtype size changed")
+@pytest.mark.filterwarnings("ignore:numpy.ufunc size changed")
+@pytest.mark.filterwarnings("ignore:numpy.ndarray size changed")
+@pytest.mark.filterwarnings("ignore:\\s+Port 8787 is already in use:UserWarning")
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_aamped_typed_self_join(T_A, T_B, dask_cluster):
+    with Client(dask_cluster) as dask_client:
+        m = 3
+        zone = int(np.ceil(m / 4))
+        ref_mp = naive.aamp(T_B, m, exclusion_zone=zone)
+        comp_mp = aamped(dask_client, T_B, m, ignore_trivial=True, typed=True)
+        ref_I = ref_mp[:, 1:].astype(np.int64)
+        ref_P = naive.indexed_P(T_B, m, ref_I, normalize=False)
+
+        npt.assert_almost_equal(ref_mp[:, 0].astype(np.float64), comp_mp.P)
+        npt.assert_almost_equal(ref_I[:, 0], comp_mp.I)
+        npt.assert_almost_equal(ref_I[:, 1], comp_mp.left_I)
+        npt.assert_almost_equal(ref_I[:, 2], comp_mp.right_I)
+        npt.assert_almost_equal(ref_P[:, 1], comp_mp.left_P)
+        npt.assert_almost_equal(ref_P[:, 2], comp_mp.right_P)
@@ -77,6 +77,72 @@ def test_aampi_self_join():
         npt.assert_almost_equal(ref_left_I, comp_left_I)
 
 
+def test_aampi_self_join_many_updates():
+    m = 3
+
+    for p in [1.0, 2.0, 3.0]:
+        T = np.random.rand(10)
+        stream = aampi(T, m, egress=False, p=p)
+        for i in range(200):
+            t = np.random.rand()
+            stream.update(t)
+
+        comp_P = stream.P_.copy()
+        comp_I = stream.I_
+        comp_left_P = stream.left_P_.copy()
+        comp_left_I = stream.left_I_
+
+        T_ref = stream.T_
+        ref_mp = naive.aamp(T_ref, m, p=p)
+        ref_P = ref_mp[:, 0]
+        ref_I = ref_mp[:, 1]
+        ref_left_P = np.full(ref_P.shape, np.inf)
+        ref_left_I = ref_mp[:, 2]
+        for i, j in enumerate(ref_left_I):
+            if j >= 0:
+                ref_left_P[i] = np.linalg.norm(
+                    T_ref[i : i + m] - T_ref[j : j + m], ord=p
+                )
+
+        assert stream.T_.shape[0] == 210
+        naive.replace_inf(ref_P)
+        naive.replace_inf(ref_left_P)
+        naive.replace_inf(comp_P)
+        naive.replace_inf(comp_left_P)
+
+        npt.assert_almost_equal(ref_P, comp_P)
+        npt.assert_almost_equal(ref_I, comp_I)
+        npt.assert_almost_equal(ref_left_P, comp_left_P)
+        npt.assert_almost_equal(ref_left_I, comp_left_I)
+
+
+@pytest.mark.parametrize("egress", [True, False])
+def test_aampi_update_many(egress):
+    m = 3
+    T = np.random.rand(100)
+    T[[40, 75]] = np.nan
+
+    ref_stream = aampi(T[:20], m, egress=egress)
+    comp_stream = aampi(T[:20], m, egress=egress)
+    # Batches that are larger than the initial window must also be handled
+    for ts in np.split(T[20:], [1, 3, 13, 40]):
+        for t in ts:
+            ref_stream.update(t)
+        comp_stream.update_many(ts)
+
+        npt.assert_almost_equal(ref_stream.P_, comp_stream.P_)
+        npt.assert_almost_equal(ref_stream.I_, comp_stream.I_)
+        npt.assert_almost_equal(ref_stream.left_P_, comp_stream.left_P_)
+        npt.assert_almost_equal(ref_stream.left_I_, comp_stream.left_I_)
+        npt.assert_almost_equal(ref_stream.T_, comp_stream.T_)
+
+
+def test_aampi_update_many_int_input():
+    stream = aampi(np.random.rand(10), 3)
+    with pytest.raises(TypeError):
+        stream.update_many(np.arange(10))
+
+
 def test_aampi_self_join_egress():
     m = 3
 
@@ -874,3 +940,8 @@ def test_aampi_profile_index_match():
         npt.assert_almost_equal(stream.left_P_, left_P)
 
         n += 1
+
+
+def test_aampi_chebyshev():
+    with pytest.raises(ValueError):
+        aampi(np.random.rand(64), 8, p=np.inf)
@@ -2,6 +2,7 @@ import numpy as np
 import numpy.testing as npt
 import pandas as pd
 from scipy.spatial.distance import cdist
+from scipy.signal import choose_conv_method
 from stumpy import core, config
 import pytest
 import os
@@ -122,6 +123,27 @@ def test_check_dtype_float64():
     assert core.check_dtype(np.random.rand(10))
 
 
+def test_check_precision():
+    assert core.check_precision(float) == np.float64
+    assert core.check_precision(np.float64) == np.float64
+    assert core.check_precision(np.float32) == np.float32
+    with pytest.raises(ValueError):
+        core.check_precision(np.int64)
+
+
+def test_grow_buffer():
+    buffer = np.random.rand(5, 3)
+    assert core._grow_buffer(buffer, 5) is buffer
+
+    comp = core._grow_buffer(buffer, 6)
+    assert comp.shape == (10, 3)
+    npt.assert_almost_equal(buffer, comp[:5])
+
+    comp = core._grow_buffer(buffer, 25)
+    assert comp.shape == (25, 3)
+    npt.assert_almost_equal(buffer, comp[:5])
+
+
 def test_get_max_window_size():
     for n in range(3, 10):
         ref_max_m = (
@@ -164,6 +186,160 @@ def test_sliding_dot_product(Q, T):
     npt.assert_almost_equal(ref_mp, comp_mp)
 
 
+@pytest.mark.parametrize("Q, T", test_data)
+def test_sliding_dot_product_blocked(Q, T):
+    ref_mp = naive_rolling_window_dot_product(Q, T)
+    for L in range(Q.shape[0], T.shape[0] + 3):
+        comp_mp = core._sliding_dot_product_blocked(Q, T, L)
+        npt.assert_almost_equal(ref_mp, comp_mp)
+
+
+def test_sliding_dot_product_blocked_max_memory():
+    Q = np.random.uniform(-1000, 1000, [100])
+    T = np.random.uniform(-1000, 1000, [10_000])
+    ref_mp = naive_rolling_window_dot_product(Q, T)
+    try:
+        config.STUMPY_SLIDING_DOT_PRODUCT_BLOCK_SIZE = 256
+        config.STUMPY_SLIDING_DOT_PRODUCT_MAX_MEMORY = 0
+        L = core._get_sliding_dot_product_block_size(Q.shape[0])
+        assert L >= 4 * Q.shape[0]
+        comp_mp = core._sliding_dot_product_blocked(Q, T, L)
+    finally:
+        config.STUMPY_SLIDING_DOT_PRODUCT_BLOCK_SIZE = 4096
+        config.STUMPY_SLIDING_DOT_PRODUCT_MAX_MEMORY = 2**24
+
+    npt.assert_almost_equal(ref_mp, comp_mp, decimal=4)
+
+
+def test_sliding_dot_product_large():
+    Q = np.random.uniform(-1000, 1000, [1000])
+    T = np.random.uniform(-1000, 1000, [20_000])
+    ref_mp = naive_rolling_window_dot_product(Q, T)
+    comp_mp = core.sliding_dot_product(Q, T)
+    npt.assert_almost_equal(ref_mp, comp_mp, decimal=4)
+
+
+def test_sliding_dot_product_fft_cache():
+    Q = np.random.uniform(-1000, 1000, [1000])
+    T = np.random.uniform(-1000, 1000, [20_000])
+    ref_mp = naive_rolling_window_dot_product(Q, T)
+
+    core._FFT_CACHE.clear()
+    comp_mp = core.sliding_dot_product(Q, T)
+    assert len(core._FFT_CACHE) == 0
+    npt.assert_almost_equal(ref_mp, comp_mp, decimal=4)
+
+    for i in range(2):
+        comp_mp = core.sliding_dot_product(Q, T, core._array_id(T))
+        assert len(core._FFT_CACHE) == 1
+        npt.assert_almost_equal(ref_mp, comp_mp, decimal=4)
+
+    core._FFT_CACHE.clear()
+
+
+def test_array_id():
+    T = np.random.rand(64)
+    assert core._array_id(T) == core._array_id(T)
+    assert core._array_id(T, 0) != core._array_id(T, 1)
+    assert core._array_id(T) != core._array_id(T.copy())
+    assert core._array_id(T) != core._array_id(T[:32])
+    assert core._array_id(T) != core._array_id(T[::2])
+    assert core._array_id(T) != core._array_id(T.view(np.int64))
+    assert core._array_id(list(T)) is None
+
+    # A garbage collected array never matches a new array
+    T_key = core._array_id(T)
+    del T
+    T = np.random.rand(64)
+    assert T_key != core._array_id(T)
+
+
+def test_mass_fft_cache(monkeypatch):
+    m = 1024
+    T = np.random.uniform(-1000, 1000, [2**15])
+    T[100] = np.nan
+    Qs = core.rolling_window(np.nan_to_num(T, nan=0.5), m)[[0, 5000, 20000]]
+
+    n_calls = [0]
+    rfft_blocks = core._rfft_blocks
+
+    def counted_rfft_blocks(*args):
+        n_calls[0] += 1
+        return rfft_blocks(*args)
+
+    monkeypatch.setattr(core, "_rfft_blocks", counted_rfft_blocks)
+    core._FFT_CACHE.clear()
+    for Q in Qs:
+        ref = np.nan_to_num(naive.distance_profile(Q, T, m), nan=np.inf)
+        npt.assert_almost_equal(ref, core.mass(Q, T), decimal=4)
+    assert n_calls[0] == 1
+
+    # A different time series must not be served from the cache
+    T = T.copy()
+    T[0] = 0.0
+    for Q in Qs:
+        ref = np.nan_to_num(naive.distance_profile(Q, T, m), nan=np.inf)
+        npt.assert_almost_equal(ref, core.mass(Q, T), decimal=4)
+    assert n_calls[0] == 2
+
+    core._FFT_CACHE.clear()
+
+
+def test_mass_batch_fft_cache():
+    m = 1024
+    T = np.random.uniform(-1000, 1000, [2**15])
+    Qs = core.rolling_window(T, m)[[0, 5000, 20000]]
+    T, M_T, Σ_T = core.preprocess(T, m)
+    L = core._get_sliding_dot_product_block_size(m, T.shape[0])
+    ref = np.array([core.mass(Q, T) for Q in Qs])
+
+    core._FFT_CACHE.clear()
+    comp = np.array(list(core._mass_batch(Qs, T, M_T, Σ_T, 2**28)))
+    assert len(core._FFT_CACHE) == 0
+    npt.assert_almost_equal(ref, comp)
+
+    T_key = core._array_id(T)
+    for i in range(2):
+        comp = np.array(list(core._mass_batch(Qs, T, M_T, Σ_T, 2**28, T_key)))
+        assert len(core._FFT_CACHE) == 1
+        npt.assert_almost_equal(ref, comp)
+
+    T_fft = core._get_rfft_blocks(T, m, L, T_key)
+    assert not T_fft.flags.writeable  # The cached FFTs are shared by all callers
+
+    T = T.copy()
+    T[0] = 0.0  # A different time series must not be served from the cache
+    ref = np.array([core.mass(Q, T) for Q in Qs])
+    T, M_T, Σ_T = core.preprocess(T, m)
+    n_entries = len(core._FFT_CACHE)
+    T_key = core._array_id(T)
+    comp = np.array(list(core._mass_batch(Qs, T, M_T, Σ_T, 2**28, T_key)))
+    assert len(core._FFT_CACHE) == n_entries + 1
+    npt.assert_almost_equal(ref, comp)
+
+    core._FFT_CACHE.clear()
+
+
+def test_mass_batch_fft_cache_max_bytes():
+    m = 1024
+    T = np.random.uniform(-1000, 1000, [2**15])
+    Qs = core.rolling_window(T, m)[[0, 5000, 20000]]
+    T, M_T, Σ_T = core.preprocess(T, m)
+    ref = np.array([core.mass(Q, T) for Q in Qs])
+
+    max_bytes_ref = config.STUMPY_FFT_CACHE_MAX_BYTES
+    core._FFT_CACHE.clear()
+    try:
+        config.STUMPY_FFT_CACHE_MAX_BYTES = 0
+        T_key = core._array_id(T)
+        comp = np.array(list(core._mass_batch(Qs, T, M_T, Σ_T, 2**28, T_key)))
+        assert len(core._FFT_CACHE) == 0
+        npt.assert_almost_equal(ref, comp)
+    finally:
+        config.STUMPY_FFT_CACHE_MAX_BYTES = max_bytes_ref
+        core._FFT_CACHE.clear()
+
+
 def test_welford_nanvar():
     T = np.random.rand(64)
     m = 10
@@ -284,6 +460,7 @@ def test_compute_mean_std_chunked(Q, T):
     m = Q.shape[0]
 
     config.STUMPY_MEAN_STD_NUM_CHUNKS = 2
+    core._MEAN_STD_CACHE.clear()
     ref_μ_Q, ref_σ_Q = naive_compute_mean_std(Q, m)
     ref_M_T, ref_Σ_T = naive_compute_mean_std(T, m)
     comp_μ_Q, comp_σ_Q = core.compute_mean_std(Q, m)
@@ -301,6 +478,7 @@ def test_compute_mean_std_chunked_many(Q, T):
     m = Q.shape[0]
 
     config.STUMPY_MEAN_STD_NUM_CHUNKS = 128
+    core._MEAN_STD_CACHE.clear()
     ref_μ_Q, ref_σ_Q = naive_compute_mean_std(Q, m)
     ref_M_T, ref_Σ_T = naive_compute_mean_std(T, m)
     comp_μ_Q, comp_σ_Q = core.compute_mean_std(Q, m)
@@ -339,6 +517,7 @@ def test_compute_mean_std_multidimensional_chunked(Q, T):
     T = np.array([T, T, np.random.uniform(-1000, 1000, [T.shape[0]])])
 
     config.STUMPY_MEAN_STD_NUM_CHUNKS = 2
+    core._MEAN_STD_CACHE.clear()
     ref_μ_Q, ref_σ_Q = naive_compute_mean_std_multidimensional(Q, m)
     ref_M_T, ref_Σ_T = naive_compute_mean_std_multidimensional(T, m)
     comp_μ_Q, comp_σ_Q = core.compute_mean_std(Q, m)
@@ -359,6 +538,7 @@ def test_compute_mean_std_multidimensional_chunked_many(Q, T):
     T = np.array([T, T, np.random.uniform(-1000, 1000, [T.shape[0]])])
 
     config.STUMPY_MEAN_STD_NUM_CHUNKS = 128
+    core._MEAN_STD_CACHE.clear()
     ref_μ_Q, ref_σ_Q = naive_compute_mean_std_multidimensional(Q, m)
     ref_M_T, ref_Σ_T = naive_compute_mean_std_multidimensional(T, m)
     comp_μ_Q, comp_σ_Q = core.compute_mean_std(Q, m)
@@ -371,6 +551,129 @@ def test_compute_mean_std_multidimensional_chunked_many(Q, T):
     npt.assert_almost_equal(ref_Σ_T, comp_Σ_T)
 
 
+@pytest.mark.parametrize("Q, T", test_data)
+def test_multi_window_mean_std(Q, T):
+    T = T.copy()
+    T[1:5] = 3.7  # Constant subsequences
+    T[-3] = 1e6
+    T_nan = T.copy()
+    T_nan[[0, T.shape[0] // 2]] = np.nan
+    T_nan[-1] = np.inf
+
+    for T in [T, T_nan]:
+        mean_std = core._MultiWindowMeanStd(T)
+        for m in range(2, T.shape[0] + 1):
+            ref_M_T, ref_Σ_T = naive_compute_mean_std(T, m)
+            comp_M_T, comp_Σ_T = mean_std.compute_mean_std(m)
+
+            npt.assert_almost_equal(ref_M_T, comp_M_T)
+            npt.assert_almost_equal(ref_Σ_T, comp_Σ_T)
+            npt.assert_equal(
+                ref_Σ_T < config.STUMPY_STDDEV_THRESHOLD,
+                comp_Σ_T < config.STUMPY_STDDEV_THRESHOLD,
+            )
+
+
+def test_use_mean_std():
+    m = 8
+    T = np.random.uniform(-1000, 1000, [64])
+    ref_M_T, ref_Σ_T = naive_compute_mean_std(T, m)
+    mean_std = core._MultiWindowMeanStd(T)
+
+    core._MEAN_STD_CACHE.clear()
+    with core._use_mean_std([mean_std]):
+        comp_M_T, comp_Σ_T = core.compute_mean_std(T.copy(), m)
+        assert len(core._MEAN_STD_CACHE) == 0
+        core.compute_mean_std(T + 1.0, m)
+        assert len(core._MEAN_STD_CACHE) == 1
+
+    npt.assert_almost_equal(ref_M_T, comp_M_T)
+    npt.assert_almost_equal(ref_Σ_T, comp_Σ_T)
+    npt.assert_equal(mean_std.compute_mean_std(m), (comp_M_T, comp_Σ_T))
+
+    # Outside of the context, the `compute_mean_std` cache is used again
+    core.compute_mean_std(T, m)
+    assert len(core._MEAN_STD_CACHE) == 2
+
+    core._MEAN_STD_CACHE.clear()
+
+
+def test_compute_mean_std_cache():
+    m = 8
+    T = np.random.uniform(-1000, 1000, [64])
+    ref_M_T, ref_Σ_T = naive_compute_mean_std(T, m)
+
+    core._MEAN_STD_CACHE.clear()
+    comp_M_T, comp_Σ_T = core.compute_mean_std(T, m)
+    assert len(core._MEAN_STD_CACHE) == 1
+    comp_M_T[:] = np.nan  # Modifying the output must not affect the cache
+    comp_Σ_T[:] = np.nan
+
+    comp_M_T, comp_Σ_T = core.compute_mean_std(T.copy(), m)
+    assert len(core._MEAN_STD_CACHE) == 1
+    npt.assert_almost_equal(ref_M_T, comp_M_T)
+    npt.assert_almost_equal(ref_Σ_T, comp_Σ_T)
+
+    T[0] = 0.0  # A different time series must not be served from the cache
+    ref_M_T, ref_Σ_T = naive_compute_mean_std(T, m)
+    comp_M_T, comp_Σ_T = core.compute_mean_std(T, m)
+    assert len(core._MEAN_STD_CACHE) == 2
+    npt.assert_almost_equal(ref_M_T, comp_M_T)
+    npt.assert_almost_equal(ref_Σ_T, comp_Σ_T)
+
+    core._MEAN_STD_CACHE.clear()
+
+
+def test_compute_mean_std_cache_max_bytes():
+    m = 8
+    Ts = [np.random.uniform(-1000, 1000, [64]) for _ in range(3)]
+    nbytes = 2 * (Ts[0].shape[0] - m + 1) * 8
+
+    max_bytes_ref = config.STUMPY_MEAN_STD_CACHE_MAX_BYTES
+    core._MEAN_STD_CACHE.clear()
+    try:
+        config.STUMPY_MEAN_STD_CACHE_MAX_BYTES = 2 * nbytes
+        for T in Ts:
+            core.compute_mean_std(T, m)
+        assert len(core._MEAN_STD_CACHE) == 2
+        assert core._MEAN_STD_CACHE.nbytes == 2 * nbytes
+        assert (core._array_key(Ts[0]), m) not in core._MEAN_STD_CACHE._entries
+
+        config.STUMPY_MEAN_STD_CACHE_MAX_BYTES = 0
+        core._MEAN_STD_CACHE.clear()
+        for T in Ts:
+            ref_M_T, ref_Σ_T = naive_compute_mean_std(T, m)
+            comp_M_T, comp_Σ_T = core.compute_mean_std(T, m)
+            npt.assert_almost_equal(ref_M_T, comp_M_T)
+            npt.assert_almost_equal(ref_Σ_T, comp_Σ_T)
+        assert len(core._MEAN_STD_CACHE) == 0
+    finally:
+        config.STUMPY_MEAN_STD_CACHE_MAX_BYTES = max_bytes_ref
+        core._MEAN_STD_CACHE.clear()
+
+
+def test_compute_mean_std_cache_too_large(monkeypatch):
+    m = 8
+    T = np.random.uniform(-1000, 1000, [2, 64])
+    ref_M_T, ref_Σ_T = naive_compute_mean_std_multidimensional(T, m)
+
+    def array_key(a):  # pragma: no cover
+        raise AssertionError("`T` must not be hashed when it can never be cached")
+
+    max_bytes_ref = config.STUMPY_MEAN_STD_CACHE_MAX_BYTES
+    monkeypatch.setattr(core, "_array_key", array_key)
+    core._MEAN_STD_CACHE.clear()
+    try:
+        config.STUMPY_MEAN_STD_CACHE_MAX_BYTES = 2 * 2 * (64 - m + 1) * 8 - 1
+        comp_M_T, comp_Σ_T = core.compute_mean_std(T, m)
+        assert len(core._MEAN_STD_CACHE) == 0
+        npt.assert_almost_equal(ref_M_T, comp_M_T)
+        npt.assert_almost_equal(ref_Σ_T, comp_Σ_T)
+    finally:
+        config.STUMPY_MEAN_STD_CACHE_MAX_BYTES = max_bytes_ref
+        core._MEAN_STD_CACHE.clear()
+
+
 @pytest.mark.parametrize("Q, T", test_data)
 def test_calculate_squared_distance_profile(Q, T):
     m = Q.shape[0]
@@ -490,6 +793,86 @@ def test_mass_T_inf(Q, T):
     T[1] = 1e10
 
 
+@pytest.mark.parametrize("Q, T", test_data)
+@pytest.mark.parametrize("max_memory", [None, 1])
+def test_mass_batch(Q, T, max_memory):
+    m = Q.shape[0]
+    Qs = np.array([Q, np.random.uniform(-1000, 1000, m), T[:m]])
+    Qs[1, 1] = np.nan
+    T = T.copy()
+    T[1] = np.inf
+
+    ref = np.array([core.mass(Q, T) for Q in Qs])
+    comp = core.mass_batch(Qs, T, max_memory=max_memory)
+    npt.assert_almost_equal(ref, comp)
+
+    T, M_T, Σ_T = core.preprocess(T, m)
+    comp = core.mass_batch(Qs, T, M_T, Σ_T, max_memory=max_memory)
+    npt.assert_almost_equal(ref, comp)
+
+
+@pytest.mark.parametrize("max_memory", [0, 2**18, None])
+def test_mass_batch_fft(max_memory):
+    m = 1024
+    T = np.random.uniform(-1000, 1000, [2**15])
+    Qs = np.array([np.random.uniform(-1000, 1000, m), T[1000 : 1000 + m]])
+    assert choose_conv_method(Qs[0], T) == "fft"
+
+    ref = np.array([core.mass(Q, T) for Q in Qs])
+    comp = core.mass_batch(Qs, T, max_memory=max_memory)
+
+    npt.assert_almost_equal(ref, comp)
+
+
+@pytest.mark.parametrize("max_memory", [0, 2**18])
+def test_mass_batch_lazy(max_memory):
+    m = 1024
+    T = np.random.uniform(-1000, 1000, [2**15])
+    Qs = np.random.uniform(-1000, 1000, [5, m])
+    Qs[1] = T[1000 : 1000 + m]
+
+    ref = core.mass_batch(Qs, T, max_memory=max_memory)
+    comp = core.mass_batch(Qs, T, max_memory=max_memory, lazy=True)
+    assert not isinstance(comp, np.ndarray)
+    comp = list(comp)
+    assert len(comp) == Qs.shape[0]
+    npt.assert_almost_equal(ref, np.array(comp))
+
+    ref = core.mass_absolute_batch(Qs, T, max_memory=max_memory)
+    comp = core.mass_absolute_batch(Qs, T, max_memory=max_memory, lazy=True)
+    assert not isinstance(comp, np.ndarray)
+    npt.assert_almost_equal(ref, np.array(list(comp)))
+
+
+@pytest.mark.parametrize("Q, T", test_data)
+@pytest.mark.parametrize("max_memory", [None, 1, 1000])
+def test_mass_absolute_batch(Q, T, max_memory):
+    m = Q.shape[0]
+    Qs = np.array([Q, np.random.uniform(-1000, 1000, m), T[:m]])
+    Qs[1, 1] = np.nan
+    T = T.copy()
+    T[1] = np.inf
+
+    for p in [1.0, 2.0, 3.0]:
+        ref = np.array([core.mass_absolute(Q, T, p=p) for Q in Qs])
+        comp = core.mass_absolute_batch(Qs, T, p=p, max_memory=max_memory)
+        npt.assert_almost_equal(ref, comp)
+
+
+def test_abs_pow():
+    for x in [-3.5, -1.0, 0.0, 0.25, 2.0]:
+        for p in [1.0, 1.5, 2.0, 3.0]:
+            npt.assert_almost_equal(np.abs(x) ** p, core._abs_pow(x, p))
+
+
+@pytest.mark.parametrize("Q, T", test_data)
+def test_p_norm(Q, T):
+    for p in [1.0, 1.5, 2.0, 3.0]:
+        ref = np.linalg.norm(T, ord=p)
+        comp = np.power(core._p_norm(T, p), 1.0 / p)
+        npt.assert_almost_equal(ref, comp)
+
+
 @pytest.mark.parametrize("Q, T", test_data)
 def test_p_norm_distance_profile(Q, T):
     Q = Q.copy()
@@ -737,6 +1120,43 @@ def test_apply_exclusion_zone_multidimensional():
         npt.assert_array_equal(ref, comp)
 
 
+def naive_find_matches(D, excl_zone, max_distance, max_matches, query_idx):
+    D = D.copy()
+    matches = []
+
+    if query_idx is not None:
+        candidate_idx = query_idx
+    else:
+        candidate_idx = np.argmin(D)
+
+    while (
+        D[candidate_idx] <= max_distance
+        and np.isfinite(D[candidate_idx])
+        and len(matches) < max_matches
+    ):
+        matches.append([D[candidate_idx], candidate_idx])
+        naive.apply_exclusion_zone(D, candidate_idx, excl_zone, np.inf)
+        candidate_idx = np.argmin(D)
+
+    return matches
+
+
+@pytest.mark.parametrize("excl_zone", [0, 1, 3])
+@pytest.mark.parametrize("max_matches", [0, 1, 5, np.inf])
+@pytest.mark.parametrize("query_idx", [None, 0, 17])
+def test_find_matches(excl_zone, max_matches, query_idx):
+    # Integer-valued distances result in many ties
+    D = np.random.randint(0, 20, size=100).astype(np.float64)
+    D[np.random.randint(0, 100, size=10)] = np.inf
+
+    for max_distance in [-1.0, 0.0, 5.0, 10.0, np.inf]:
+        ref = naive_find_matches(D, excl_zone, max_distance, max_matches, query_idx)
+        comp = core._find_matches(D, excl_zone, max_distance, max_matches, query_idx)
+        npt.assert_array_equal(
+            np.array(ref).reshape(-1, 2), np.array(comp).reshape(-1, 2)
+        )
+
+
 def test_preprocess():
     T = np.array([0, np.nan, 2, 3, 4, 5, 6, 7, np.inf, 9])
     m = 3
@@ -854,6 +1274,135 @@ def test_count_diagonal_ndist():
                 npt.assert_almost_equal(ref_ndist_counts, comp_ndist_counts)
 
 
+def test_get_PI_segments():
+    for l_A, l_B, ignore_trivial in [(16, 16, True), (16, 11, False), (9, 16, False)]:
+        if ignore_trivial:
+            all_diags = np.arange(1, l_A)
+        else:
+            all_diags = np.arange(-l_A + 1, l_B)
+        for diags_start in all_diags:
+            for diags_stop in range(diags_start + 1, all_diags[-1] + 2):
+                # Only the rows (and columns) along the diagonals are ever updated
+                P = np.full((l_A, 3), np.inf)
+                I = np.full((l_A, 3), -1, dtype=np.int64)
+                for k in range(diags_start, diags_stop):
+                    for i in range(max(0, -k), min(l_A, l_B - k)):
+                        P[i] = np.random.rand(3)
+                        I[i] = i + k
+                        if ignore_trivial:
+                            P[i + k] = np.random.rand(3)
+                            I[i + k] = i
+
+                PI = core._get_PI_segments(
+                    P, I, diags_start, diags_stop, l_B, ignore_trivial
+                )
+                assert len(PI) <= 2
+                n_rows = sum(P_segment.shape[0] for _, P_segment, _ in PI)
+                assert n_rows == np.count_nonzero(I[:, 0] >= 0)
+                if len(PI) == 2:
+                    assert PI[0][0] + PI[0][1].shape[0] < PI[1][0]
+
+                comp_P, comp_I = core._assemble_PI(PI, l_A)
+                npt.assert_almost_equal(P, comp_P)
+                npt.assert_almost_equal(I, comp_I)
+
+
+def test_merge_PI():
+    l = 16
+    P = np.random.rand(l, 3)
+    I = np.random.randint(0, l, size=(l, 3))
+    P_other = np.random.rand(l, 3)
+    I_other = np.random.randint(0, l, size=(l, 3))
+    P_other[:4] = P[:4]  # Ties are resolved in favor of the first (P, I)
+
+    ref_P = P.copy()
+    ref_I = I.copy()
+    for i in range(l):
+        for col in range(3):
+            if P_other[i, col] < ref_P[i, col]:
+                ref_P[i, col] = P_other[i, col]
+                ref_I[i, col] = I_other[i, col]
+
+    PI = core._merge_PI([(0, P, I)], [(0, P_other, I_other)])
+    comp_P, comp_I = core._assemble_PI(PI, l)
+    npt.assert_almost_equal(ref_P, comp_P)
+    npt.assert_almost_equal(ref_I, comp_I)
+
+
+def test_merge_PI_segments():
+    l = 32
+    P = np.full((l, 3), np.inf)
+    I = np.full((l, 3), -1, dtype=np.int64)
+    P_other = np.full((l, 3), np.inf)
+    I_other = np.full((l, 3), -1, dtype=np.int64)
+
+    ranges = [(2, 6), (10, 14), (20, 22)]
+    for start, stop in ranges:
+        P[start:stop] = np.random.rand(stop - start, 3)
+        I[start:stop] = np.random.randint(0, l, size=(stop - start, 3))
+    other_ranges = [(0, 3), (5, 12), (24, 30)]
+    for start, stop in other_ranges:
+        P_other[start:stop] = np.random.rand(stop - start, 3)
+        I_other[start:stop] = np.random.randint(0, l, size=(stop - start, 3))
+    P_other[10] = P[10]  # Ties are resolved in favor of the first (P, I)
+    PI = [(start, P[start:stop], I[start:stop]) for start, stop in ranges]
+    PI_other = [
+        (start, P_other[start:stop], I_other[start:stop])
+        for start, stop in other_ranges
+    ]
+
+    ref_P = P.copy()
+    ref_I = I.copy()
+    cond = P_other < P
+    ref_P[cond] = P_other[cond]
+    ref_I[cond] = I_other[cond]
+
+    PI = core._merge_PI(PI, PI_other)
+    assert [start for start, _, _ in PI] == [0, 20, 24]
+    comp_P, comp_I = core._assemble_PI(PI, l)
+    npt.assert_almost_equal(ref_P, comp_P)
+    npt.assert_almost_equal(ref_I, comp_I)
+
+    PI = core._merge_PI([], PI)
+    comp_P, comp_I = core._assemble_PI(PI, l)
+    npt.assert_almost_equal(ref_P, comp_P)
+    npt.assert_almost_equal(ref_I, comp_I)
+
+
+def test_get_tile_ranges():
+    x = np.array([3, 9, 2, 1, 5, 4, 7, 7, 8, 6, 50, 1, 1], dtype=np.int64)
+    for n_tiles in range(1, 20):
+        cmp = core._get_tile_ranges(x, n_tiles)
+        assert 1 <= cmp.shape[0] <= n_tiles
+        assert cmp[0, 0] == 0
+        assert cmp[-1, 1] == x.shape[0]
+        npt.assert_almost_equal(cmp[1:, 0], cmp[:-1, 1])
+        assert np.all(cmp[:, 0] < cmp[:, 1])
+
+
+def test_get_tile_ranges_empty_array():
+    cmp = core._get_tile_ranges(np.array([], dtype=np.int64), 4)
+    assert cmp.shape == (0, 2)
+
+
+def test_create_shared_array():
+    ref = np.random.rand(4, 8)
+    name = "stumpy_test_create_shared_array"
+    core._create_shared_array(ref, name)
+    try:
+        handle = core._SharedArray(name, ref.shape, ref.dtype)
+        shm, cmp = handle.attach()
+        npt.assert_almost_equal(ref, cmp)
+        del cmp
+        shm.close()
+    finally:
+        core._unlink_shared_array(name)
+
+    assert name not in core._SHARED_MEMORY
+    with pytest.raises(FileNotFoundError):
+        handle.attach()
+
+
 def test_get_array_ranges():
     x = np.array([3, 9, 2, 1, 5, 4, 7, 7, 8, 6], dtype=np.int64)
     for n_chunks in range(2, 5):
@@ -1,7 +1,9 @@
 import numpy as np
 import numpy.testing as npt
-from stumpy import fluss, stump, aamp, core, floss
-from stumpy.floss import _nnmark, _iac, _cac, _rea
+from stumpy import fluss, stump, aamp, core, floss, config
+from stumpy.floss import _nnmark, _iac, _cac, _rea, _ArcCounts
+from stumpy.floss import _beta_fit, _IAC_CACHE, _iac_fname
+import scipy.stats
 import pytest
 import naive
 
@@ -92,6 +94,121 @@ def test_nnmark(I):
     npt.assert_almost_equal(ref, comp)
 
 
+@pytest.mark.parametrize("I", test_data)
+def test_arc_counts(I):
+    ref = naive_nnmark(I)
+    arc_counts = _ArcCounts(I)
+    npt.assert_almost_equal(ref, arc_counts.to_array())
+    npt.assert_almost_equal(ref, [arc_counts[i] for i in range(len(arc_counts))])
+
+
+def test_arc_counts_sliding():
+    k = 20
+    I = np.minimum(np.arange(k) + np.random.randint(0, 5, k), k - 1)
+    arc_counts = _ArcCounts(I)
+    for n_appended in range(1, 3 * k):
+        # Egress the oldest subsequence and ingress a new (last) subsequence that
+        # becomes the right nearest neighbor of a few other subsequences
+        arc_counts.add(n_appended - 1, I[0], -1)
+        I = np.append(I[1:], k - 1 + n_appended)
+        for i in np.random.choice(k - 1, 3, replace=False):
+            arc_counts.add(I[i], k - 1 + n_appended)
+            I[i] = k - 1 + n_appended
+        arc_counts.start = n_appended
+
+        ref = naive_nnmark(I - n_appended)
+        npt.assert_almost_equal(ref, arc_counts.to_array())
+        npt.assert_almost_equal(ref, [arc_counts[i] for i in range(k)])
+
+
+def test_arc_counts_materialized():
+    I = np.array([3, 2, 4, 4, 4])
+    arc_counts = _ArcCounts(I)
+    ref = naive_nnmark(I)
+    comp = arc_counts.to_array()
+    comp[:] = -1  # The materialized arc curve must not be shared
+    npt.assert_almost_equal(ref, [arc_counts[i] for i in range(len(arc_counts))])
+
+    # Changes are reflected by the next read
+    arc_counts.add(0, 4)
+    ref[:4] += 1
+    npt.assert_almost_equal(ref, [arc_counts[i] for i in range(len(arc_counts))])
+    npt.assert_almost_equal(ref, arc_counts.to_array())
+
+
+def test_beta_fit():
+    data = np.random.beta(2.0, 3.0, size=(4, 1000))
+    comp_a, comp_b = _beta_fit(data)
+    for i in range(data.shape[0]):
+        ref_a, ref_b, _, _ = scipy.stats.beta.fit(data[i], floc=0, fscale=1)
+        npt.assert_almost_equal(ref_a, comp_a[i])
+        npt.assert_almost_equal(ref_b, comp_b[i])
+
+
+def test_iac_cache():
+    _IAC_CACHE.clear()
+    ref = _iac(64, bidirectional=False, n_iter=10, n_samples=100)
+    assert len(_IAC_CACHE) == 1
+
+    comp = _iac(64, bidirectional=False, n_iter=10, n_samples=100)
+    assert len(_IAC_CACHE) == 1
+    npt.assert_array_equal(ref, comp)
+
+    comp[:] = 0.0  # Cached results must not be mutated by callers
+    comp = _iac(64, bidirectional=False, n_iter=10, n_samples=100)
+    npt.assert_array_equal(ref, comp)
+
+    _iac(64, bidirectional=True, n_iter=10, n_samples=100)
+    assert len(_IAC_CACHE) == 2
+    _IAC_CACHE.clear()
+
+
+def test_iac_cache_miss_copy():
+    _IAC_CACHE.clear()
+    out = _iac(64, bidirectional=False, n_iter=10, n_samples=100)
+    ref = out.copy()
+    out[:] = -1.0  # The uncached result must not be shared with the cache either
+    comp = _iac(64, bidirectional=False, n_iter=10, n_samples=100)
+    npt.assert_array_equal(ref, comp)
+    _IAC_CACHE.clear()
+
+
+def test_iac_random_state():
+    _IAC_CACHE.clear()
+    np.random.seed(42)
+    ref = np.random.rand(10)
+    for _ in range(2):  # Cache miss and cache hit
+        np.random.seed(42)
+        _iac(64, bidirectional=False, n_iter=10, n_samples=100, seed=0)
+        comp = np.random.rand(10)
+        npt.assert_array_equal(ref, comp)
+    _IAC_CACHE.clear()
+
+
+def test_iac_disk_cache(tmp_path):
+    _IAC_CACHE.clear()
+    config.STUMPY_IAC_CACHE_DIR = str(tmp_path)
+    key = (64, True, 10, 100, 0)
+    try:
+        ref = _iac(64, bidirectional=True, n_iter=10, n_samples=100)
+        npt.assert_array_equal(ref, np.load(_iac_fname(key)))
+
+        # Results are read back from disk in a new session
+        _IAC_CACHE.clear()
+        np.save(_iac_fname(key), np.ones(64))
+        comp = _iac(64, bidirectional=True, n_iter=10, n_samples=100)
+        npt.assert_array_equal(np.ones(64), comp)
+
+        # Files with an unexpected shape are ignored
+        _IAC_CACHE.clear()
+        np.save(_iac_fname(key), np.ones(3))
+        comp = _iac(64, bidirectional=True, n_iter=10, n_samples=100)
+        npt.assert_array_equal(ref, comp)
+    finally:
+        config.STUMPY_IAC_CACHE_DIR = None
+        _IAC_CACHE.clear()
+
+
 @pytest.mark.parametrize("I", test_data)
 def test_cac(I):
     L = 5
@@ -114,6 +231,15 @@ def test_cac_custom_iac(I):
     npt.assert_almost_equal(ref, comp)
 
 
+def test_cac_custom_iac_not_modified():
+    I = np.random.randint(0, 64, size=64)
+    custom_iac = naive_iac(I.shape[0])
+    custom_iac[0] = 0.0
+    ref = custom_iac.copy()
+    _cac(I, 5, True, 1, custom_iac)
+    npt.assert_array_equal(ref, custom_iac)
+
+
 @pytest.mark.parametrize("I", test_data)
 def test_rea(I):
     L = 5
@@ -197,6 +323,62 @@ def test_floss():
         npt.assert_almost_equal(ref_T, comp_T)
 
 
+def test_floss_update_many():
+    data = np.random.uniform(-1000, 1000, [64])
+    data[40] = np.nan
+    m = 5
+    n = 30
+    old_data = data[:n]
+
+    mp = stump(old_data, m)
+    k = mp.shape[0]
+    L = 5
+    excl_factor = 1
+    custom_iac = _iac(k, bidirectional=False)
+
+    ref_stream = floss(mp, old_data, m, L, excl_factor, custom_iac=custom_iac)
+    comp_stream = floss(mp, old_data, m, L, excl_factor, custom_iac=custom_iac)
+    for ts in np.split(data[n:], [1, 3, 20]):
+        for t in ts:
+            ref_stream.update(t)
+        comp_stream.update_many(ts)
+
+        npt.assert_almost_equal(ref_stream.cac_1d_, comp_stream.cac_1d_)
+        npt.assert_almost_equal(ref_stream.P_, comp_stream.P_)
+        npt.assert_almost_equal(ref_stream.I_, comp_stream.I_)
+        npt.assert_almost_equal(ref_stream.T_, comp_stream.T_)
+
+
+def test_aamp_floss_update_many():
+    data = np.random.uniform(-1000, 1000, [64])
+    data[40] = np.nan
+    m = 5
+    n = 30
+    old_data = data[:n]
+
+    mp = naive_right_mp(old_data, m, normalize=False)
+    k = mp.shape[0]
+    L = 5
+    excl_factor = 1
+    custom_iac = _iac(k, bidirectional=False)
+
+    ref_stream = floss(
+        mp, old_data, m, L, excl_factor, custom_iac=custom_iac, normalize=False
+    )
+    comp_stream = floss(
+        mp, old_data, m, L, excl_factor, custom_iac=custom_iac, normalize=False
+    )
+    for ts in np.split(data[n:], [1, 3, 20]):
+        for t in ts:
+            ref_stream.update(t)
+        comp_stream.update_many(ts)
+
+        npt.assert_almost_equal(ref_stream.cac_1d_, comp_stream.cac_1d_)
+        npt.assert_almost_equal(ref_stream.P_, comp_stream.P_)
+        npt.assert_almost_equal(ref_stream.I_, comp_stream.I_)
+        npt.assert_almost_equal(ref_stream.T_, comp_stream.T_)
+
+
 def test_aamp_floss():
     data = np.random.uniform(-1000, 1000, [64])
     m = 5
@@ -354,3 +354,21 @@ def test_gpu_aamp_nan_zero_mean_self_join():
     naive.replace_inf(ref_mp)
     naive.replace_inf(comp_mp)
     npt.assert_almost_equal(ref_mp, comp_mp)
+
+
+@pytest.mark.filterwarnings("ignore", category=NumbaPerformanceWarning)
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_gpu_aamp_typed_self_join(T_A, T_B):
+    m = 3
+    zone = int(np.ceil(m / 4))
+    ref_mp = naive.aamp(T_B, m, exclusion_zone=zone)
+    comp_mp = gpu_aamp(T_B, m, ignore_trivial=True, typed=True)
+    ref_I = ref_mp[:, 1:].astype(np.int64)
+    ref_P = naive.indexed_P(T_B, m, ref_I, normalize=False)
+
+    npt.assert_almost_equal(ref_mp[:, 0].astype(np.float64), comp_mp.P)
+    npt.assert_almost_equal(ref_I[:, 0], comp_mp.I)
+    npt.assert_almost_equal(ref_I[:, 1], comp_mp.left_I)
+    npt.assert_almost_equal(ref_I[:, 2], comp_mp.right_I)
+    npt.assert_almost_equal(ref_P[:, 1], comp_mp.left_P)
+    npt.assert_almost_equal(ref_P[:, 2], comp_mp.right_P)
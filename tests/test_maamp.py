@@ -337,3 +337,8 @@ def test_maamp_nan_self_join_all_dimensions(T, m, substitute, substitution_locat
 
         npt.assert_almost_equal(ref_P, comp_P)
         npt.assert_almost_equal(ref_I, comp_I)
+
+
+def test_maamp_chebyshev():
+    with pytest.raises(ValueError):
+        maamp(np.random.rand(2, 64), 8, p=np.inf)
@@ -41,6 +41,24 @@ def test_maamped(T, m, dask_cluster):
         npt.assert_almost_equal(ref_I, comp_I)
 
 
+@pytest.mark.filterwarnings("ignore:\\s+Port 8787 is already in use:UserWarning")
+@pytest.mark.parametrize("T, m", test_data)
+def test_maamped_shared_memory(T, m, dask_cluster):
+    excl_zone = int(np.ceil(m / 4))
+    ref_P, ref_I = naive.maamp(T, m, excl_zone)
+
+    shared_memory_ref = config.STUMPY_DASK_SHARED_MEMORY
+    config.STUMPY_DASK_SHARED_MEMORY = True
+    try:
+        with Client(dask_cluster) as dask_client:
+            comp_P, comp_I = maamped(dask_client, T, m)
+    finally:
+        config.STUMPY_DASK_SHARED_MEMORY = shared_memory_ref
+
+    npt.assert_almost_equal(ref_P, comp_P)
+    npt.assert_almost_equal(ref_I, comp_I)
+
+
 @pytest.mark.filterwarnings("ignore:\\s+Port 8787 is already in use:UserWarning")
 @pytest.mark.parametrize("T, m", test_data)
 def test_maamped_include(T, m, dask_cluster):
@@ -213,3 +231,9 @@ def test_maamped_one_subsequence_nan_self_join_all_dimensions(
 
         npt.assert_almost_equal(ref_P, comp_P)
         npt.assert_almost_equal(ref_I, comp_I)
+
+
+def test_maamped_chebyshev(dask_cluster):
+    with pytest.raises(ValueError):
+        with Client(dask_cluster) as dask_client:
+            maamped(dask_client, np.random.rand(2, 64), 8, p=np.inf)
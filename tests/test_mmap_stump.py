@@ -0,0 +1,183 @@
+import numba
+import numpy as np
+import numpy.testing as npt
+from stumpy import mmap_stump, config
+from stumpy.mmap_stump import _get_mmap_tile_size
+import pytest
+import naive
+
+
+test_data = [
+    (
+        np.array([9, 8100, -60, 7], dtype=np.float64),
+        np.array([584, -11, 23, 79, 1001, 0, -19], dtype=np.float64),
+    ),
+    (
+        np.random.uniform(-1000, 1000, [8]).astype(np.float64),
+        np.random.uniform(-1000, 1000, [64]).astype(np.float64),
+    ),
+]
+
+substitution_locations = [0, -1, slice(1, 3), [0, 3]]
+substitution_values = [np.nan, np.inf]
+max_memories = [None, 0, 10_000_000]
+
+
+def naive_left_right_P(T, m, I):
+    P = np.full(I.shape, np.inf)
+    for i in range(I.shape[0]):
+        for col in range(I.shape[1]):
+            j = I[i, col]
+            if j >= 0:
+                P[i, col] = naive.distance_profile(T[i : i + m], T, m)[j]
+
+    return P
+
+
+def test_mmap_stump_int_input():
+    P = np.empty((6, 3), dtype=np.float64)
+    I = np.empty((6, 3), dtype=np.int64)
+    with pytest.raises(TypeError):
+        mmap_stump(np.arange(10), 5, P, I)
+
+
+def test_mmap_stump_bad_output_shape():
+    T = np.random.rand(10)
+    P = np.empty((6, 1), dtype=np.float64)
+    I = np.empty((6, 3), dtype=np.int64)
+    with pytest.raises(ValueError):
+        mmap_stump(T, 5, P, I)
+
+
+def test_get_mmap_tile_size(monkeypatch):
+    m = 8
+    max_memory = 2**24
+    nbytes_per_thread = 2 * config.STUMPY_DIAGONAL_TILE_HEIGHT * 3 * 16
+
+    monkeypatch.setattr(numba.config, "NUMBA_NUM_THREADS", 1)
+    tile_size_1 = _get_mmap_tile_size(m, max_memory)
+    monkeypatch.setattr(numba.config, "NUMBA_NUM_THREADS", 8)
+    tile_size_8 = _get_mmap_tile_size(m, max_memory)
+    tile_size_8_extra = _get_mmap_tile_size(m, max_memory + 7 * nbytes_per_thread)
+
+    # The private buffers of the threads are taken out of the memory budget
+    assert tile_size_8 < tile_size_1
+    assert tile_size_8_extra == tile_size_1
+    assert _get_mmap_tile_size(m, 0) == m
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+@pytest.mark.parametrize("max_memory", max_memories)
+def test_mmap_stump_self_join(T_A, T_B, max_memory):
+    m = 3
+    zone = int(np.ceil(m / 4))
+    l = T_B.shape[0] - m + 1
+    ref_mp = naive.stump(T_B, m, exclusion_zone=zone)
+
+    P = np.empty((l, 3), dtype=np.float64)
+    I = np.empty((l, 3), dtype=np.int64)
+    mmap_stump(T_B, m, P, I, ignore_trivial=True, max_memory=max_memory)
+    ref_P = naive_left_right_P(T_B, m, I)
+
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(ref_P)
+    naive.replace_inf(P)
+    npt.assert_almost_equal(ref_mp[:, 0], P[:, 0])
+    npt.assert_almost_equal(ref_mp[:, 1:], I)
+    npt.assert_almost_equal(ref_P, P)
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+@pytest.mark.parametrize("max_memory", max_memories)
+def test_mmap_stump_A_B_join(T_A, T_B, max_memory):
+    m = 3
+    l = T_A.shape[0] - m + 1
+    ref_mp = naive.stump(T_A, m, T_B=T_B)
+
+    P = np.empty((l, 3), dtype=np.float64)
+    I = np.empty((l, 3), dtype=np.int64)
+    mmap_stump(T_A, m, P, I, T_B, ignore_trivial=False, max_memory=max_memory)
+
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(P)
+    npt.assert_almost_equal(ref_mp[:, 0], P[:, 0])
+    npt.assert_almost_equal(ref_mp[:, 1:], I)
+    npt.assert_almost_equal(np.zeros((l, 2)), P[:, 1:])
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+@pytest.mark.parametrize("substitute", substitution_values)
+@pytest.mark.parametrize("substitution_location", substitution_locations)
+def test_mmap_stump_nan_inf_self_join(T_A, T_B, substitute, substitution_location):
+    m = 3
+    zone = int(np.ceil(m / 4))
+    l = T_B.shape[0] - m + 1
+
+    T_B_sub = T_B.copy()
+    T_B_sub[substitution_location] = substitute
+    ref_mp = naive.stump(T_B_sub, m, exclusion_zone=zone)
+
+    P = np.empty((l, 3), dtype=np.float64)
+    I = np.empty((l, 3), dtype=np.int64)
+    mmap_stump(T_B_sub, m, P, I, max_memory=0)
+
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(P)
+    npt.assert_almost_equal(ref_mp[:, 0], P[:, 0])
+    npt.assert_almost_equal(ref_mp[:, 1:], I)
+
+
+@pytest.mark.parametrize("max_memory", max_memories)
+def test_mmap_stump_memmap_self_join(tmp_path, max_memory):
+    m = 8
+    zone = int(np.ceil(m / 4))
+    T = np.random.rand(256)
+    l = T.shape[0] - m + 1
+    ref_mp = naive.stump(T, m, exclusion_zone=zone)
+
+    T_fname = tmp_path / "T.npy"
+    np.save(T_fname, T)
+    T_mmap = np.load(T_fname, mmap_mode="r")
+    P = np.lib.format.open_memmap(
+        tmp_path / "P.npy", mode="w+", dtype=np.float64, shape=(l, 3)
+    )
+    I = np.lib.format.open_memmap(
+        tmp_path / "I.npy", mode="w+", dtype=np.int64, shape=(l, 3)
+    )
+    mmap_stump(T_mmap, m, P, I, max_memory=max_memory)
+    del P, I
+
+    comp_P = np.load(tmp_path / "P.npy")
+    comp_I = np.load(tmp_path / "I.npy")
+    ref_P = naive_left_right_P(T, m, comp_I)
+
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(ref_P)
+    naive.replace_inf(comp_P)
+    npt.assert_almost_equal(ref_mp[:, 0], comp_P[:, 0])
+    npt.assert_almost_equal(ref_mp[:, 1:], comp_I)
+    npt.assert_almost_equal(ref_P, comp_P)
+
+
+def test_mmap_stump_memmap_A_B_join(tmp_path):
+    m = 8
+    T_A = np.random.rand(64)
+    T_B = np.random.rand(256)
+    l = T_A.shape[0] - m + 1
+    ref_mp = naive.stump(T_A, m, T_B=T_B)
+
+    np.save(tmp_path / "T_A.npy", T_A)
+    np.save(tmp_path / "T_B.npy", T_B)
+    T_A_mmap = np.load(tmp_path / "T_A.npy", mmap_mode="r")
+    T_B_mmap = np.load(tmp_path / "T_B.npy", mmap_mode="r")
+    P = np.lib.format.open_memmap(
+        tmp_path / "P.npy", mode="w+", dtype=np.float64, shape=(l, 3)
+    )
+    I = np.lib.format.open_memmap(
+        tmp_path / "I.npy", mode="w+", dtype=np.int64, shape=(l, 3)
+    )
+    mmap_stump(T_A_mmap, m, P, I, T_B_mmap, ignore_trivial=False, max_memory=0)
+
+    naive.replace_inf(ref_mp)
+    npt.assert_almost_equal(ref_mp[:, 0], P[:, 0])
+    npt.assert_almost_equal(ref_mp[:, 1:], I)
@@ -2,7 +2,7 @@ import numpy as np
 import numpy.testing as npt
 import pytest
 
-from stumpy import core, motifs, match
+from stumpy import core, motifs, match, match_many, config
 
 import naive
 
@@ -186,6 +186,75 @@ def test_motifs_max_matches():
     npt.assert_almost_equal(left_profile_values, right_distance_values, decimal=4)
 
 
+def naive_motifs(T, P, m, max_distance, cutoff, max_matches, max_motifs):
+    excl_zone = int(np.ceil(m / 4))
+    P = P.copy()
+    motif_distances = []
+    motif_indices = []
+
+    candidate_idx = np.argmin(P)
+    while len(motif_indices) < max_motifs:
+        if not np.isfinite(P[candidate_idx]):
+            break
+        if P[candidate_idx] > cutoff or P[candidate_idx] > max_distance:
+            break
+
+        query_matches = match(
+            T[candidate_idx : candidate_idx + m],
+            T,
+            max_distance=max_distance,
+            query_idx=candidate_idx,
+            typed=True,
+        )
+        if len(query_matches.I) > 1:
+            motif_distances.append(query_matches.D[:max_matches])
+            motif_indices.append(query_matches.I[:max_matches])
+
+        for idx in query_matches.I:
+            naive.apply_exclusion_zone(P, idx, excl_zone, np.inf)
+
+        candidate_idx = np.argmin(P)
+
+    motif_distances = core._jagged_list_to_array(
+        motif_distances, fill_value=np.nan, dtype=np.float64
+    )
+    motif_indices = core._jagged_list_to_array(
+        motif_indices, fill_value=-1, dtype=np.int64
+    )
+
+    return motif_distances, motif_indices
+
+
+@pytest.mark.parametrize("max_memory", [0, 2**28])
+def test_motifs_many(max_memory):
+    T = np.random.rand(256)
+    T[100:110] = T[10:20] + np.random.uniform(-0.05, 0.05, 10)
+    T[200:210] = T[10:20] + np.random.uniform(-0.05, 0.05, 10)
+    m = 8
+    mp = naive.stump(T, m)
+    P = mp[:, 0].astype(np.float64)
+
+    max_memory_ref = config.STUMPY_MASS_BATCH_MAX_MEMORY
+    try:
+        config.STUMPY_MASS_BATCH_MAX_MEMORY = max_memory
+        for max_distance in [0.5, 2.0, np.inf]:
+            ref_distances, ref_indices = naive_motifs(
+                T, P, m, max_distance, np.inf, 5, 100
+            )
+            comp_distances, comp_indices = motifs(
+                T,
+                P,
+                max_distance=max_distance,
+                cutoff=np.inf,
+                max_matches=5,
+                max_motifs=100,
+            )
+            npt.assert_almost_equal(ref_distances, comp_distances)
+            npt.assert_almost_equal(ref_indices, comp_indices)
+    finally:
+        config.STUMPY_MASS_BATCH_MAX_MEMORY = max_memory_ref
+
+
 def test_naive_match_exclusion_zone():
     # The query appears as a perfect match at location 1 and as very close matches
     # (z-normalized distance of 0.05) at location 0, 5 and 9.
@@ -235,3 +304,124 @@ def test_match(Q, T):
     )
 
     npt.assert_almost_equal(left, right)
+
+
+@pytest.mark.parametrize("Q, T", test_data)
+def test_match_typed(Q, T):
+    m = Q.shape[0]
+    excl_zone = int(np.ceil(m / 4))
+    max_distance = 0.3
+
+    left = np.array(naive_match(Q, T, excl_zone, max_distance=max_distance))
+    left = left.reshape(-1, 2)
+    right = match(Q, T, max_distance=max_distance, typed=True)
+
+    assert right.D.dtype == np.float64
+    assert right.I.dtype == np.int64
+    npt.assert_almost_equal(left[:, 0], right.D)
+    npt.assert_almost_equal(left[:, 1], right.I)
+
+
+def test_match_typed_config():
+    Q = np.random.rand(5)
+    T = np.random.rand(64)
+
+    ref = match(Q, T, max_distance=np.inf, typed=False)
+    try:
+        config.STUMPY_TYPED_OUTPUT = True
+        comp = match(Q, T, max_distance=np.inf)
+    finally:
+        config.STUMPY_TYPED_OUTPUT = False
+
+    assert ref.dtype == object
+    npt.assert_almost_equal(ref[:, 0].astype(np.float64), comp.D)
+    npt.assert_almost_equal(ref[:, 1].astype(np.int64), comp.I)
+
+
+@pytest.mark.parametrize("Q, T", test_data)
+def test_match_many(Q, T):
+    m = Q.shape[0]
+    Qs = np.array([Q, T[:m], np.random.uniform(-1000, 1000, m)])
+
+    for max_distance in [0.3, np.inf, None]:
+        for max_matches in [None, 1, 2]:
+            ref = [
+                match(Q, T, max_distance=max_distance, max_matches=max_matches)
+                for Q in Qs
+            ]
+            comp = match_many(
+                Qs, T, max_distance=max_distance, max_matches=max_matches, max_memory=1
+            )
+            assert len(ref) == len(comp)
+            for left, right in zip(ref, comp):
+                npt.assert_almost_equal(left, right)
+
+
+def test_match_many_typed():
+    Qs = np.random.rand(3, 5)
+    T = np.random.rand(64)
+    T, M_T, Σ_T = core.preprocess(T, 5)
+
+    ref = [match(Q, T, max_distance=np.inf, typed=True) for Q in Qs]
+    comp = match_many(Qs, T, M_T, Σ_T, max_distance=np.inf, typed=True)
+    for left, right in zip(ref, comp):
+        assert right.D.dtype == np.float64
+        assert right.I.dtype == np.int64
+        npt.assert_almost_equal(left.D, right.D)
+        npt.assert_almost_equal(left.I, right.I)
+
+
+def test_match_many_lazy():
+    Qs = np.random.rand(3, 5)
+    T = np.random.rand(64)
+
+    for typed in [True, False]:
+        ref = match_many(Qs, T, max_distance=np.inf, max_memory=1, typed=typed)
+        comp = match_many(
+            Qs, T, max_distance=np.inf, max_memory=1, typed=typed, lazy=True
+        )
+        assert not isinstance(comp, list)
+        comp = list(comp)
+        assert len(ref) == len(comp)
+        for left, right in zip(ref, comp):
+            assert type(left) is type(right)
+            for a, b in zip(left, right):
+                npt.assert_almost_equal(a, b)
+
+
+def test_motifs_match_fft_cache(monkeypatch):
+    m = 1024
+    T = np.random.uniform(-1000, 1000, [2**15])
+    P = np.random.uniform(10.0, 20.0, [T.shape[0] - m + 1])
+    P[[0, 10_000]] = 5.0
+    Q = T[100 : 100 + m]
+
+    n_calls = [0]
+    rfft_blocks = core._rfft_blocks
+
+    def counted_rfft_blocks(*args):
+        n_calls[0] += 1
+        return rfft_blocks(*args)
+
+    max_bytes_ref = config.STUMPY_FFT_CACHE_MAX_BYTES
+    core._FFT_CACHE.clear()
+    try:
+        config.STUMPY_FFT_CACHE_MAX_BYTES = 0
+        ref_motifs = motifs(T, P, max_distance=np.inf, max_matches=3)
+        ref_match = match(Q, T, max_matches=3)
+    finally:
+        config.STUMPY_FFT_CACHE_MAX_BYTES = max_bytes_ref
+
+    core._FFT_CACHE.clear()
+    monkeypatch.setattr(core, "_rfft_blocks", counted_rfft_blocks)
+    comp_motifs = motifs(T, P, max_distance=np.inf, max_matches=3)
+    comp_match = match(Q, T, max_matches=3)
+    for _ in range(2):
+        match(Q, T, max_matches=3)
+
+    # The FFTs of `T` are computed only once and are shared by all calls
+    assert n_calls[0] == 1
+    npt.assert_almost_equal(ref_motifs, comp_motifs)
+    npt.assert_almost_equal(ref_match, comp_match)
+
+    core._FFT_CACHE.clear()
@@ -41,6 +41,24 @@ def test_mstumped(T, m, dask_cluster):
         npt.assert_almost_equal(ref_I, comp_I)
 
 
+@pytest.mark.filterwarnings("ignore:\\s+Port 8787 is already in use:UserWarning")
+@pytest.mark.parametrize("T, m", test_data)
+def test_mstumped_shared_memory(T, m, dask_cluster):
+    excl_zone = int(np.ceil(m / 4))
+    ref_P, ref_I = naive.mstump(T, m, excl_zone)
+
+    shared_memory_ref = config.STUMPY_DASK_SHARED_MEMORY
+    config.STUMPY_DASK_SHARED_MEMORY = True
+    try:
+        with Client(dask_cluster) as dask_client:
+            comp_P, comp_I = mstumped(dask_client, T, m)
+    finally:
+        config.STUMPY_DASK_SHARED_MEMORY = shared_memory_ref
+
+    npt.assert_almost_equal(ref_P, comp_P)
+    npt.assert_almost_equal(ref_I, comp_I)
+
+
 @pytest.mark.filterwarnings("ignore:\\s+Port 8787 is already in use:UserWarning")
 @pytest.mark.parametrize("T, m", test_data)
 def test_mstumped_include(T, m, dask_cluster):
@@ -328,6 +328,35 @@ def test_match(T, m):
     npt.assert_almost_equal(ref, comp)
 
 
+def test_mass_batch():
+    Qs = np.random.rand(3, 10)
+    T = np.random.rand(20)
+    ref = stumpy.core.mass_absolute_batch(Qs, T)
+    comp = stumpy.mass_batch(Qs, T, normalize=False)
+    npt.assert_almost_equal(ref, comp)
+
+
+def test_mass_batch_lazy():
+    Qs = np.random.rand(3, 10)
+    T = np.random.rand(20)
+    ref = stumpy.core.mass_absolute_batch(Qs, T)
+    comp = stumpy.mass_batch(Qs, T, normalize=False, lazy=True)
+    npt.assert_almost_equal(ref, np.array(list(comp)))
+
+
+@pytest.mark.parametrize("T, m", test_data)
+def test_match_many(T, m):
+    if T.ndim > 1:
+        T = T.copy()
+        T = T[0]
+
+    Qs = np.array([T[:m], T[-m:]])
+    ref = stumpy.aamp_match_many(Qs, T)
+    comp = stumpy.match_many(Qs, T, normalize=False)
+    for left, right in zip(ref, comp):
+        npt.assert_almost_equal(left, right)
+
+
 def test_snippets():
     T = np.random.rand(64)
     m = 10
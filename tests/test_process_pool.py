@@ -0,0 +1,155 @@
+import time
+
+import numpy as np
+import numpy.testing as npt
+from stumpy import (
+    ProcessPoolClient,
+    stumped,
+    aamped,
+    mstumped,
+    ostinatoed,
+    mpdisted,
+    stimp,
+    stimped,
+)
+from stumpy.core import _share_array, _run
+import pytest
+import naive
+
+
+@pytest.fixture(scope="module")
+def client():
+    with ProcessPoolClient(n_workers=2, threads_per_worker=1) as client:
+        yield client
+
+
+test_data = [
+    (
+        np.array([9, 8100, -60, 7], dtype=np.float64),
+        np.array([584, -11, 23, 79, 1001, 0, -19], dtype=np.float64),
+    ),
+    (
+        np.random.uniform(-1000, 1000, [8]).astype(np.float64),
+        np.random.uniform(-1000, 1000, [64]).astype(np.float64),
+    ),
+]
+
+
+def test_share_array():
+    for a in [np.random.rand(16), np.random.rand(4, 3), np.array([], dtype=np.int64)]:
+        shm, handle = _share_array(a)
+        try:
+            comp = _run(np.copy, (handle,), {})
+            assert comp.dtype == a.dtype
+            npt.assert_almost_equal(a, comp)
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+def test_process_pool_client(client):
+    a = np.random.rand(16)
+    a_future = client.scatter(a, broadcast=True, hash=False)
+    assert client.scatter(3, broadcast=True, hash=False) == 3
+    assert len(client.ncores()) == 2
+
+    future = client.submit(np.multiply, a_future, 2.0)
+    future = client.submit(np.add, future, a_future)
+    comp = client.gather([future])[0]
+    npt.assert_almost_equal(3.0 * a, comp)
+
+    client.cancel(future)
+    client.cancel(a_future)
+    assert len(client._shms) == 0
+
+
+def delayed_identity(x, seconds):
+    time.sleep(seconds)
+    return x
+
+
+def test_process_pool_client_submit_does_not_block(client):
+    future = client.submit(delayed_identity, 1.0, 1.0)
+    start = time.time()
+    future = client.submit(np.add, future, 1.0)
+    future = client.submit(delayed_identity, x=future, seconds=0.0)
+    assert time.time() - start < 0.5
+    assert client.gather([future])[0] == 2.0
+
+    future = client.submit(np.sqrt, "a")
+    future = client.submit(np.add, future, 1.0)
+    with pytest.raises(TypeError):
+        client.gather([future])
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_process_pool_stumped_self_join(T_A, T_B, client):
+    m = 3
+    zone = int(np.ceil(m / 4))
+    ref_mp = naive.stump(T_B, m, exclusion_zone=zone)
+    comp_mp = stumped(client, T_B, m, ignore_trivial=True)
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(comp_mp)
+    npt.assert_almost_equal(ref_mp, comp_mp)
+    assert len(client._shms) == 0
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_process_pool_stumped_A_B_join(T_A, T_B, client):
+    m = 3
+    ref_mp = naive.stump(T_A, m, T_B=T_B)
+    comp_mp = stumped(client, T_A, m, T_B, ignore_trivial=False)
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(comp_mp)
+    npt.assert_almost_equal(ref_mp, comp_mp)
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_process_pool_aamped_self_join(T_A, T_B, client):
+    m = 3
+    for p in [1.0, 2.0]:
+        ref_mp = naive.aamp(T_B, m, p=p)
+        comp_mp = aamped(client, T_B, m, p=p)
+        naive.replace_inf(ref_mp)
+        naive.replace_inf(comp_mp)
+        npt.assert_almost_equal(ref_mp, comp_mp)
+
+
+def test_process_pool_mstumped(client):
+    T = np.random.uniform(-1000, 1000, [3, 64])
+    m = 5
+    excl_zone = int(np.ceil(m / 4))
+    ref_P, ref_I = naive.mstump(T, m, excl_zone)
+    comp_P, comp_I = mstumped(client, T, m)
+    npt.assert_almost_equal(ref_P, comp_P)
+    npt.assert_almost_equal(ref_I, comp_I)
+
+
+def test_process_pool_ostinatoed(client):
+    Ts = [np.random.rand(n) for n in [64, 128, 32]]
+    m = 8
+    ref_radius, ref_Ts_idx, ref_subseq_idx = naive.ostinato(Ts, m)
+    comp_radius, comp_Ts_idx, comp_subseq_idx = ostinatoed(client, Ts, m)
+    npt.assert_almost_equal(ref_radius, comp_radius)
+    npt.assert_almost_equal(ref_Ts_idx, comp_Ts_idx)
+    npt.assert_almost_equal(ref_subseq_idx, comp_subseq_idx)
+
+
+def test_process_pool_mpdisted(client):
+    T_A = np.random.uniform(-1000, 1000, [64])
+    T_B = np.random.uniform(-1000, 1000, [32])
+    m = 5
+    ref_mpdist = naive.mpdist(T_A, T_B, m)
+    comp_mpdist = mpdisted(client, T_A, T_B, m)
+    npt.assert_almost_equal(ref_mpdist, comp_mpdist)
+
+
+def test_process_pool_stimped(client):
+    T = np.random.uniform(-1000, 1000, [64])
+    ref_pan = stimp(T, min_m=3, max_m=5, percentage=1.0)
+    comp_pan = stimped(client, T, min_m=3, max_m=5)
+    for i in range(3):
+        ref_pan.update()
+        comp_pan.update()
+
+    npt.assert_almost_equal(ref_pan.PAN_, comp_pan.PAN_)
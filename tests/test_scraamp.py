@@ -723,3 +723,12 @@ def test_scraamp_nan_zero_mean_self_join(percentages):
         npt.assert_almost_equal(ref_I, comp_I)
         npt.assert_almost_equal(ref_left_I, comp_left_I)
         npt.assert_almost_equal(ref_right_I, comp_right_I)
+
+
+def test_scraamp_chebyshev():
+    T = np.random.rand(64)
+    with pytest.raises(ValueError):
+        scraamp(T, 8, p=np.inf)
+
+    with pytest.raises(ValueError):
+        prescraamp(T, 8, p=np.inf)
@@ -1,6 +1,7 @@
 import numpy as np
 import numpy.testing as npt
-from stumpy import stimp, stimped
+from stumpy import stimp, stimped, stump, scrump, config
+from stumpy.stimp import _pan
 
 from dask.distributed import Client, LocalCluster
 import pytest
@@ -182,6 +183,120 @@ def test_stimp_100_percent(T):
     npt.assert_almost_equal(ref_pan, cmp_pan)
 
 
+@pytest.mark.parametrize("percentage", [0.5, 1.0])
+def test_stimp_does_not_change_stump(percentage):
+    # A constant run within a time series with a large offset where the sliding
+    # standard deviation of `stimp` differs from that of `core.compute_mean_std`
+    T = np.random.uniform(-1000, 1000, [64]) + 1e6
+    T[20:40] = 1e6
+    m = 10
+    seed = np.random.randint(100000)
+
+    np.random.seed(seed)
+    ref_mp = stump(T, m)
+    ref_approx = scrump(T, m, percentage=percentage)
+    ref_approx.update()
+
+    pan = stimp(T, min_m=m, max_m=m + 5, step=5, percentage=percentage)
+    for i in range(pan.M_.shape[0]):
+        pan.update()
+
+    np.random.seed(seed)
+    comp_mp = stump(T, m)
+    comp_approx = scrump(T, m, percentage=percentage)
+    comp_approx.update()
+
+    npt.assert_equal(ref_mp, comp_mp)
+    npt.assert_equal(ref_approx.P_, comp_approx.P_)
+    npt.assert_equal(ref_approx.I_, comp_approx.I_)
+
+
+@pytest.mark.parametrize("T", T)
+def test_stimp_100_percent_nan_inf(T):
+    T = T.copy()
+    T[1] = np.nan
+    T[-2] = np.inf
+    min_m = 3
+    n = T.shape[0] - min_m + 1
+
+    pan = stimp(T, min_m=min_m, max_m=None, step=1, percentage=1.0)
+
+    for i in range(n):
+        pan.update()
+
+    ref_PAN = np.full((pan.M_.shape[0], T.shape[0]), fill_value=np.inf)
+
+    for idx, m in enumerate(pan.M_[:n]):
+        zone = int(np.ceil(m / 4))
+        ref_mp = naive.stump(T, m, T_B=None, exclusion_zone=zone)
+        ref_PAN[pan._bfs_indices[idx], : ref_mp.shape[0]] = ref_mp[:, 0]
+
+    cmp_PAN = pan._PAN
+
+    naive.replace_inf(ref_PAN)
+    naive.replace_inf(cmp_PAN)
+
+    npt.assert_almost_equal(ref_PAN, cmp_PAN)
+
+
+@pytest.mark.parametrize("T", T)
+@pytest.mark.parametrize("max_memory", [0, 2**28])
+def test_stimp_100_percent_band_size(T, max_memory):
+    T = T.copy()
+    T[2:5] = 7.0
+    min_m = 3
+    n = T.shape[0] - min_m + 1
+
+    band_size_ref = config.STUMPY_STIMP_BAND_SIZE
+    max_memory_ref = config.STUMPY_STIMP_BAND_MAX_MEMORY
+    try:
+        config.STUMPY_STIMP_BAND_SIZE = 4
+        config.STUMPY_STIMP_BAND_MAX_MEMORY = max_memory
+        pan = stimp(T, min_m=min_m, max_m=None, step=2, percentage=1.0)
+
+        for i in range(n):
+            pan.update()
+    finally:
+        config.STUMPY_STIMP_BAND_SIZE = band_size_ref
+        config.STUMPY_STIMP_BAND_MAX_MEMORY = max_memory_ref
+
+    ref_PAN = np.full((pan.M_.shape[0], T.shape[0]), fill_value=np.inf)
+
+    for idx, m in enumerate(pan.M_[:n]):
+        zone = int(np.ceil(m / 4))
+        ref_mp = naive.stump(T, m, T_B=None, exclusion_zone=zone)
+        ref_PAN[pan._bfs_indices[idx], : ref_mp.shape[0]] = ref_mp[:, 0]
+
+    cmp_PAN = pan._PAN
+
+    naive.replace_inf(ref_PAN)
+    naive.replace_inf(cmp_PAN)
+
+    npt.assert_almost_equal(ref_PAN, cmp_PAN)
+
+
+@pytest.mark.parametrize("ms", [[3, 4, 5, 6], [4, 7, 11], [9]])
+def test_pan(ms):
+    # Long enough for the upper triangle to be split into several tiles
+    T = np.random.uniform(-1000, 1000, [512])
+    T[100] = np.nan
+    T[300:330] = 7.0
+    ms = np.array(ms, dtype=np.int64)
+
+    comp_P = _pan(T, ms)
+    assert comp_P.shape == (ms.shape[0], T.shape[0])
+
+    for i, m in enumerate(ms):
+        zone = int(np.ceil(m / 4))
+        ref_P = np.full(T.shape[0], np.inf)
+        ref_P[: T.shape[0] - m + 1] = naive.stump(T, m, exclusion_zone=zone)[:, 0]
+
+        naive.replace_inf(ref_P)
+        naive.replace_inf(comp_P[i])
+
+        npt.assert_almost_equal(ref_P, comp_P[i])
+
+
 @pytest.mark.filterwarnings("ignore:numpy.dtype size changed")
 @pytest.mark.filterwarnings("ignore:numpy.ufunc size changed")
 @pytest.mark.filterwarnings("ignore:numpy.ndarray size changed")
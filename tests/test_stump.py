@@ -240,3 +240,132 @@ def test_stump_nan_zero_mean_self_join():
     naive.replace_inf(ref_mp)
     naive.replace_inf(comp_mp)
     npt.assert_almost_equal(ref_mp, comp_mp)
+
+
+def test_stump_self_join_multiple_tiles():
+    T = np.random.uniform(-1000, 1000, [config.STUMPY_DIAGONAL_TILE_HEIGHT * 2 + 100])
+    T[config.STUMPY_DIAGONAL_TILE_HEIGHT + 5] = np.nan
+    m = 20
+    zone = int(np.ceil(m / 4))
+    ref_mp = naive.stump(T, m, exclusion_zone=zone)
+    comp_mp = stump(T, m, ignore_trivial=True)
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(comp_mp)
+    npt.assert_almost_equal(ref_mp, comp_mp)
+
+
+def test_stump_A_B_join_multiple_tiles():
+    T_A = np.random.uniform(-1000, 1000, [config.STUMPY_DIAGONAL_TILE_HEIGHT + 300])
+    T_B = np.random.uniform(-1000, 1000, [config.STUMPY_DIAGONAL_TILE_HEIGHT * 2])
+    m = 20
+    ref_mp = naive.stump(T_A, m, T_B=T_B)
+    comp_mp = stump(T_A, m, T_B, ignore_trivial=False)
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(comp_mp)
+    npt.assert_almost_equal(ref_mp, comp_mp)
+
+
+def test_stump_bad_dtype():
+    with pytest.raises(ValueError):
+        stump(np.random.rand(10), 5, dtype=np.int64)
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_stump_float32_self_join(T_A, T_B):
+    m = 3
+    zone = int(np.ceil(m / 4))
+    ref_mp = naive.stump(T_B, m, exclusion_zone=zone)
+    comp_mp = stump(T_B, m, ignore_trivial=True, dtype=np.float32)
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(comp_mp)
+    # The deviation of the distances is bounded by the error in the (single
+    # precision) Pearson correlations
+    tol = np.sqrt(2 * m * 1e-5)
+    npt.assert_allclose(
+        ref_mp[:, 0].astype(np.float64), comp_mp[:, 0].astype(np.float64), atol=tol
+    )
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_stump_float32_A_B_join(T_A, T_B):
+    m = 3
+    ref_mp = naive.stump(T_A, m, T_B=T_B)
+    comp_mp = stump(T_A, m, T_B, ignore_trivial=False, dtype=np.float32)
+    naive.replace_inf(ref_mp)
+    naive.replace_inf(comp_mp)
+    # The deviation of the distances is bounded by the error in the (single
+    # precision) Pearson correlations
+    tol = np.sqrt(2 * m * 1e-5)
+    npt.assert_allclose(
+        ref_mp[:, 0].astype(np.float64), comp_mp[:, 0].astype(np.float64), atol=tol
+    )
+
+
+def test_stump_float32_self_join_multiple_tiles():
+    T = np.cumsum(np.random.normal(size=config.STUMPY_DIAGONAL_TILE_HEIGHT * 3))
+    m = 50
+    zone = int(np.ceil(m / 4))
+    ref_mp = naive.stump(T, m, exclusion_zone=zone)
+    comp_mp = stump(T, m, ignore_trivial=True, dtype=np.float32)
+
+    # The deviation of the distances is bounded by the error in the (single
+    # precision) Pearson correlations
+    tol = np.sqrt(2 * m * 1e-5)
+    ref_P = ref_mp[:, 0].astype(np.float64)
+    comp_P = comp_mp[:, 0].astype(np.float64)
+    npt.assert_array_less(np.abs(ref_P - comp_P), tol)
+
+    # Indices only differ for near-ties
+    for i in np.flatnonzero(ref_mp[:, 1] != comp_mp[:, 1]):
+        D = naive.distance_profile(T[i : i + m], T, m)
+        assert abs(D[comp_mp[i, 1]] - ref_P[i]) < tol
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_stump_typed_self_join(T_A, T_B):
+    m = 3
+    zone = int(np.ceil(m / 4))
+    ref_mp = naive.stump(T_B, m, exclusion_zone=zone)
+    comp_mp = stump(T_B, m, ignore_trivial=True, typed=True)
+    ref_I = ref_mp[:, 1:].astype(np.int64)
+    ref_P = naive.indexed_P(T_B, m, ref_I)
+
+    assert comp_mp.P.dtype == np.float64
+    assert comp_mp.I.dtype == np.int64
+    npt.assert_almost_equal(ref_mp[:, 0].astype(np.float64), comp_mp.P)
+    npt.assert_almost_equal(ref_I[:, 0], comp_mp.I)
+    npt.assert_almost_equal(ref_I[:, 1], comp_mp.left_I)
+    npt.assert_almost_equal(ref_I[:, 2], comp_mp.right_I)
+    npt.assert_almost_equal(ref_P[:, 1], comp_mp.left_P)
+    npt.assert_almost_equal(ref_P[:, 2], comp_mp.right_P)
+
+
+@pytest.mark.parametrize("T_A, T_B", test_data)
+def test_stump_typed_A_B_join(T_A, T_B):
+    m = 3
+    ref_mp = naive.stump(T_A, m, T_B=T_B)
+    comp_mp = stump(T_A, m, T_B, ignore_trivial=False, typed=True)
+
+    npt.assert_almost_equal(ref_mp[:, 0].astype(np.float64), comp_mp.P)
+    npt.assert_almost_equal(ref_mp[:, 1].astype(np.int64), comp_mp.I)
+    npt.assert_almost_equal(np.full(comp_mp.P.shape, -1), comp_mp.left_I)
+    npt.assert_almost_equal(np.full(comp_mp.P.shape, -1), comp_mp.right_I)
+    assert np.all(np.isinf(comp_mp.left_P))
+    assert np.all(np.isinf(comp_mp.right_P))
+
+
+def test_stump_typed_config():
+    T = np.random.rand(64)
+    m = 8
+
+    ref_mp = stump(T, m, typed=False)
+    try:
+        config.STUMPY_TYPED_OUTPUT = True
+        comp_mp = stump(T, m)
+    finally:
+        config.STUMPY_TYPED_OUTPUT = False
+
+    assert ref_mp.dtype == object
+    npt.assert_almost_equal(ref_mp[:, 0].astype(np.float64), comp_mp.P)
+    npt.assert_almost_equal(ref_mp[:, 1].astype(np.int64), comp_mp.I)
+    assert stump(T, m).dtype == object